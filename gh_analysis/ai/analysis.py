@@ -1,13 +1,26 @@
 """Core analysis logic for AI processing."""
 
+import base64
 import json
 from typing import Any
 
 from pydantic_ai import Agent
 from pydantic_ai.messages import BinaryContent, ImageUrl
+from pydantic_ai.usage import UsageLimits
 
 from .image_utils import load_downloaded_images
 
+# Compact encoder for the current-labels list, shared across prompts
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# Static prompt instructions used by format_issue_prompt
+_NO_IMAGES_INSTRUCTION = """
+
+**NO IMAGES PROVIDED:** This issue contains no images to analyze.
+IMPORTANT: Leave images_analyzed as an empty array and image_impact as an empty
+string since no images were provided.
+"""
+
 
 def prepare_issue_for_troubleshooting(
     issue_data: dict[str, Any], include_images: bool = True
@@ -21,8 +34,10 @@ def prepare_issue_for_troubleshooting(
     Returns:
         List of message parts for PydanticAI troubleshooting agent
     """
-    # Load images if requested
-    image_contents = load_downloaded_images(issue_data, include_images)
+    # Load images if requested; attachments are not touched otherwise
+    image_contents = (
+        load_downloaded_images(issue_data, include_images) if include_images else []
+    )
 
     # Build text prompt using troubleshooting formatter
     text_prompt = format_troubleshooting_prompt(issue_data, len(image_contents))
@@ -42,8 +57,6 @@ def prepare_issue_for_troubleshooting(
             # Legacy support for data URLs
             image_url = img_content["image_url"]["url"]
             if image_url.startswith("data:"):
-                import base64
-
                 header, data = image_url.split(",", 1)
                 media_type = header.split(";")[0].split(":")[1]
                 img_bytes = base64.b64decode(data)
@@ -66,11 +79,26 @@ def prepare_issue_for_analysis(
     Returns:
         List of message parts for PydanticAI agent
     """
-    # Load images if requested
-    image_contents = load_downloaded_images(issue_data, include_images)
+    _, message_parts = _prepare_issue_parts(issue_data, include_images)
+    return message_parts
+
+
+def _prepare_issue_parts(
+    issue_data: dict[str, Any], include_images: bool
+) -> tuple[str, list[str | ImageUrl | BinaryContent]]:
+    """Build the analysis message parts along with the issue prompt context.
+
+    The context is returned so callers can render a text-only prompt later
+    without formatting the issue again.
+    """
+    # Load images if requested; attachments are not touched otherwise
+    image_contents = (
+        load_downloaded_images(issue_data, include_images) if include_images else []
+    )
 
     # Build text prompt
-    text_prompt = format_issue_prompt(issue_data, len(image_contents))
+    context = _format_issue_context(issue_data)
+    text_prompt = _render_issue_prompt(context, len(image_contents))
 
     # Build message parts
     message_parts: list[str | ImageUrl | BinaryContent] = [text_prompt]
@@ -87,8 +115,6 @@ def prepare_issue_for_analysis(
             # Legacy support for data URLs
             image_url = img_content["image_url"]["url"]
             if image_url.startswith("data:"):
-                import base64
-
                 header, data = image_url.split(",", 1)
                 media_type = header.split(";")[0].split(":")[1]
                 img_bytes = base64.b64decode(data)
@@ -98,7 +124,7 @@ def prepare_issue_for_analysis(
             else:
                 message_parts.append(ImageUrl(url=image_url))
 
-    return message_parts
+    return context, message_parts
 
 
 def format_troubleshooting_prompt(
@@ -142,41 +168,19 @@ def format_issue_prompt(issue_data: dict[str, Any], image_count: int = 0) -> str
     Returns:
         Formatted prompt string
     """
-    issue = issue_data["issue"]
+    return _render_issue_prompt(_format_issue_context(issue_data), image_count)
 
-    # Include all comments with full content
-    comment_text = ""
-    if issue.get("comments"):
-        all_comments = issue.get("comments", [])
-        comment_entries = []
-        for comment in all_comments:
-            user = comment.get("user", {}).get("login", "Unknown")
-            body = comment.get("body", "").replace("\n", " ").strip()
-            comment_entries.append(f"{user}: {body}")
-        comment_text = " | ".join(comment_entries)
-
-    # Add explicit image context instructions
-    if image_count > 0:
-        image_instruction = f"""
 
-**IMAGES PROVIDED:** This issue contains {image_count} image(s) that you should analyze.
-When analyzing the images, look for:
-- UI screenshots showing specific product interfaces
-- Error messages or logs that indicate which product is failing
-- File browser views, admin consoles, or diagnostic outputs
-- Any visual indicators of the affected product
-
-IMPORTANT: Fill in the images_analyzed array with descriptions of what each image
-shows and how it influences your classification. Fill in image_impact with how
-the images affected your decision.
-"""
-    else:
-        image_instruction = """
+def _format_issue_context(issue_data: dict[str, Any]) -> str:
+    """Format the issue-specific part of the product labeling prompt."""
+    issue = issue_data["issue"]
 
-**NO IMAGES PROVIDED:** This issue contains no images to analyze.
-IMPORTANT: Leave images_analyzed as an empty array and image_impact as an empty
-string since no images were provided.
-"""
+    # Include all comments with full content
+    comment_text = " | ".join(
+        f"{comment.get('user', {}).get('login', 'Unknown')}: "
+        f"{comment.get('body', '').replace('\n', ' ').strip()}"
+        for comment in issue.get("comments") or ()
+    )
 
     return f"""
 Analyze this GitHub issue for product labeling:
@@ -186,20 +190,42 @@ Analyze this GitHub issue for product labeling:
 **Body:** {issue.get("body", "No Body")}
 
 **Current Labels:** {
-        json.dumps(
+        _COMPACT_ENCODER.encode(
             [
                 label.get("name", "")
                 for label in issue.get("labels", [])
                 if label.get("name", "").startswith("product::")
-            ],
-            separators=(",", ":"),
+            ]
         )
     }
 
 **Repository:** {issue_data["org"]}/{issue_data["repo"]}
 
 **Comments:** {comment_text or "No comments"}
-{image_instruction}
+"""
+
+
+def _render_issue_prompt(context: str, image_count: int) -> str:
+    """Complete a formatted issue context with image instructions."""
+    # Add explicit image context instructions
+    if image_count > 0:
+        image_instruction = f"""
+
+**IMAGES PROVIDED:** This issue contains {image_count} image(s) that you should analyze.
+When analyzing the images, look for:
+- UI screenshots showing specific product interfaces
+- Error messages or logs that indicate which product is failing
+- File browser views, admin consoles, or diagnostic outputs
+- Any visual indicators of the affected product
+
+IMPORTANT: Fill in the images_analyzed array with descriptions of what each image
+shows and how it influences your classification. Fill in image_impact with how
+the images affected your decision.
+"""
+    else:
+        image_instruction = _NO_IMAGES_INSTRUCTION
+
+    return f"""{context}{image_instruction}
 
 Recommend the most appropriate product label(s) based on the issue content.
 """
@@ -238,8 +264,6 @@ async def analyze_troubleshooting_issue(
             kwargs["model_settings"] = model_settings
 
         # Set higher usage limits for complex troubleshooting analysis
-        from pydantic_ai.usage import UsageLimits
-
         kwargs["usage_limits"] = UsageLimits(request_limit=150)
 
         result = await agent.run(message_parts, **kwargs)
@@ -283,7 +307,7 @@ async def analyze_issue(
     Raises:
         Exception: If analysis fails
     """
-    message_parts = prepare_issue_for_analysis(issue_data, include_images)
+    context, message_parts = _prepare_issue_parts(issue_data, include_images)
 
     try:
         # Run with optional overrides
@@ -299,7 +323,8 @@ async def analyze_issue(
         # If multimodal fails and we have images, try text-only as fallback
         if include_images and len(message_parts) > 1:
             print(f"Multimodal processing failed, falling back to text-only: {e}")
-            fallback_prompt = format_issue_prompt(issue_data, 0)
+            # Reuse the already formatted issue context
+            fallback_prompt = _render_issue_prompt(context, 0)
             result = await agent.run(fallback_prompt, **kwargs)
             return result.output
         else:
@@ -1,12 +1,21 @@
 """Core batch job management for AI processing."""
 
 import json
+import os
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import pydantic_core
 from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+)
 
 from .config_compat import AIModelConfig, build_ai_config
 from .models import (
@@ -53,6 +62,24 @@ class BatchManager:
         Returns:
             List of issue data dictionaries
         """
+        return self.load_issues(self.find_issue_files(org, repo, issue_number))
+
+    def find_issue_files(
+        self,
+        org: str | None = None,
+        repo: str | None = None,
+        issue_number: int | None = None,
+    ) -> list[Path]:
+        """Find the paths of issue files matching the criteria without loading them.
+
+        Args:
+            org: GitHub organization name (optional)
+            repo: GitHub repository name (optional)
+            issue_number: Specific issue number (optional)
+
+        Returns:
+            List of issue file paths
+        """
         # Validate argument combinations first
         if issue_number and (not org or not repo):
             raise ValueError("org and repo are required when specifying issue_number")
@@ -61,35 +88,51 @@ class BatchManager:
         if not data_dir.exists():
             return []
 
-        issue_files = []
-
         if issue_number:
             # Find specific issue file
 
             expected_filename = f"{org}_{repo}_issue_{issue_number}.json"
             expected_path = data_dir / expected_filename
 
-            if expected_path.exists():
-                issue_files = [expected_path]
-        elif org and repo:
+            return [expected_path] if os.path.isfile(expected_path) else []
+
+        if org and repo:
             # Process all issues for specific org/repo
-            pattern = f"{org}_{repo}_issue_*.json"
-            issue_files = list(data_dir.glob(pattern))
+            prefix = f"{org}_{repo}_issue_"
         elif org:
             # Process all issues for specific org (across all repos)
-            pattern = f"{org}_*_issue_*.json"
-            issue_files = list(data_dir.glob(pattern))
+            prefix = f"{org}_"
         else:
             # Process all issues
-            issue_files = list(data_dir.glob("*_issue_*.json"))
+            prefix = ""
+
+        # Filter on entry names as the directory is read rather than
+        # matching a glob pattern against every path
+        with os.scandir(data_dir) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith(prefix)
+                and entry.name.endswith(".json")
+                and "_issue_" in entry.name
+            ]
+
+    def load_issues(self, issue_files: list[Path]) -> list[dict[str, Any]]:
+        """Load issue data from issue files, skipping files that fail to parse.
+
+        Args:
+            issue_files: Paths of issue JSON files
 
-        # Load and return issue data
+        Returns:
+            List of issue data dictionaries
+        """
+        # Each file is read in one call and parsed by pydantic-core's
+        # native parser
         issues = []
         for file_path in issue_files:
             try:
-                with open(file_path, encoding="utf-8") as f:
-                    issue_data = json.load(f)
-                    issues.append(issue_data)
+                issue_data = pydantic_core.from_json(file_path.read_bytes())
+                issues.append(issue_data)
             except Exception as e:
                 console.print(
                     f"[yellow]Warning: Failed to load {file_path}: {e}[/yellow]"
@@ -333,106 +376,120 @@ class BatchManager:
         failed_items = 0
         errors = []
 
-        for result in results:
-            custom_id = result["custom_id"]
-
-            if result.get("error"):
-                # Handle failed item
-                failed_items += 1
-                error = result["error"]
-                errors.append(
-                    BatchJobError(
-                        custom_id=custom_id,
-                        error_code=error.get("code", "unknown"),
-                        error_message=error.get("message", "Processing failed"),
-                    )
-                )
-                continue
+        # Every result in a collection shares one timestamp
+        collected_at = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+
+        # A single progress bar replaces a status line per saved result;
+        # failures are still reported as they happen
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+        )
+        with progress:
+            for result in progress.track(results, description="Saving results"):
+                custom_id = result["custom_id"]
 
-            # Process successful result
-            response = result.get("response", {})
-            # OpenAI Batch API wraps the response in a 'body' field
-            body = response.get("body", response)
-            choices = body.get("choices", [])
-
-            if not choices:
-                failed_items += 1
-                errors.append(
-                    BatchJobError(
-                        custom_id=custom_id,
-                        error_code="no_choices",
-                        error_message="No response choices in result",
+                if result.get("error"):
+                    # Handle failed item
+                    failed_items += 1
+                    error = result["error"]
+                    errors.append(
+                        BatchJobError(
+                            custom_id=custom_id,
+                            error_code=error.get("code", "unknown"),
+                            error_message=error.get("message", "Processing failed"),
+                        )
                     )
-                )
-                continue
+                    continue
 
-            try:
-                # Parse the AI response
-                content = choices[0]["message"]["content"]
-                analysis = json.loads(content)
+                # Process successful result
+                response = result.get("response", {})
+                # OpenAI Batch API wraps the response in a 'body' field
+                body = response.get("body", response)
+                choices = body.get("choices", [])
 
-                # Extract org, repo, issue number from custom_id
-                parts = custom_id.split("_")
-                if len(parts) < 4 or parts[-2] != "issue":
+                if not choices:
                     failed_items += 1
                     errors.append(
                         BatchJobError(
                             custom_id=custom_id,
-                            error_code="invalid_custom_id",
-                            error_message=f"Invalid custom_id format: {custom_id}",
+                            error_code="no_choices",
+                            error_message="No response choices in result",
                         )
                     )
                     continue
 
-                issue_number = parts[-1]
-                repo = "_".join(parts[1:-2])
-                org = parts[0]
+                try:
+                    # Parse the AI response
+                    content = choices[0]["message"]["content"]
+                    analysis = pydantic_core.from_json(content)
 
-                # Create result file
-                result_file = results_dir / (
-                    f"{custom_id}_{batch_job.processor_type}.json"
-                )
+                    # Extract org, repo, issue number from custom_id
+                    parts = custom_id.split("_")
+                    if len(parts) < 4 or parts[-2] != "issue":
+                        failed_items += 1
+                        errors.append(
+                            BatchJobError(
+                                custom_id=custom_id,
+                                error_code="invalid_custom_id",
+                                error_message=f"Invalid custom_id format: {custom_id}",
+                            )
+                        )
+                        continue
 
-                # Construct file_path to match regular processing format
-                file_path = f"data/issues/{org}_{repo}_issue_{issue_number}.json"
-
-                result_data = {
-                    "issue_reference": {
-                        "file_path": file_path,
-                        "batch_job_id": job_id,
-                        "org": org,
-                        "repo": repo,
-                        "issue_number": int(issue_number),
-                    },
-                    "processor": {
-                        "name": batch_job.processor_type,
-                        "version": "2.1.0",
-                        "model": model_config.model_name,
-                        "include_images": model_config.include_images,
-                        "batch_processing": True,
-                        "timestamp": datetime.utcnow().isoformat() + "Z",
-                    },
-                    "analysis": analysis,
-                }
-
-                with open(result_file, "w", encoding="utf-8") as f:
-                    json.dump(result_data, f, indent=2)
-
-                successful_items += 1
-                console.print(f"[green]✓ Saved result: {result_file.name}[/green]")
+                    issue_number = parts[-1]
+                    repo = "_".join(parts[1:-2])
+                    org = parts[0]
 
-            except Exception as e:
-                failed_items += 1
-                errors.append(
-                    BatchJobError(
-                        custom_id=custom_id,
-                        error_code="result_processing_failed",
-                        error_message=f"Failed to process result: {e}",
+                    # Create result file
+                    result_file = results_dir / (
+                        f"{custom_id}_{batch_job.processor_type}.json"
+                    )
+
+                    # Construct file_path to match regular processing format
+                    file_path = f"data/issues/{org}_{repo}_issue_{issue_number}.json"
+
+                    result_data = {
+                        "issue_reference": {
+                            "file_path": file_path,
+                            "batch_job_id": job_id,
+                            "org": org,
+                            "repo": repo,
+                            "issue_number": int(issue_number),
+                        },
+                        "processor": {
+                            "name": batch_job.processor_type,
+                            "version": "2.1.0",
+                            "model": model_config.model_name,
+                            "include_images": model_config.include_images,
+                            "batch_processing": True,
+                            "timestamp": collected_at,
+                        },
+                        "analysis": analysis,
+                    }
+
+                    # Encode natively up front so the file is written in one call
+                    result_json = pydantic_core.to_json(result_data, indent=2)
+                    with open(result_file, "wb") as f:
+                        f.write(result_json)
+
+                    successful_items += 1
+
+                except Exception as e:
+                    failed_items += 1
+                    errors.append(
+                        BatchJobError(
+                            custom_id=custom_id,
+                            error_code="result_processing_failed",
+                            error_message=f"Failed to process result: {e}",
+                        )
+                    )
+                    console.print(
+                        f"[red]✗ Failed to process result for {custom_id}: {e}[/red]"
                     )
-                )
-                console.print(
-                    f"[red]✗ Failed to process result for {custom_id}: {e}[/red]"
-                )
 
         # Update batch job with final counts
         batch_job.processed_items = successful_items
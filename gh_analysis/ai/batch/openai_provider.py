@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 import httpx
+import pydantic_core
 from rich.console import Console
 
 from ..prompts import PRODUCT_LABELING_PROMPT
@@ -14,6 +15,25 @@ from .config_compat import AIModelConfig, build_provider_specific_settings
 
 console = Console()
 
+# Shared compact encoder for the per-issue JSONL lines and label lists;
+# json.dumps would build a new encoder on every call with these options
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# Static prompt instructions used by _format_issue_prompt
+_NO_IMAGES_INSTRUCTION = """
+
+**NO IMAGES PROVIDED:** This issue contains no images to analyze.
+IMPORTANT: Leave images_analyzed as an empty array and image_impact as an empty
+string since no images were provided.
+"""
+
+_IMAGES_DISABLED_INSTRUCTION = """
+
+**NO IMAGES PROVIDED:** Image analysis is disabled for this batch.
+IMPORTANT: Leave images_analyzed as an empty array and image_impact as an empty
+string since image processing is disabled.
+"""
+
 
 class OpenAIBatchProvider:
     """OpenAI Batch API implementation for cost-effective processing."""
@@ -146,7 +166,7 @@ class OpenAIBatchProvider:
                     "body": request_body,
                 }
 
-                f.write(json.dumps(jsonl_entry, separators=(",", ":")) + "\n")
+                f.write(_COMPACT_ENCODER.encode(jsonl_entry) + "\n")
 
         console.print(f"Created JSONL file with {len(issues)} requests: {output_path}")
         return output_path
@@ -159,15 +179,10 @@ class OpenAIBatchProvider:
         issue = issue_data["issue"]
 
         # Include all comments with full content
-        comment_text = ""
-        if issue.get("comments"):
-            all_comments = issue["comments"]
-            comment_entries = []
-            for comment in all_comments:
-                user = comment["user"]["login"]
-                body = comment["body"].replace("\n", " ").strip()
-                comment_entries.append(f"{user}: {body}")
-            comment_text = " | ".join(comment_entries)
+        comment_text = " | ".join(
+            f"{comment['user']['login']}: {comment['body'].replace('\n', ' ').strip()}"
+            for comment in issue.get("comments") or ()
+        )
 
         # Handle image processing based on configuration
         image_instruction = ""
@@ -181,19 +196,9 @@ class OpenAIBatchProvider:
 Analyze any relevant images and include your findings in the image_impact field.
 """
             else:
-                image_instruction = """
-
-**NO IMAGES PROVIDED:** This issue contains no images to analyze.
-IMPORTANT: Leave images_analyzed as an empty array and image_impact as an empty
-string since no images were provided.
-"""
+                image_instruction = _NO_IMAGES_INSTRUCTION
         else:
-            image_instruction = """
-
-**NO IMAGES PROVIDED:** Image analysis is disabled for this batch.
-IMPORTANT: Leave images_analyzed as an empty array and image_impact as an empty
-string since image processing is disabled.
-"""
+            image_instruction = _IMAGES_DISABLED_INSTRUCTION
 
         return f"""
 Analyze this GitHub issue for product labeling:
@@ -203,13 +208,12 @@ Analyze this GitHub issue for product labeling:
 **Body:** {issue["body"]}
 
 **Current Labels:** {
-            json.dumps(
+            _COMPACT_ENCODER.encode(
                 [
                     label["name"]
                     for label in issue["labels"]
                     if label["name"].startswith("product::")
-                ],
-                separators=(",", ":"),
+                ]
             )
         }
 
@@ -504,14 +508,15 @@ Recommend the most appropriate product label(s) based on the issue content.
         """
         results = []
 
-        with open(results_file, encoding="utf-8") as f:
+        # Lines are parsed as bytes by pydantic-core, skipping the text decode
+        with open(results_file, "rb") as f:
             for line in f:
                 line = line.strip()
                 if line:
                     try:
-                        result = json.loads(line)
+                        result = pydantic_core.from_json(line)
                         results.append(result)
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:
                         console.print(
                             f"[yellow]Warning: Failed to parse line: {e}[/yellow]"
                         )
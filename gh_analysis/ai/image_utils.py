@@ -29,10 +29,8 @@ def load_downloaded_images(
             continue
 
         local_path = Path(attachment["local_path"])
-        if not local_path.exists():
-            continue
 
-        # Check if it's an image file
+        # Check if it's an image file before touching the filesystem
         content_type = (
             attachment.get("content_type") or mimetypes.guess_type(str(local_path))[0]
         )
@@ -40,7 +38,8 @@ def load_downloaded_images(
             continue
 
         try:
-            # Read the downloaded image
+            # Read the downloaded image; a missing file is skipped without
+            # a separate existence check
             img_bytes = local_path.read_bytes()
             img_size_mb = len(img_bytes) / (1024 * 1024)
 
@@ -65,6 +64,8 @@ def load_downloaded_images(
                     },
                 }
             )
+        except FileNotFoundError:
+            continue
         except Exception as e:
             print(f"Failed to load image {local_path}: {e}")
             continue
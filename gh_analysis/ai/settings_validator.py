@@ -4,6 +4,7 @@ This module provides validation for settings passed to PydanticAI models,
 ensuring they are valid before processing begins.
 """
 
+from functools import lru_cache
 from typing import Any
 
 VALID_PYDANTIC_SETTINGS = {
@@ -56,6 +57,9 @@ def get_provider_from_model(model: str) -> str:
 def validate_settings(model: str, settings: dict[str, Any]) -> list[str]:
     """Validate settings for the given model.
 
+    Results are memoized per (model, settings) so repeated validation of the
+    same combination does not redo the checks.
+
     Args:
         model: Model string (e.g., 'openai:o4-mini')
         settings: Dictionary of settings to validate
@@ -63,13 +67,31 @@ def validate_settings(model: str, settings: dict[str, Any]) -> list[str]:
     Returns:
         List of error messages (empty if all valid)
     """
+    items = tuple(settings.items())
+    try:
+        return list(_validate_settings_cached(model, items))
+    except TypeError:
+        # Unhashable setting values (e.g. nested dicts) cannot be cached
+        return _check_settings(model, items)
+
+
+@lru_cache(maxsize=128)
+def _validate_settings_cached(
+    model: str, items: tuple[tuple[str, Any], ...]
+) -> tuple[str, ...]:
+    """Memoized wrapper around _check_settings."""
+    return tuple(_check_settings(model, items))
+
+
+def _check_settings(model: str, items: tuple[tuple[str, Any], ...]) -> list[str]:
+    """Check each setting against the provider's allowed names and ranges."""
     errors = []
     provider = get_provider_from_model(model)
 
     # Get valid settings for this provider
     valid_settings = MODEL_SPECIFIC_SETTINGS.get(provider, VALID_PYDANTIC_SETTINGS)
 
-    for key, value in settings.items():
+    for key, value in items:
         # Check if setting exists in PydanticAI
         if key not in VALID_PYDANTIC_SETTINGS:
             errors.append(f"Unknown setting '{key}' - not recognized by PydanticAI")
@@ -131,6 +153,7 @@ def validate_settings(model: str, settings: dict[str, Any]) -> list[str]:
     return errors
 
 
+@lru_cache(maxsize=128)
 def get_valid_settings_help(model: str) -> str:
     """Get help text showing valid settings for a model.
 
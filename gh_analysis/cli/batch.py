@@ -13,6 +13,7 @@ from ..ai.settings_validator import get_valid_settings_help, validate_settings
 
 # No imports needed - let PydanticAI handle validation
 from ..recommendation.manager import RecommendationManager
+from ..storage.manager import ISSUE_FILENAME_RE
 from .options import (
     FORCE_OPTION,
 )
@@ -24,6 +25,25 @@ app = typer.Typer(
 console = Console()
 
 
+def _drop_reviewed(
+    issue_files: list[Path], reviewed_issues: set[tuple[str, str, int]]
+) -> tuple[list[Path], int]:
+    """Remove files of already-reviewed issues, returning the rest and a count.
+
+    Files whose names do not follow the issue naming scheme are kept.
+    """
+    remaining = []
+    for file_path in issue_files:
+        match = ISSUE_FILENAME_RE.match(file_path.name)
+        if (
+            match is None
+            or (match["org"], match["repo"], int(match["number"]))
+            not in reviewed_issues
+        ):
+            remaining.append(file_path)
+    return remaining, len(issue_files) - len(remaining)
+
+
 @app.command()
 def submit(
     processor_type: str = typer.Argument(
@@ -217,9 +237,9 @@ async def _run_batch_submit(
 
     # Check what issues would be processed
     try:
-        issues = batch_manager.find_issues(org, repo, issue_number)
+        issue_files = batch_manager.find_issue_files(org, repo, issue_number)
 
-        if not issues:
+        if not issue_files:
             if issue_number:
                 console.print(
                     f"[red]Issue #{issue_number} not found for {org}/{repo}[/red]"
@@ -236,23 +256,14 @@ async def _run_batch_submit(
         console.print(f"[red]Error finding issues: {e}[/red]")
         raise typer.Exit(1)
 
-    # Filter issues based on recommendation status
+    # Filter issues based on recommendation status. Filenames encode
+    # org/repo/number, so reviewed issues are dropped before any file is read
     if not reprocess:
         recommendation_manager = RecommendationManager(Path("data"))
-        filtered_issues = []
-        skipped_count = 0
-
-        for issue_data in issues:
-            issue_org = issue_data["org"]
-            issue_repo = issue_data["repo"]
-            issue_num = issue_data["issue"]["number"]
-
-            if recommendation_manager.should_reprocess_issue(
-                issue_org, issue_repo, issue_num, force_reprocess=False
-            ):
-                filtered_issues.append(issue_data)
-            else:
-                skipped_count += 1
+        # Load the reviewed-issue index once instead of reading a status
+        # file per issue
+        reviewed_issues = recommendation_manager.load_reviewed_index(org, repo)
+        issue_files, skipped_count = _drop_reviewed(issue_files, reviewed_issues)
 
         if skipped_count > 0:
             console.print(
@@ -260,15 +271,18 @@ async def _run_batch_submit(
                 "(use --reprocess to include them)[/yellow]"
             )
 
-        issues = filtered_issues
-
-        if not issues:
+        if not issue_files:
             console.print(
                 "[yellow]No issues to process after filtering. "
                 "Use --reprocess to include reviewed issues.[/yellow]"
             )
             return
 
+    issues = batch_manager.load_issues(issue_files)
+    if not issues:
+        console.print("[red]No issues could be loaded[/red]")
+        return
+
     # Apply max_items limit if specified
     if max_items and len(issues) > max_items:
         original_count = len(issues)
@@ -1,5 +1,8 @@
 """CLI command for collecting GitHub issues."""
 
+import asyncio
+from pathlib import Path
+
 import typer
 from rich.console import Console
 from rich.table import Table
@@ -262,18 +265,15 @@ def collect(
             )
 
             # Process each issue for attachments
+            to_download: list[tuple[GitHubIssue, str, str]] = []
             for i, issue in enumerate(issues):
                 console.print(f"Processing attachments for issue #{issue.number}...")
 
                 # Detect attachments
                 issues[i] = downloader.process_issue_attachments(issue)
 
-                # Download attachments if any were found
+                # Queue attachments for download if any were found
                 if issues[i].attachments:
-                    import asyncio
-                    from pathlib import Path
-
-                    base_dir = Path("data/attachments")
                     # For org-wide searches, use the repository name from the issue
                     repo_name = repo if repo is not None else issues[i].repository_name
                     if repo_name is None:
@@ -283,11 +283,16 @@ def collect(
                         )
                         continue
 
-                    issues[i] = asyncio.run(
-                        downloader.download_issue_attachments(
-                            issues[i], base_dir, org, repo_name
-                        )
+                    to_download.append((issues[i], org, repo_name))
+
+            # Download attachments for all issues together; issues are
+            # updated in place
+            if to_download:
+                asyncio.run(
+                    downloader.download_many_issues(
+                        to_download, Path("data/attachments")
                     )
+                )
 
         # Initialize storage manager
         storage = StorageManager()
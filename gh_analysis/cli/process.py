@@ -1,19 +1,20 @@
 """AI processing commands for GitHub issue analysis."""
 
 import asyncio
-import json
+import itertools
 import os
-from datetime import datetime
+import random
+import re
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import typer
-from pydantic_ai.settings import ModelSettings
-from rich.console import Console
-from rich.table import Table
-
-from ..ai.settings_validator import get_valid_settings_help, validate_settings
-from ..recommendation.manager import RecommendationManager
+from rich.console import Console, Group
 
 app = typer.Typer(
     help="AI processing commands",
@@ -21,10 +22,185 @@ app = typer.Typer(
 )
 console = Console()
 
+# Rate-limited issues are retried this many times before counting as failed
+_MAX_RATE_LIMIT_RETRIES = 4
+
+# Upper bound, in seconds, on the exponential retry delay
+_MAX_RETRY_DELAY = 30.0
+
+# GitHub issue URLs; trailing fragments such as #issuecomment-N are allowed
+_GITHUB_ISSUE_URL_RE = re.compile(r"https?://github\.com/([^/]+)/([^/]+)/issues/(\d+)")
+
+
+class IssueOutcome(IntEnum):
+    """Outcome of processing a single issue, usable as a counter index."""
+
+    PROCESSED = 0
+    SKIPPED = 1
+    FAILED = 2
+
+
+class AdmissionController:
+    """Concurrency limiter whose limit can be changed while tasks are waiting.
+
+    asyncio.Semaphore has no supported way to resize, so admission is tracked
+    with a counter guarded by an asyncio.Condition. On rate limiting the limit
+    is halved, then raised by one slot per successful release once
+    `recovery_seconds` have passed since the last back-off. Rate limits within
+    `back_off_window` seconds of a back-off belong to the same burst, which
+    every in-flight request tends to hit at once, and halve the limit only
+    once.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        recovery_seconds: float = 30.0,
+        back_off_window: float = 5.0,
+    ):
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self.recovery_seconds = recovery_seconds
+        self.back_off_window = back_off_window
+        self._active = 0
+        self._last_back_off: float | None = None
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait until a slot is available under the current limit."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def release(self) -> None:
+        """Free a slot, recovering one unit of limit if the back-off expired."""
+        async with self._condition:
+            self._active -= 1
+            if (
+                self.limit < self.max_concurrency
+                and self._last_back_off is not None
+                and time.monotonic() - self._last_back_off >= self.recovery_seconds
+            ):
+                self.limit += 1
+            self._condition.notify_all()
+
+    async def back_off(self) -> None:
+        """Halve the limit after a rate-limit response, once per burst."""
+        now = time.monotonic()
+        if (
+            self._last_back_off is not None
+            and now - self._last_back_off < self.back_off_window
+        ):
+            return
+        self._last_back_off = now
+        await self.set_limit(max(1, self.limit // 2))
+
+    async def set_limit(self, limit: int) -> None:
+        """Change the limit and wake waiters that may now be admitted."""
+        async with self._condition:
+            self.limit = max(1, min(limit, self.max_concurrency))
+            self._condition.notify_all()
+
+
+class ResultWriter:
+    """Single task that writes the result files handed off by the workers.
+
+    Workers queue a (path, data) pair and move on to their next issue. The
+    writer drains whatever has accumulated and serializes the whole batch in
+    one worker-thread hop, so a burst of finished analyses costs one thread
+    dispatch rather than one per file. Use as an async context manager; on
+    exit every queued result has been written.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.failed = 0
+        self._queue: asyncio.Queue[tuple[Path, Any] | None] = asyncio.Queue(maxsize)
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> "ResultWriter":
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self._queue.put(None)
+        if self._task is not None:
+            await self._task
+
+    async def submit(self, path: Path, data: Any) -> None:
+        """Queue a result to be written, waiting if the queue is full."""
+        await self._queue.put((path, data))
+
+    async def _run(self) -> None:
+        done = False
+        while not done:
+            pending = [await self._queue.get()]
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            batch = [item for item in pending if item is not None]
+            # The sentinel is queued last, after every submitted result
+            done = len(batch) < len(pending)
+            if batch:
+                self.failed += await asyncio.to_thread(_write_json_batch, batch)
+
+
+def _error_chain(error: BaseException) -> Iterator[BaseException]:
+    """Yield an exception and every exception it was raised from or during.
+
+    Runners wrap provider failures (RuntimeError from ModelHTTPError from the
+    provider SDK's error), so details such as the status code and response
+    headers can sit several levels down.
+    """
+    seen: set[int] = set()
+    exc: BaseException | None = error
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        yield exc
+        exc = exc.__cause__ or exc.__context__
+
+
+def _is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an exception is, or wraps, an HTTP 429 from the provider."""
+    return any(getattr(exc, "status_code", None) == 429 for exc in _error_chain(error))
+
+
+def _retry_delay(error: BaseException, attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited request.
+
+    A Retry-After header on the response of any error in the chain takes
+    precedence. Otherwise the delay grows exponentially with the attempt
+    number, with jitter so workers do not retry in lockstep.
+    """
+    for exc in _error_chain(error):
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+        retry_after = headers.get("retry-after") if headers is not None else None
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+    return min(_MAX_RETRY_DELAY, 2.0**attempt) * random.uniform(0.5, 1.0)
+
+
+@lru_cache(maxsize=1)
+def _model_settings_schema() -> dict[str, Any] | None:
+    """Return the JSON schema for ModelSettings, generated once per process.
+
+    Returns None if ModelSettings cannot be introspected.
+    """
+    from pydantic_ai.settings import ModelSettings
+
+    # Check if ModelSettings has schema method (Pydantic v2)
+    if not hasattr(ModelSettings, "model_json_schema"):
+        return None
+    schema: dict[str, Any] = ModelSettings.model_json_schema()
+    return schema
+
 
 @app.command()
 def show_settings() -> None:
     """Display available model settings that can be configured."""
+    from rich.table import Table
+
     # Use Pydantic's introspection on ModelSettings
     table = Table(title="Available Model Settings")
     table.add_column("Setting", style="cyan")
@@ -33,9 +209,8 @@ def show_settings() -> None:
 
     # Try to get field info from ModelSettings dynamically
     try:
-        # Check if ModelSettings has schema method (Pydantic v2)
-        if hasattr(ModelSettings, "model_json_schema"):
-            schema = ModelSettings.model_json_schema()
+        schema = _model_settings_schema()
+        if schema is not None:
             properties = schema.get("properties", {})
             for field_name, field_info in properties.items():
                 field_type = field_info.get("type", "Any")
@@ -64,21 +239,22 @@ def show_settings() -> None:
         )
         return
 
-    console.print(table)
-
-    # Add usage example
-    console.print("\n[bold]Usage Example:[/bold]")
+    # Render the table, usage example and notes in a single print
     console.print(
-        "github-analysis process product-labeling --setting temperature=0.5 "
-        "--setting reasoning_effort=high"
+        Group(
+            table,
+            # Usage example
+            "\n[bold]Usage Example:[/bold]",
+            "github-analysis process product-labeling --setting temperature=0.5 "
+            "--setting reasoning_effort=high",
+            # Model-specific notes
+            "\n[bold]Notes:[/bold]",
+            "• Not all settings are supported by all models",
+            "• PydanticAI will validate settings when you run the command",
+            "• Invalid settings will result in clear error messages",
+        )
     )
 
-    # Add model-specific notes
-    console.print("\n[bold]Notes:[/bold]")
-    console.print("• Not all settings are supported by all models")
-    console.print("• PydanticAI will validate settings when you run the command")
-    console.print("• Invalid settings will result in clear error messages")
-
 
 @app.command()
 def product_labeling(
@@ -139,6 +315,7 @@ def product_labeling(
         20,
         "--concurrency",
         "-c",
+        min=1,
         help="Number of concurrent processing tasks",
         rich_help_panel="Processing Options",
     ),
@@ -168,6 +345,8 @@ def product_labeling(
         # Preview changes without processing
         github-analysis process product-labeling --org myorg --repo myrepo --dry-run
     """
+    from ..ai.settings_validator import get_valid_settings_help, validate_settings
+
     try:
         # Parse settings into dict
         model_settings = {}
@@ -179,17 +358,7 @@ def product_labeling(
                 )
                 raise typer.Exit(1)
             key, value = setting.split("=", 1)
-            # Try to parse as number if possible
-            parsed_value: Any = value
-            try:
-                num_value = float(value)
-                if num_value.is_integer():
-                    parsed_value = int(num_value)
-                else:
-                    parsed_value = num_value
-            except ValueError:
-                pass  # Keep as string
-            model_settings[key] = parsed_value
+            model_settings[key] = _parse_setting_value(value)
 
         # Validate settings BEFORE processing
         errors = validate_settings(model, model_settings)
@@ -218,6 +387,76 @@ def product_labeling(
         raise typer.Exit(1)
 
 
+def _iter_issue_files(data_dir: Path, prefix: str = "") -> Iterator[Path]:
+    """Yield issue JSON files in data_dir whose names start with prefix.
+
+    Uses os.scandir so entries are filtered by name as the directory is read,
+    without building a Path or stat-ing every entry up front.
+    """
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(".json") and "_issue_" in name:
+                yield Path(entry.path)
+
+
+def _parse_setting_value(value: str) -> Any:
+    """Parse a --setting value as int or float where possible.
+
+    Integers are tried first since they are the common case (max_tokens,
+    seed). Whole-number floats such as "1e3" still become ints.
+    """
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        num_value = float(value)
+    except ValueError:
+        return value  # Keep as string
+    return int(num_value) if num_value.is_integer() else num_value
+
+
+def _discover_issue_files(
+    data_dir: Path, org: str | None, repo: str | None, issue_number: int | None
+) -> Iterator[Path]:
+    """Lazily yield the issue files selected by the target options."""
+    if issue_number:
+        # Specific issue file with org/repo/issue pattern
+        issue_file = data_dir / f"{org}_{repo}_issue_{issue_number}.json"
+        if os.path.isfile(issue_file):
+            yield issue_file
+    elif org and repo:
+        # All issues for specific org/repo
+        yield from _iter_issue_files(data_dir, f"{org}_{repo}_issue_")
+    elif org:
+        # All issues for specific org (across all repos)
+        yield from _iter_issue_files(data_dir, f"{org}_")
+    else:
+        # All issues
+        yield from _iter_issue_files(data_dir)
+
+
+def _plan_work(
+    issue_files: Iterator[Path], reviewed_issues: set[tuple[str, str, int]]
+) -> Iterator[tuple[Path, bool]]:
+    """Yield (file_path, needs_processing) for each discovered issue file.
+
+    Filenames encode org/repo/number, so reviewed issues are identified as
+    the directory is scanned, without queueing or reading their files.
+    """
+    from ..storage.manager import ISSUE_FILENAME_RE
+
+    for file_path in issue_files:
+        match = ISSUE_FILENAME_RE.match(file_path.name)
+        if match is None:
+            # Unexpected name; let the worker decide from the file contents
+            yield file_path, True
+            continue
+        issue_key = (match["org"], match["repo"], int(match["number"]))
+        yield file_path, issue_key not in reviewed_issues
+
+
 async def _run_product_labeling(
     org: str,
     repo: str | None,
@@ -241,7 +480,6 @@ async def _run_product_labeling(
         )
         return
 
-    issue_files = []
     if issue_number:
         # Validate that repo is provided for specific issue
         if not repo:
@@ -250,44 +488,35 @@ async def _run_product_labeling(
             )
             return
 
-        # Find specific issue file with org/repo/issue pattern
+        # Existence is checked once, by discovery below
         expected_filename = f"{org}_{repo}_issue_{issue_number}.json"
-        expected_path = data_dir / expected_filename
-
-        if not expected_path.exists():
-            console.print(
-                f"[red]Issue #{issue_number} not found for {org}/{repo}.[/red]"
-            )
-            console.print(f"[red]Expected file: {expected_filename}[/red]")
-            return
-        issue_files = [expected_path]
+        not_found_message = (
+            f"[red]Issue #{issue_number} not found for {org}/{repo}.[/red]\n"
+            f"[red]Expected file: {expected_filename}[/red]"
+        )
     elif org and repo:
-        # Process all issues for specific org/repo
-        pattern = f"{org}_{repo}_issue_*.json"
-        issue_files = list(data_dir.glob(pattern))
-        if not issue_files:
-            console.print(f"[red]No issues found for {org}/{repo}.[/red]")
-            return
+        not_found_message = f"[red]No issues found for {org}/{repo}.[/red]"
     elif org:
-        # Process all issues for specific org (across all repos)
-        pattern = f"{org}_*_issue_*.json"
-        issue_files = list(data_dir.glob(pattern))
-        if not issue_files:
-            console.print(f"[red]No issues found for organization {org}.[/red]")
-            return
+        not_found_message = f"[red]No issues found for organization {org}.[/red]"
     else:
-        # Process all issues
-        issue_files = list(data_dir.glob("*_issue_*.json"))
+        not_found_message = "[yellow]No issue files found to process.[/yellow]"
 
-    if not issue_files:
-        console.print("[yellow]No issue files found to process.[/yellow]")
-        return
+    issue_files = _discover_issue_files(data_dir, org, repo, issue_number)
 
-    console.print(f"[blue]Found {len(issue_files)} issue(s) to process[/blue]")
+    # Peek at the first match so an empty selection is reported without
+    # materializing the whole directory listing
+    first_file = next(issue_files, None)
+    if first_file is None:
+        console.print(not_found_message)
+        return
+    issue_files = itertools.chain([first_file], issue_files)
 
     if dry_run:
-        for file_path in issue_files:
-            console.print(f"Would process: {file_path.name}")
+        # Names come straight from the directory scan; nothing is loaded and
+        # the whole preview is rendered in a single print
+        preview = [f"Would process: {file_path.name}" for file_path in issue_files]
+        console.print("\n".join(preview), markup=False, highlight=False, soft_wrap=True)
+        console.print(f"[blue]Found {len(preview)} issue(s) to process[/blue]")
         return
 
     # Show configuration
@@ -298,145 +527,271 @@ async def _run_product_labeling(
         f"[blue]Image processing: {'enabled' if include_images else 'disabled'}[/blue]"
     )
 
-    # Initialize recommendation manager for filtering
-    recommendation_manager = RecommendationManager(base_data_dir)
+    from rich.progress import (
+        BarColumn,
+        MofNCompleteColumn,
+        Progress,
+        SpinnerColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
+    from ..recommendation.manager import RecommendationManager
+    from ..runners import get_runner
+
+    # One runner, and so one agent, is shared by every worker. pydantic-ai
+    # agents support concurrent runs, and the provider's pooled HTTP client
+    # is reused instead of an agent being rebuilt for each issue
+    try:
+        runner = get_runner(
+            "product-labeling", model_name=model, model_settings=model_settings
+        )
+    except Exception as e:
+        console.print(f"[red]❌ Failed to create runner: {e}[/red]")
+        return
+
+    # Load the reviewed-issue index for the target once instead of checking
+    # status per file
+    reviewed_issues: set[tuple[str, str, int]] = (
+        set()
+        if reprocess
+        else RecommendationManager(base_data_dir).load_reviewed_index(org, repo)
+    )
 
     # Process each issue concurrently
     results_dir = base_data_dir / "results"
     results_dir.mkdir(exist_ok=True)
 
-    # Create semaphore to limit concurrent operations
-    semaphore = asyncio.Semaphore(concurrency)
+    # Feed issue files through a bounded queue to a fixed pool of workers so
+    # only `concurrency` tasks exist regardless of how many files are found
+    queue: asyncio.Queue[Path] = asyncio.Queue(maxsize=concurrency * 4)
+
+    # Outcomes are tallied as they land rather than kept per issue, so memory
+    # stays flat however many files are processed
+    counts = [0] * len(IssueOutcome)
+
+    # Admission is gated separately from the worker count so the effective
+    # concurrency can shrink when the model provider starts rate limiting
+    admission = AdmissionController(concurrency)
+
+    # A single progress bar replaces per-issue status lines; the total is
+    # filled in once discovery has finished
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console,
+    )
+    progress_task = progress.add_task("Processing issues", total=None)
+
+    async def process_with_retry(file_path: Path) -> IssueOutcome:
+        # Rate-limited issues are retried after a delay; the admission slot
+        # is given back while waiting so other issues keep flowing
+        attempt = 0
+        while True:
+            await admission.acquire()
+            try:
+                return await _process_single_issue(
+                    file_path,
+                    reviewed_issues,
+                    results_dir,
+                    model,
+                    model_settings,
+                    include_images,
+                    reprocess,
+                    writer,
+                    runner,
+                )
+            except Exception as e:
+                # A rate limit that will be retried is not a failure yet
+                rate_limited = _is_rate_limit_error(e)
+                if rate_limited:
+                    await admission.back_off()
+                if not rate_limited or attempt >= _MAX_RATE_LIMIT_RETRIES:
+                    console.print(
+                        f"[red]✗ Failed to process {file_path.name}: {e}[/red]"
+                    )
+                    return IssueOutcome.FAILED
+                delay = _retry_delay(e, attempt)
+            finally:
+                await admission.release()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def worker() -> None:
+        while True:
+            file_path = await queue.get()
+            try:
+                counts[await process_with_retry(file_path)] += 1
+            finally:
+                progress.advance(progress_task)
+                queue.task_done()
+
+    # Finished results are funnelled to one writer task instead of each
+    # worker writing its own file
+    writer = ResultWriter()
+
+    async with writer:
+        with progress:
+            # Workers are cancelled however this block ends, including when
+            # discovery fails part way through
+            workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+            try:
+                planned_count = 0
+                for file_path, needs_processing in _plan_work(
+                    issue_files, reviewed_issues
+                ):
+                    planned_count += 1
+                    if needs_processing:
+                        await queue.put(file_path)
+                    else:
+                        counts[IssueOutcome.SKIPPED] += 1
+                        progress.advance(progress_task)
+                progress.update(progress_task, total=planned_count)
+                # Reported once discovery ends, as the files are streamed
+                console.print(f"[blue]Found {planned_count} issue(s) to process[/blue]")
+                await queue.join()
+            finally:
+                for worker_task in workers:
+                    worker_task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+    # Results that could not be saved count as failures, not as processed
+    counts[IssueOutcome.PROCESSED] -= writer.failed
+    counts[IssueOutcome.FAILED] += writer.failed
 
-    # Process files concurrently
-    tasks = []
-    for file_path in issue_files:
-        task = asyncio.create_task(
-            _process_single_issue(
-                file_path,
-                recommendation_manager,
-                results_dir,
-                model,
-                model_settings,
-                include_images,
-                reprocess,
-                semaphore,
-            )
+    # Show summary
+    total_count = sum(counts)
+    console.print(
+        f"\n[blue]Summary: Processed {counts[IssueOutcome.PROCESSED]}/{total_count} "
+        f"issues ({counts[IssueOutcome.SKIPPED]} skipped, "
+        f"{counts[IssueOutcome.FAILED]} failed)[/blue]"
+    )
+    if counts[IssueOutcome.SKIPPED]:
+        console.print(
+            "[yellow]Skipped issues were already reviewed "
+            "(use --reprocess to override)[/yellow]"
         )
-        tasks.append(task)
 
-    # Wait for all tasks to complete and collect results
-    results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    # Count successes and failures
-    processed_count = 0
-    skipped_count = 0
-    failed_count = 0
+def _count_image_attachments(issue: dict[str, Any]) -> int:
+    """Count downloaded image attachments on a stored issue."""
+    return sum(
+        1
+        for att in issue.get("attachments", ())
+        if att.get("downloaded")
+        and (att.get("content_type") or "").startswith("image/")
+    )
 
-    for result in results:
-        if isinstance(result, Exception):
-            failed_count += 1
-        elif result == "processed":
-            processed_count += 1
-        elif result == "skipped":
-            skipped_count += 1
 
-    # Show summary
-    total_count = len(issue_files)
-    console.print(
-        f"\n[blue]Summary: Processed {processed_count}/{total_count} issues "
-        f"({skipped_count} skipped, {failed_count} failed)[/blue]"
-    )
+def _read_json(path: Path) -> Any:
+    """Read a JSON file in a single read and parse it with pydantic-core."""
+    import pydantic_core
+
+    return pydantic_core.from_json(path.read_bytes())
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Serialize data as indented JSON and write it to path.
+
+    Uses pydantic-core's native encoder, which also handles datetimes.
+    """
+    import pydantic_core
+
+    path.write_bytes(pydantic_core.to_json(data, indent=2))
+
+
+def _write_json_batch(batch: list[tuple[Path, Any]]) -> int:
+    """Write each (path, data) pair, returning the number that failed."""
+    failed = 0
+    for path, data in batch:
+        try:
+            _write_json(path, data)
+        except Exception as e:
+            console.print(f"[red]✗ Failed to save {path.name}: {e}[/red]")
+            failed += 1
+    return failed
 
 
 async def _process_single_issue(
     file_path: Path,
-    recommendation_manager: RecommendationManager,
+    reviewed_issues: set[tuple[str, str, int]],
     results_dir: Path,
     model: str,
     model_settings: dict[str, Any],
     include_images: bool,
     reprocess: bool,
-    semaphore: asyncio.Semaphore,
-) -> str:
+    writer: ResultWriter | None = None,
+    runner: Any = None,
+) -> IssueOutcome:
     """Process a single issue file.
 
+    The result is handed to `writer` when one is given, otherwise it is
+    written before returning. A product-labeling runner is created for the
+    issue unless a shared `runner` is passed in.
+
     Returns:
-        "processed" if successful, "skipped" if skipped, raises exception if failed
+        IssueOutcome.PROCESSED if successful, IssueOutcome.SKIPPED if skipped,
+        raises exception if failed
     """
-    async with semaphore:
-        try:
-            # Load issue data to check if we should process it
-            with open(file_path) as f:
-                issue_data = json.load(f)
+    # Load issue data to check if we should process it
+    issue_data = await asyncio.to_thread(_read_json, file_path)
 
-            # Check if issue should be reprocessed
-            issue_org = issue_data["org"]
-            issue_repo = issue_data["repo"]
-            issue_num = issue_data["issue"]["number"]
-
-            if not recommendation_manager.should_reprocess_issue(
-                issue_org, issue_repo, issue_num, reprocess
-            ):
-                console.print(
-                    f"[yellow]Skipping {file_path.name} - already reviewed "
-                    "(use --reprocess to override)[/yellow]"
-                )
-                return "skipped"
-
-            console.print(f"Processing {file_path.name}...")
-
-            # Check for images if enabled
-            if include_images:
-                attachment_count = len(
-                    [
-                        att
-                        for att in issue_data["issue"].get("attachments", [])
-                        if att.get("downloaded")
-                        and att.get("content_type", "").startswith("image/")
-                    ]
-                )
-                if attachment_count > 0:
-                    console.print(f"  Found {attachment_count} image(s) to analyze")
+    # Check if issue should be reprocessed
+    issue_org = issue_data["org"]
+    issue_repo = issue_data["repo"]
+    issue_num = issue_data["issue"]["number"]
 
-            # Use runner instead of direct agent
-            from ..runners import get_runner
+    if not reprocess and (issue_org, issue_repo, issue_num) in reviewed_issues:
+        return IssueOutcome.SKIPPED
 
-            runner = get_runner(
-                "product-labeling", model_name=model, model_settings=model_settings
+    # Check for images if enabled
+    if include_images:
+        attachment_count = _count_image_attachments(issue_data["issue"])
+        if attachment_count > 0:
+            console.print(
+                f"  {file_path.name}: found {attachment_count} image(s) to analyze"
             )
 
-            # Analyze using runner
-            result: Any = await runner.analyze(issue_data)
-
-            # Save result
-            result_file = results_dir / f"{file_path.stem}_product-labeling.json"
-            result_data = {
-                "issue_reference": {
-                    "file_path": str(file_path),
-                    "org": issue_data["org"],
-                    "repo": issue_data["repo"],
-                    "issue_number": issue_data["issue"]["number"],
-                },
-                "processor": {
-                    "name": "product-labeling",
-                    "version": "3.0.0",  # Simplified agent interface version
-                    "model": model,
-                    "include_images": include_images,
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                },
-                "analysis": result.model_dump(),
-            }
+    # Use runner instead of direct agent
+    if runner is None:
+        from ..runners import get_runner
 
-            with open(result_file, "w") as f:
-                json.dump(result_data, f, indent=2)
+        runner = get_runner(
+            "product-labeling", model_name=model, model_settings=model_settings
+        )
 
-            console.print(f"[green]✓ Saved results to {result_file.name}[/green]")
-            return "processed"
+    # Analyze using runner
+    result: Any = await runner.analyze(issue_data)
 
-        except Exception as e:
-            console.print(f"[red]✗ Failed to process {file_path.name}: {e}[/red]")
-            raise
+    # Save result
+    result_file = results_dir / f"{file_path.stem}_product-labeling.json"
+    result_data = {
+        "issue_reference": {
+            "file_path": str(file_path),
+            "org": issue_data["org"],
+            "repo": issue_data["repo"],
+            "issue_number": issue_data["issue"]["number"],
+        },
+        "processor": {
+            "name": "product-labeling",
+            "version": "3.0.0",  # Simplified agent interface version
+            "model": model,
+            "include_images": include_images,
+            "timestamp": datetime.now(UTC),
+        },
+        "analysis": result.model_dump(),
+    }
+
+    if writer is not None:
+        await writer.submit(result_file, result_data)
+    else:
+        # Serialize and write off the event loop so other in-flight
+        # analyses are not stalled behind large result payloads
+        await asyncio.to_thread(_write_json, result_file, result_data)
+    return IssueOutcome.PROCESSED
 
 
 @app.command()
@@ -588,13 +943,10 @@ async def _run_troubleshoot(
     interactive: bool,
 ) -> None:
     """Run troubleshooting analysis."""
-    import re
-
     # Parse URL if provided
     if url:
         # Extract org, repo, issue_number from GitHub URL
-        github_url_pattern = r"https?://github\.com/([^/]+)/([^/]+)/issues/(\d+)"
-        match = re.match(github_url_pattern, url)
+        match = _GITHUB_ISSUE_URL_RE.match(url)
         if not match:
             raise ValueError(f"Invalid GitHub issue URL: {url}")
         org, repo, issue_number_str = match.groups()
@@ -721,8 +1073,7 @@ async def _run_troubleshoot(
 
     # Load issue data
     try:
-        with open(issue_file) as f:
-            issue_data = json.load(f)
+        issue_data = await asyncio.to_thread(_read_json, issue_file)
         console.print(f"[blue]✓ Loaded issue data from {expected_filename}[/blue]")
     except Exception as e:
         console.print(f"[red]❌ Failed to load issue data: {e}[/red]")
@@ -741,29 +1092,26 @@ async def _run_troubleshoot(
 
     # Check for images if enabled
     if include_images:
-        attachment_count = len(
-            [
-                att
-                for att in issue_data["issue"].get("attachments", [])
-                if att.get("downloaded")
-                and att.get("content_type", "").startswith("image/")
-            ]
-        )
+        attachment_count = _count_image_attachments(issue_data["issue"])
         if attachment_count > 0:
             console.print(f"[blue]Found {attachment_count} image(s) to analyze[/blue]")
 
     # Limit comments if specified (for processing only, not downloading)
     processed_issue_data = issue_data
     if limit_comments is not None:
-        processed_issue_data = issue_data.copy()
         # Extract issue from StoredIssue dictionary format
         issue_model = issue_data["issue"]
         original_comments = issue_model.get("comments", [])
         if len(original_comments) > limit_comments:
-            # Create a new dictionary with limited comments
-            limited_issue = issue_model.copy()
-            limited_issue["comments"] = original_comments[:limit_comments]
-            processed_issue_data["issue"] = limited_issue
+            # Overlay the truncated comments without copying the issue twice;
+            # issue_data itself is left untouched
+            processed_issue_data = {
+                **issue_data,
+                "issue": {
+                    **issue_model,
+                    "comments": original_comments[:limit_comments],
+                },
+            }
             console.print(
                 f"[yellow]Limiting analysis to first {limit_comments} comment(s) "
                 f"out of {len(original_comments)} total[/yellow]"
@@ -775,7 +1123,7 @@ async def _run_troubleshoot(
 
     # Run analysis
     console.print(f"[blue]🔍 Running {agent_name} analysis...[/blue]")
-    start_time = datetime.utcnow()
+    start_time = time.monotonic()
 
     try:
         # Analyze using runner
@@ -800,8 +1148,7 @@ async def _run_troubleshoot(
         else:
             agent_result = None
 
-        end_time = datetime.utcnow()
-        processing_time = (end_time - start_time).total_seconds()
+        processing_time = time.monotonic() - start_time
 
         # Processing time calculated but not stored in discriminated union
 
@@ -871,14 +1218,13 @@ async def _run_troubleshoot(
             "version": "1.0.0",
             "agent": agent_name,
             "include_images": include_images,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.now(UTC),
         },
         "analysis": result.model_dump(),
     }
 
     try:
-        with open(result_file, "w") as f:
-            json.dump(result_data, f, indent=2)
+        await asyncio.to_thread(_write_json, result_file, result_data)
         console.print(f"\n[green]✓ Results saved to {result_file.name}[/green]")
     except Exception as e:
         console.print(f"\n[red]❌ Failed to save results: {e}[/red]")
@@ -1,11 +1,11 @@
 """CLI commands for managing AI recommendation review workflow."""
 
 import builtins
-import json
+import sys
+from collections import Counter
 from pathlib import Path
 
 import typer
-from rich import print as rprint
 from rich.console import Console
 from rich.table import Table
 
@@ -111,25 +111,15 @@ def list_recommendations(
         limit=limit,
     )
 
-    # Add NO_CHANGE_NEEDED to status filter unless explicitly requested
-    if not include_no_change:
-        if filter_criteria.status:
-            # Don't add NO_CHANGE_NEEDED to existing status filter
-            pass
-        else:
-            # Exclude NO_CHANGE_NEEDED by default - show all other statuses
-            all_statuses = list(RecommendationStatus)
-            all_statuses.remove(RecommendationStatus.NO_CHANGE_NEEDED)
-            filter_criteria.status = all_statuses
+    # Exclude NO_CHANGE_NEEDED by default unless explicitly requested; an
+    # explicit status filter is left to decide on its own
+    if not include_no_change and not filter_criteria.status:
+        filter_criteria.exclude_status = [RecommendationStatus.NO_CHANGE_NEEDED]
 
     recommendations = manager.get_recommendations(filter_criteria)
 
     if format == "json":
-        rprint(
-            json.dumps(
-                [rec.model_dump() for rec in recommendations], indent=2, default=str
-            )
-        )
+        _write_recommendations_json(recommendations)
     elif format == "summary":
         _display_recommendations_summary(recommendations)
     else:
@@ -308,6 +298,22 @@ def _display_recommendations_table(
     console.print(table)
 
 
+def _write_recommendations_json(
+    recommendations: builtins.list[RecommendationMetadata],
+) -> None:
+    """Write recommendations to stdout as a JSON array, one record at a time.
+
+    Each record is encoded by pydantic-core and written directly, so neither
+    the full list of dicts nor the full JSON document is held in memory.
+    """
+    out = sys.stdout
+    out.write("[")
+    for i, rec in enumerate(recommendations):
+        out.write(",\n" if i else "\n")
+        out.write(rec.model_dump_json(indent=2))
+    out.write("\n]\n" if recommendations else "]\n")
+
+
 def _display_recommendations_summary(
     recommendations: builtins.list[RecommendationMetadata],
 ) -> None:
@@ -317,21 +323,9 @@ def _display_recommendations_summary(
         return
 
     # Calculate statistics
-    by_status: dict[str, int] = {}
-    by_product: dict[str, int] = {}
-    by_confidence: dict[str, int] = {"high": 0, "medium": 0, "low": 0}
-
-    for rec in recommendations:
-        # Status
-        status = rec.status.value
-        by_status[status] = by_status.get(status, 0) + 1
-
-        # Product
-        product = rec.primary_product or "unknown"
-        by_product[product] = by_product.get(product, 0) + 1
-
-        # Confidence
-        by_confidence[rec.confidence_tier] += 1
+    by_status = Counter(rec.status.value for rec in recommendations)
+    by_product = Counter(rec.primary_product or "unknown" for rec in recommendations)
+    by_confidence = Counter(rec.confidence_tier for rec in recommendations)
 
     # Display summary
     console.print(f"\n[bold]Summary of {len(recommendations)} recommendations:[/bold]")
@@ -341,11 +335,9 @@ def _display_recommendations_summary(
         console.print(f"  {status}: {count}")
 
     console.print("\nBy Product:")
-    for product, count in sorted(by_product.items(), key=lambda x: x[1], reverse=True)[
-        :5
-    ]:
+    for product, count in by_product.most_common(5):
         console.print(f"  {product}: {count}")
 
     console.print("\nBy Confidence:")
-    for tier, count in by_confidence.items():
-        console.print(f"  {tier}: {count}")
+    for tier in ("high", "medium", "low"):
+        console.print(f"  {tier}: {by_confidence[tier]}")
@@ -1,6 +1,8 @@
 """CLI commands for updating GitHub issue labels based on AI recommendations."""
 
 import os
+import time
+from datetime import datetime
 from pathlib import Path
 
 import typer
@@ -10,6 +12,7 @@ from rich.prompt import Confirm
 from ..ai.change_detector import ChangeDetector, IssueUpdatePlan
 from ..ai.comment_generator import CommentGenerator
 from ..github_client.client import GitHubClient
+from ..recommendation.models import RecommendationFilter, RecommendationStatus
 from ..recommendation.status_tracker import StatusTracker
 from .options import (
     DATA_DIR_OPTION,
@@ -136,8 +139,6 @@ def update_labels(
             raise typer.Exit(1)
 
         # Get recommendations from status tracker
-        from ..recommendation.models import RecommendationFilter
-
         filter_criteria = RecommendationFilter(
             org=org,
             repo=repo,
@@ -239,8 +240,6 @@ def _apply_label_changes(
     Returns:
         Tuple of (successful_plans, failed_plans_with_errors)
     """
-    import time
-
     # Get GitHub token
     github_token = os.getenv("GITHUB_TOKEN")
     if not github_token:
@@ -298,10 +297,6 @@ def _apply_label_changes(
                         plan.org, plan.repo, plan.issue_number
                     )
                     if recommendation:
-                        from datetime import datetime
-
-                        from ..recommendation.models import RecommendationStatus
-
                         recommendation.status = RecommendationStatus.APPLIED
                         recommendation.status_updated_at = datetime.now()
                         status_tracker.save_recommendation(recommendation)
@@ -324,10 +319,6 @@ def _apply_label_changes(
                     plan.org, plan.repo, plan.issue_number
                 )
                 if recommendation:
-                    from datetime import datetime
-
-                    from ..recommendation.models import RecommendationStatus
-
                     recommendation.status = RecommendationStatus.FAILED
                     recommendation.status_updated_at = datetime.now()
                     status_tracker.save_recommendation(recommendation)
@@ -1,8 +1,14 @@
 """GitHub attachment detection and download functionality."""
 
 import asyncio
+import importlib.util
+import itertools
+import json
+import os
 import re
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 from urllib.parse import urlparse
 
 import httpx
@@ -19,25 +25,124 @@ GITHUB_IMAGE_PATTERN = (
 )
 GITHUB_ASSET_PATTERN = r"https://github\.com/user-attachments/assets/[\w-]+"
 
+# All attachment URL kinds in one alternation, so each text is scanned once
+_ATTACHMENT_URL_RE = re.compile(
+    f"(?P<file>{GITHUB_FILE_PATTERN})"
+    f"|(?P<image>{GITHUB_IMAGE_PATTERN})"
+    f"|(?P<asset>{GITHUB_ASSET_PATTERN})"
+)
+
+# Signed private-user-images URLs in issue and comment body_html, and the
+# asset UUID within them. URLs look like .../456579721-{uuid}.png?jwt=...
+_JWT_URL_RE = re.compile(
+    r'https://private-user-images\.githubusercontent\.com/[^"]+\?jwt=[^"]+'
+)
+_ASSET_UUID_RE = re.compile(
+    r"/\d+-([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})\."
+)
+
+# Characters not allowed in saved attachment filenames
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^A-Za-z0-9._-]")
+
+# Connection pool shared by the requests for one issue's attachments. Reads
+# get a longer timeout since they cover streaming the attachment body.
+_CLIENT_TIMEOUT = httpx.Timeout(connect=10.0, read=60.0, write=10.0, pool=5.0)
+_CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0
+)
+
+# HTTP/2 multiplexes concurrent downloads from the same host over one
+# connection; httpx only supports it when the optional h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Concurrent asset-URL lookups, kept low for GitHub's secondary rate limits;
+# shared by every issue in one download_many_issues call
+_MAX_CONCURRENT_LOOKUPS = 8
+
+# Attachment bodies are written to disk in chunks of this many bytes
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Suffix of the temporary name an attachment is streamed into; the file is
+# moved to its final name only once the last chunk has been written
+_PARTIAL_SUFFIX = ".part"
+
+# Record, in each download directory, of the URL every saved file came from
+# with its size and type; a later run reuses a file only for that URL
+_MANIFEST_NAME = ".attachments.json"
+
+
+def _scrub_filename(filename: str) -> str:
+    """Replace characters that are unsafe in a saved filename."""
+    # Ensure filename is not empty
+    return _UNSAFE_FILENAME_CHARS_RE.sub("_", filename) or "attachment"
+
+
+def _source_key(url: str) -> str:
+    """Key a saved file is recorded under; signed query strings change per run."""
+    return url.split("?", 1)[0]
+
+
+def _read_manifest(download_dir: Path) -> dict[str, dict[str, Any]]:
+    """Load the record of files saved in download_dir, empty if there is none."""
+    try:
+        manifest = json.loads((download_dir / _MANIFEST_NAME).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _write_manifest(download_dir: Path, manifest: dict[str, dict[str, Any]]) -> None:
+    """Replace the record of files saved in download_dir."""
+    part_path = download_dir / (_MANIFEST_NAME + _PARTIAL_SUFFIX)
+    try:
+        part_path.write_text(json.dumps(manifest, indent=2))
+        os.replace(part_path, download_dir / _MANIFEST_NAME)
+    finally:
+        part_path.unlink(missing_ok=True)
+
 
 class AttachmentDownloader:
     """Downloads and manages GitHub issue attachments."""
 
-    def __init__(self, github_token: str, max_size_mb: int = 10):
+    __slots__ = (
+        "github_token",
+        "max_size_bytes",
+        "max_concurrent_downloads",
+        "headers",
+    )
+
+    def __init__(
+        self,
+        github_token: str,
+        max_size_mb: int = 10,
+        max_concurrent_downloads: int = 8,
+    ):
         """Initialize attachment downloader.
 
         Args:
             github_token: GitHub personal access token
             max_size_mb: Maximum file size to download in MB
+            max_concurrent_downloads: Maximum number of downloads in flight
         """
         self.github_token = github_token
         self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.max_concurrent_downloads = max_concurrent_downloads
         self.headers = {
             "Authorization": f"Bearer {github_token}",
             "User-Agent": "github-issue-analysis/0.1.0",
             "Accept": "application/vnd.github.full+json",
         }
 
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create an HTTP client whose connections are reused across requests.
+
+        Headers are passed per request rather than set on the client, since
+        JWT-signed URLs must be fetched without the Authorization header.
+        """
+        return httpx.AsyncClient(
+            timeout=_CLIENT_TIMEOUT, limits=_CLIENT_LIMITS, http2=_HTTP2_AVAILABLE
+        )
+
     def detect_attachments(self, text: str, source: str) -> list[GitHubAttachment]:
         """Detect GitHub attachments in text content.
 
@@ -48,36 +153,20 @@ class AttachmentDownloader:
         Returns:
             List of detected GitHubAttachment objects
         """
-        if not text:
-            return []
-
-        attachments = []
-
-        # Find all GitHub file URLs
-        file_urls = re.findall(GITHUB_FILE_PATTERN, text)
-        for url in file_urls:
+        return list(self._iter_attachments(text, source))
+
+    def _iter_attachments(self, text: str, source: str) -> Iterator[GitHubAttachment]:
+        """Yield the GitHub attachments found in text, in order of appearance."""
+        # Every attachment URL contains "github"; a substring check is much
+        # cheaper than the regex for the many texts without attachments
+        if not text or "github" not in text:
+            return
+
+        # Find GitHub file, image and asset URLs in a single pass
+        for match in _ATTACHMENT_URL_RE.finditer(text):
+            url = match.group()
             filename = self._extract_filename(url)
-            attachments.append(
-                GitHubAttachment(original_url=url, filename=filename, source=source)
-            )
-
-        # Find all GitHub image URLs
-        image_urls = re.findall(GITHUB_IMAGE_PATTERN, text)
-        for url in image_urls:
-            filename = self._extract_filename(url)
-            attachments.append(
-                GitHubAttachment(original_url=url, filename=filename, source=source)
-            )
-
-        # Find all GitHub asset URLs
-        asset_urls = re.findall(GITHUB_ASSET_PATTERN, text)
-        for url in asset_urls:
-            filename = self._extract_filename(url)
-            attachments.append(
-                GitHubAttachment(original_url=url, filename=filename, source=source)
-            )
-
-        return attachments
+            yield GitHubAttachment(original_url=url, filename=filename, source=source)
 
     def _extract_filename(self, url: str) -> str:
         """Extract filename from URL.
@@ -103,30 +192,29 @@ class AttachmentDownloader:
         # Generate filename from URL if extraction fails
         return f"attachment_{hash(url) % 10000}"
 
-    def _generate_safe_filename(self, filename: str, download_dir: Path) -> str:
+    def _generate_safe_filename(
+        self, filename: str, download_dir: Path, taken: set[str] | None = None
+    ) -> str:
         """Generate a safe filename, handling duplicates.
 
         Args:
             filename: Original filename
             download_dir: Directory where file will be saved
+            taken: Names already used in download_dir; the returned name is
+                added to it. The directory is listed if not given.
 
         Returns:
             Safe filename that doesn't conflict with existing files
         """
-        # Remove or replace unsafe characters
-        safe_chars = set(
-            "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-_"
-        )
-        safe_filename = "".join(c if c in safe_chars else "_" for c in filename)
+        if taken is None:
+            taken = set(os.listdir(download_dir))
 
-        # Ensure filename is not empty
-        if not safe_filename:
-            safe_filename = "attachment"
+        safe_filename = _scrub_filename(filename)
 
         # Handle duplicate filenames
         counter = 1
         original_name = safe_filename
-        while (download_dir / safe_filename).exists():
+        while safe_filename in taken:
             name_parts = original_name.rsplit(".", 1)
             if len(name_parts) == 2:
                 safe_filename = f"{name_parts[0]}_{counter}.{name_parts[1]}"
@@ -134,10 +222,16 @@ class AttachmentDownloader:
                 safe_filename = f"{original_name}_{counter}"
             counter += 1
 
+        taken.add(safe_filename)
         return safe_filename
 
     async def _get_working_asset_urls(
-        self, org: str, repo: str, issue_number: int, comment_id: str | None = None
+        self,
+        org: str,
+        repo: str,
+        issue_number: int,
+        comment_id: str | None = None,
+        client: httpx.AsyncClient | None = None,
     ) -> dict[str, str]:
         """Get working JWT URLs for GitHub assets by fetching HTML from API.
 
@@ -146,153 +240,204 @@ class AttachmentDownloader:
             repo: Repository name
             issue_number: Issue number
             comment_id: Comment ID if fetching comment, None for issue body
+            client: Shared HTTP client; a new one is created if not given
 
         Returns:
             Dict mapping asset IDs to working JWT URLs
         """
-        try:
-            async with httpx.AsyncClient() as client:
-                if comment_id:
-                    # Fetch comment HTML
-                    url = f"https://api.github.com/repos/{org}/{repo}/issues/comments/{comment_id}"
-                else:
-                    # Fetch issue HTML
-                    url = f"https://api.github.com/repos/{org}/{repo}/issues/{issue_number}"
-
-                response = await client.get(url, headers=self.headers)
-                response.raise_for_status()
-                data = response.json()
-
-                html_content = data.get("body_html", "")
-                if not html_content:
-                    return {}
-
-                # Extract JWT URLs from HTML
-                asset_mapping = {}
-                # Look for private-user-images URLs with JWT tokens
-                jwt_pattern = r'https://private-user-images\.githubusercontent\.com/[^"]+\?jwt=[^"]+'
-                jwt_urls = re.findall(jwt_pattern, html_content)
-
-                for jwt_url in jwt_urls:
-                    # Extract asset ID from the URL pattern
-                    # URLs look like: .../456579721-{uuid}.png?jwt=...
-                    # We want the UUID part: 5559e3a4-ea5f-4cd7-a0a0-a302b0b62612
-                    uuid_pat = (
-                        r"[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}"
-                    )
-                    asset_pattern = rf"/\d+-({uuid_pat})\."
-                    asset_match = re.search(asset_pattern, jwt_url)
-                    if asset_match:
-                        asset_id = asset_match.group(1)
-                        asset_mapping[asset_id] = jwt_url
+        if client is None:
+            async with self._create_client() as client:
+                return await self._get_working_asset_urls(
+                    org, repo, issue_number, comment_id, client
+                )
 
-                return asset_mapping
+        try:
+            if comment_id:
+                # Fetch comment HTML
+                url = f"https://api.github.com/repos/{org}/{repo}/issues/comments/{comment_id}"
+            else:
+                # Fetch issue HTML
+                url = f"https://api.github.com/repos/{org}/{repo}/issues/{issue_number}"
+
+            response = await client.get(url, headers=self.headers)
+            response.raise_for_status()
+            data = response.json()
+
+            html_content = data.get("body_html", "")
+            if not html_content:
+                return {}
+
+            # Extract JWT URLs from HTML
+            asset_mapping = {}
+            # Look for private-user-images URLs with JWT tokens
+            for jwt_match in _JWT_URL_RE.finditer(html_content):
+                jwt_url = jwt_match.group()
+                # Extract the asset UUID, e.g. 5559e3a4-ea5f-4cd7-a0a0-a302b0b62612
+                asset_match = _ASSET_UUID_RE.search(jwt_url)
+                if asset_match:
+                    asset_id = asset_match.group(1)
+                    asset_mapping[asset_id] = jwt_url
+
+            return asset_mapping
 
         except Exception as e:
             console.print(f"⚠️  Failed to fetch working asset URLs: {e}")
             return {}
 
     async def download_attachment(
-        self, attachment: GitHubAttachment, download_dir: Path
+        self,
+        attachment: GitHubAttachment,
+        download_dir: Path,
+        client: httpx.AsyncClient | None = None,
+        taken_names: set[str] | None = None,
+        log: list[str] | None = None,
     ) -> GitHubAttachment:
         """Download a single attachment.
 
         Args:
             attachment: GitHubAttachment object to download
             download_dir: Directory to save the attachment
+            client: Shared HTTP client; a new one is created if not given
+            taken_names: Filenames already used in download_dir, shared by
+                concurrent downloads into the same directory
+            log: List that progress messages are appended to, for the caller
+                to print; messages are printed on return if not given
 
         Returns:
             Updated GitHubAttachment object with download status
         """
-        try:
-            async with httpx.AsyncClient() as client:
-                # Determine headers - don't use Authorization for JWT-signed URLs
-                request_headers = {}
-                if "jwt=" not in attachment.original_url:
-                    # Only use Authorization header for non-JWT URLs
-                    request_headers = self.headers
-                else:
-                    # For JWT-signed URLs, use only basic headers
-                    request_headers = {
-                        "User-Agent": "github-issue-analysis/0.1.0",
-                        "Accept": "application/vnd.github.full+json",
-                    }
-
-                # First, get file info with HEAD request
-                head_response = await client.head(
-                    attachment.original_url,
-                    headers=request_headers,
-                    follow_redirects=True,
+        if log is None:
+            log = []
+            try:
+                return await self.download_attachment(
+                    attachment, download_dir, client, taken_names, log
+                )
+            finally:
+                if log:
+                    console.print("\n".join(log))
+
+        if client is None:
+            async with self._create_client() as client:
+                return await self.download_attachment(
+                    attachment, download_dir, client, taken_names, log
                 )
 
-                # Check file size
-                content_length = head_response.headers.get("content-length")
-                if content_length:
-                    size = int(content_length)
-                    if size > self.max_size_bytes:
-                        console.print(
-                            f"⚠️  Skipping {attachment.filename}: "
-                            f"File too large ({size / 1024 / 1024:.1f} MB > "
-                            f"{self.max_size_bytes / 1024 / 1024} MB)"
-                        )
-                        return attachment
-                    attachment.size = size
+        try:
+            # Determine headers - don't use Authorization for JWT-signed URLs
+            request_headers = {}
+            if "jwt=" not in attachment.original_url:
+                # Only use Authorization header for non-JWT URLs
+                request_headers = self.headers
+            else:
+                # For JWT-signed URLs, use only basic headers
+                request_headers = {
+                    "User-Agent": "github-issue-analysis/0.1.0",
+                    "Accept": "application/vnd.github.full+json",
+                }
+
+            # Stream the file straight from the GET; its headers carry the
+            # size and type, so no separate HEAD request is needed
+            async with client.stream(
+                "GET",
+                attachment.original_url,
+                headers=request_headers,
+                follow_redirects=True,
+            ) as response:
+                if response.is_error:
+                    # Read the body so the error handler can report it
+                    await response.aread()
+                response.raise_for_status()
+
+                # Check file size before reading the body
+                content_length = response.headers.get("content-length")
+                if content_length and int(content_length) > self.max_size_bytes:
+                    return self._skip_too_large(attachment, int(content_length), log)
 
                 # Get content type
-                content_type = head_response.headers.get("content-type")
+                content_type = response.headers.get("content-type")
                 if content_type:
                     attachment.content_type = content_type
 
-                # Download the file
-                response = await client.get(
-                    attachment.original_url,
-                    headers=request_headers,
-                    follow_redirects=True,
-                )
-                response.raise_for_status()
-
                 # Generate safe filename
                 safe_filename = self._generate_safe_filename(
-                    attachment.filename, download_dir
+                    attachment.filename, download_dir, taken_names
                 )
                 file_path = download_dir / safe_filename
-
-                # Save file
-                with open(file_path, "wb") as f:
-                    f.write(response.content)
-
-                # Update attachment info
-                attachment.local_path = str(file_path)
-                attachment.downloaded = True
-                attachment.size = len(response.content)
-
-                console.print(f"✅ Downloaded: {safe_filename}")
-                return attachment
+                part_path = download_dir / (safe_filename + _PARTIAL_SUFFIX)
+
+                # Write chunks as they arrive, enforcing the size limit for
+                # responses without a usable content-length. File I/O runs in
+                # a worker thread so other downloads keep receiving meanwhile.
+                # Only a complete file is moved to the final name; the
+                # partial one is removed however the download ends, including
+                # on cancellation or Ctrl-C.
+                size = 0
+                try:
+                    f = await asyncio.to_thread(open, part_path, "wb")
+                    with f:
+                        async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                            size += len(chunk)
+                            if size > self.max_size_bytes:
+                                break
+                            await asyncio.to_thread(f.write, chunk)
+                    if size <= self.max_size_bytes:
+                        await asyncio.to_thread(os.replace, part_path, file_path)
+                finally:
+                    part_path.unlink(missing_ok=True)
+
+                if size > self.max_size_bytes:
+                    return self._skip_too_large(attachment, size, log)
+
+            # Update attachment info
+            attachment.local_path = str(file_path)
+            attachment.downloaded = True
+            attachment.size = size
+
+            log.append(f"✅ Downloaded: {safe_filename}")
+            return attachment
 
         except httpx.HTTPStatusError as e:
-            console.print(
+            log.append(
                 f"❌ HTTP error downloading {attachment.filename}: "
                 f"{e.response.status_code} {e.response.reason_phrase}"
             )
-            console.print(f"   URL: {attachment.original_url}")
-            console.print(f"   Response: {e.response.text}")
+            log.append(f"   URL: {attachment.original_url}")
+            log.append(f"   Response: {e.response.text}")
             try:
-                console.print(f"   Headers: {dict(e.response.headers)}")
+                log.append(f"   Headers: {dict(e.response.headers)}")
             except (TypeError, AttributeError):
-                console.print(f"   Headers: {e.response.headers}")
+                log.append(f"   Headers: {e.response.headers}")
         except Exception as e:
-            console.print(f"❌ Error downloading {attachment.filename}: {e}")
+            log.append(f"❌ Error downloading {attachment.filename}: {e}")
 
         return attachment
 
+    def _skip_too_large(
+        self, attachment: GitHubAttachment, size: int, log: list[str]
+    ) -> GitHubAttachment:
+        """Report an attachment over the size limit and leave it undownloaded."""
+        log.append(
+            f"⚠️  Skipping {attachment.filename}: "
+            f"File too large ({size / 1024 / 1024:.1f} MB > "
+            f"{self.max_size_bytes / 1024 / 1024} MB)"
+        )
+        return attachment
+
     async def download_attachments(
-        self, attachments: list[GitHubAttachment], download_dir: Path
+        self,
+        attachments: list[GitHubAttachment],
+        download_dir: Path,
+        client: httpx.AsyncClient | None = None,
+        semaphore: asyncio.Semaphore | None = None,
     ) -> list[GitHubAttachment]:
         """Download multiple attachments concurrently.
 
         Args:
             attachments: List of GitHubAttachment objects to download
             download_dir: Directory to save attachments
+            client: Shared HTTP client; a new one is created if not given
+            semaphore: Shared limit on downloads in flight; one allowing
+                max_concurrent_downloads is created if not given
 
         Returns:
             List of updated GitHubAttachment objects
@@ -300,26 +445,87 @@ class AttachmentDownloader:
         if not attachments:
             return []
 
+        if client is None:
+            async with self._create_client() as client:
+                return await self.download_attachments(
+                    attachments, download_dir, client, semaphore
+                )
+
         # Create download directory
         download_dir.mkdir(parents=True, exist_ok=True)
 
-        # Download attachments concurrently
-        tasks = [
-            self.download_attachment(attachment, download_dir)
-            for attachment in attachments
-        ]
+        # List the directory once; names are reserved in this set as they are
+        # chosen, so concurrent downloads never pick the same filename
+        taken_names = set(os.listdir(download_dir))
+        manifest = _read_manifest(download_dir)
+        saved: dict[str, dict[str, Any]] = {}
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Messages from all downloads are printed together once they finish,
+        # rather than each download rendering to the console as it goes
+        log: list[str] = []
 
-        # Filter out exceptions and return successful downloads
-        updated_attachments = []
-        for result in results:
-            if isinstance(result, GitHubAttachment):
-                updated_attachments.append(result)
-            else:
-                console.print(f"❌ Download task failed: {result}")
+        # Download attachments concurrently, with a bounded number in flight
+        # so large issues don't exhaust sockets or file descriptors
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
+
+        async def bounded_download(attachment: GitHubAttachment) -> GitHubAttachment:
+            key = _source_key(attachment.original_url)
+            if self._reuse_saved(attachment, download_dir, manifest.get(key)):
+                return attachment
 
-        return updated_attachments
+            async with semaphore:
+                result = await self.download_attachment(
+                    attachment, download_dir, client, taken_names, log
+                )
+            if result.downloaded and result.local_path:
+                saved[key] = {
+                    "filename": Path(result.local_path).name,
+                    "size": result.size,
+                    "content_type": result.content_type,
+                }
+            return result
+
+        # download_attachment reports its own failures and always returns
+        # the attachment, so every result is a GitHubAttachment. Files that
+        # were saved are recorded even if the batch is cancelled.
+        try:
+            return await asyncio.gather(
+                *(bounded_download(attachment) for attachment in attachments)
+            )
+        finally:
+            if saved:
+                _write_manifest(download_dir, manifest | saved)
+            if log:
+                console.print("\n".join(log))
+
+    def _reuse_saved(
+        self,
+        attachment: GitHubAttachment,
+        download_dir: Path,
+        record: dict[str, Any] | None,
+    ) -> bool:
+        """Point attachment at the file a previous run saved from its URL.
+
+        Downloads only reach their final name once complete, so a recorded
+        file that still has its recorded size is whole. Returns False if
+        there is no such file and the attachment must be downloaded.
+        """
+        if not record:
+            return False
+        file_path = download_dir / str(record.get("filename", ""))
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            return False
+        if size != record.get("size") or attachment.size not in (None, size):
+            return False
+
+        attachment.local_path = str(file_path)
+        attachment.downloaded = True
+        attachment.size = size
+        attachment.content_type = record.get("content_type")
+        return True
 
     def process_issue_attachments(self, issue: GitHubIssue) -> GitHubIssue:
         """Process and detect all attachments in an issue.
@@ -330,27 +536,63 @@ class AttachmentDownloader:
         Returns:
             Updated GitHubIssue object with detected attachments
         """
-        all_attachments = []
-
-        # Process issue body
-        if issue.body:
-            body_attachments = self.detect_attachments(issue.body, "issue_body")
-            all_attachments.extend(body_attachments)
-
-        # Process comments
-        for comment in issue.comments:
-            if comment.body:
-                comment_attachments = self.detect_attachments(
-                    comment.body, f"comment_{comment.id}"
-                )
-                all_attachments.extend(comment_attachments)
-
-        # Update issue with attachments
-        issue.attachments = all_attachments
+        # Collect attachments from the issue body and every comment into a
+        # single list, without intermediate per-text lists
+        issue.attachments = list(
+            itertools.chain(
+                self._iter_attachments(issue.body or "", "issue_body"),
+                *(
+                    self._iter_attachments(comment.body or "", f"comment_{comment.id}")
+                    for comment in issue.comments
+                ),
+            )
+        )
         return issue
 
+    async def download_many_issues(
+        self, issues: list[tuple[GitHubIssue, str, str]], base_dir: Path
+    ) -> list[GitHubIssue]:
+        """Download attachments for several issues concurrently.
+
+        All issues share one HTTP client, one limit on downloads in flight and
+        one limit on asset-URL lookups, so a long download in one issue
+        doesn't hold up the others and lookups stay within GitHub's secondary
+        rate limits however many issues there are.
+
+        Args:
+            issues: (issue, org, repo) tuples for issues with detected attachments
+            base_dir: Base directory for attachments
+
+        Returns:
+            Updated GitHubIssue objects, in the order given
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
+        lookup_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_LOOKUPS)
+        async with self._create_client() as client:
+            return await asyncio.gather(
+                *(
+                    self.download_issue_attachments(
+                        issue,
+                        base_dir,
+                        org,
+                        repo,
+                        client,
+                        semaphore,
+                        lookup_semaphore,
+                    )
+                    for issue, org, repo in issues
+                )
+            )
+
     async def download_issue_attachments(
-        self, issue: GitHubIssue, base_dir: Path, org: str, repo: str
+        self,
+        issue: GitHubIssue,
+        base_dir: Path,
+        org: str,
+        repo: str,
+        client: httpx.AsyncClient | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+        lookup_semaphore: asyncio.Semaphore | None = None,
     ) -> GitHubIssue:
         """Download all attachments for an issue.
 
@@ -359,6 +601,10 @@ class AttachmentDownloader:
             base_dir: Base directory for attachments
             org: Organization name
             repo: Repository name
+            client: Shared HTTP client; a new one is created if not given
+            semaphore: Shared limit on downloads in flight
+            lookup_semaphore: Shared limit on asset-URL lookups in flight; one
+                allowing _MAX_CONCURRENT_LOOKUPS is created if not given
 
         Returns:
             Updated GitHubIssue object with downloaded attachments
@@ -366,20 +612,71 @@ class AttachmentDownloader:
         if not issue.attachments:
             return issue
 
-        # Create issue-specific directory
-        issue_dir = base_dir / f"{org}_{repo}_issue_{issue.number}"
+        if client is None:
+            # One client for the whole issue so lookups and downloads share
+            # pooled keep-alive connections
+            async with self._create_client() as client:
+                return await self.download_issue_attachments(
+                    issue, base_dir, org, repo, client, semaphore, lookup_semaphore
+                )
 
         console.print(
             f"📥 Downloading {len(issue.attachments)} attachments for "
             f"issue #{issue.number}"
         )
 
+        # The same URL is often quoted in several comments; each URL is
+        # downloaded once and the result shared with its duplicates
+        urls = [attachment.original_url for attachment in issue.attachments]
+        unique: dict[str, GitHubAttachment] = {}
+        for url, attachment in zip(urls, issue.attachments, strict=True):
+            unique.setdefault(url, attachment)
+
+        await self._download_issue_attachments(
+            list(unique.values()),
+            issue.number,
+            base_dir / f"{org}_{repo}_issue_{issue.number}",
+            org,
+            repo,
+            client,
+            semaphore,
+            lookup_semaphore or asyncio.Semaphore(_MAX_CONCURRENT_LOOKUPS),
+        )
+
+        issue.attachments = [
+            attachment
+            if attachment is unique[url]
+            else unique[url].model_copy(update={"source": attachment.source})
+            for url, attachment in zip(urls, issue.attachments, strict=True)
+        ]
+
+        # Count successful downloads
+        downloaded_count = sum(1 for att in issue.attachments if att.downloaded)
+        console.print(
+            f"✅ Downloaded {downloaded_count}/{len(issue.attachments)} attachments"
+        )
+
+        return issue
+
+    async def _download_issue_attachments(
+        self,
+        attachments: list[GitHubAttachment],
+        issue_number: int,
+        issue_dir: Path,
+        org: str,
+        repo: str,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore | None,
+        lookup_semaphore: asyncio.Semaphore,
+    ) -> list[GitHubAttachment]:
+        """Resolve asset URLs and download an issue's attachments with client."""
+
         # Get working JWT URLs for GitHub user-attachments assets
         # First collect all unique comment IDs that have attachments
         comment_ids_with_attachments = set()
         has_issue_body_attachments = False
 
-        for attachment in issue.attachments:
+        for attachment in attachments:
             if attachment.source == "issue_body":
                 has_issue_body_attachments = True
             elif attachment.source.startswith("comment_"):
@@ -387,20 +684,23 @@ class AttachmentDownloader:
                 comment_ids_with_attachments.add(comment_id)
 
         # Fetch JWT URLs for issue and all comments with attachments
-        jwt_url_mappings = {}
-
+        # concurrently; None stands for the issue body
+        lookup_ids: list[str | None] = [*sorted(comment_ids_with_attachments)]
         if has_issue_body_attachments:
-            issue_jwt_urls = await self._get_working_asset_urls(org, repo, issue.number)
-            jwt_url_mappings.update(issue_jwt_urls)
+            lookup_ids.insert(0, None)
 
-        for comment_id in comment_ids_with_attachments:
-            comment_jwt_urls = await self._get_working_asset_urls(
-                org, repo, issue.number, comment_id
-            )
-            jwt_url_mappings.update(comment_jwt_urls)
+        async def lookup(comment_id: str | None) -> dict[str, str]:
+            async with lookup_semaphore:
+                return await self._get_working_asset_urls(
+                    org, repo, issue_number, comment_id, client
+                )
+
+        jwt_url_mappings: dict[str, str] = {}
+        for mapping in await asyncio.gather(*map(lookup, lookup_ids)):
+            jwt_url_mappings.update(mapping)
 
         # Replace user-attachments asset URLs with working JWT URLs
-        for attachment in issue.attachments:
+        for attachment in attachments:
             if "user-attachments/assets/" in attachment.original_url:
                 # Extract asset ID from the original URL
                 asset_id = attachment.original_url.split("/")[-1]
@@ -409,17 +709,6 @@ class AttachmentDownloader:
                     attachment.original_url = jwt_url_mappings[asset_id]
 
         # Download attachments
-        updated_attachments = await self.download_attachments(
-            issue.attachments, issue_dir
+        return await self.download_attachments(
+            attachments, issue_dir, client, semaphore
         )
-
-        # Update issue with downloaded attachments
-        issue.attachments = updated_attachments
-
-        # Count successful downloads
-        downloaded_count = sum(1 for att in updated_attachments if att.downloaded)
-        console.print(
-            f"✅ Downloaded {downloaded_count}/{len(updated_attachments)} attachments"
-        )
-
-        return issue
@@ -1,7 +1,14 @@
 """GitHub API client using PyGitHub."""
 
+import itertools
 import os
+import random
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import IO, Any, TypeVar
 
 from github import Github
 from github.GithubException import RateLimitExceededException, UnknownObjectException
@@ -11,6 +18,7 @@ from github.Label import Label
 from github.NamedUser import NamedUser
 from github.Organization import Organization
 from github.Repository import Repository
+from pydantic import BaseModel
 from rich.console import Console
 
 from .attachments import AttachmentDownloader
@@ -19,6 +27,77 @@ from .search import build_github_query
 
 console = Console()
 
+# Search results converted at once; PyGitHub is synchronous, so each issue's
+# comment pages are fetched in a worker thread
+_MAX_CONCURRENT_CONVERSIONS = 16
+
+# Largest page size the REST API allows (PyGitHub defaults to 30)
+_PAGE_SIZE = 100
+
+# Retries after GitHub rate-limits a call, and the cap on computed backoff
+_MAX_RATE_LIMIT_RETRIES = 5
+_MAX_RETRY_DELAY = 60.0
+
+# Issues kept by get_issue for revalidation; the least recently used one is
+# dropped beyond this, so long runs don't hold every issue fetched
+_ISSUE_CACHE_SIZE = 256
+
+# Requests left in a rate-limit bucket below which calls wait for its reset
+_RATE_LIMIT_RESERVE = 10
+
+# GitHub allows at most 30 search requests a minute, against thousands an
+# hour for the core REST API. PyGitHub only keeps the rate-limit headers of
+# the latest response and not which resource they are for, so the size of
+# the limit tells which bucket they describe.
+_SEARCH_LIMIT_MAX = 30
+
+
+def _rate_limit_resource(limit: int) -> str:
+    """Rate-limit bucket ("search" or "core") with the given request limit."""
+    return "search" if limit <= _SEARCH_LIMIT_MAX else "core"
+
+
+_T = TypeVar("_T")
+_M = TypeVar("_M", bound=BaseModel)
+
+
+def _rate_limit_delay(error: RateLimitExceededException, attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited call.
+
+    GitHub's Retry-After header takes precedence, then the reset time of an
+    exhausted primary limit. Otherwise the delay grows exponentially with
+    the attempt number, with jitter.
+    """
+    headers = error.headers or {}
+    retry_after = headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    reset = headers.get("x-ratelimit-reset")
+    if headers.get("x-ratelimit-remaining") == "0" and reset is not None:
+        try:
+            return max(0.0, float(reset) - time.time() + 1)
+        except ValueError:
+            pass
+    return min(_MAX_RETRY_DELAY, 2.0**attempt) * random.uniform(0.5, 1.0)
+
+
+def _retry_on_rate_limit(operation: Callable[[], _T], message: str) -> _T:
+    """Run operation, waiting and retrying while GitHub rate-limits it."""
+    attempt = 0
+    while True:
+        try:
+            return operation()
+        except RateLimitExceededException as e:
+            if attempt >= _MAX_RATE_LIMIT_RETRIES:
+                raise
+            delay = _rate_limit_delay(e, attempt)
+            console.print(f"{message}, waiting {delay:.0f}s...")
+            time.sleep(delay)
+            attempt += 1
+
 
 class GitHubClient:
     """GitHub API client with rate limiting and authentication."""
@@ -36,42 +115,115 @@ class GitHubClient:
                 "GitHub token is required. Set GITHUB_TOKEN environment variable."
             )
 
-        self.github = Github(self.token)
+        # PyGitHub keeps one requests session per client; size its connection
+        # pool for the conversion threads so each keeps a warm connection.
+        # Search and comment pages use the API's maximum page size.
+        self.github = Github(
+            self.token,
+            per_page=_PAGE_SIZE,
+            pool_size=_MAX_CONCURRENT_CONVERSIONS,
+        )
+
+        # PyGitHub attributes are already typed, so validating them again can
+        # be skipped for trusted runs over large result sets
+        self._skip_validation = os.getenv("GITHUB_SKIP_VALIDATION") == "1"
+
+        # Users and labels repeat across issues and comments, so each distinct
+        # one is converted once and shared
+        self._users: dict[tuple[str, int], GitHubUser] = {}
+        self._labels: dict[tuple[str, str, str | None], GitHubLabel] = {}
+
+        # Issues recently fetched by get_issue, revalidated with their ETag,
+        # in least recently used order
+        self._issue_cache: OrderedDict[
+            tuple[str, str, int], tuple[Issue, GitHubIssue]
+        ] = OrderedDict()
+
+        # Last seen (remaining, reset time) for each rate-limit bucket
+        self._rate_limits: dict[str, tuple[int, int]] = {}
+
+    def close(self) -> None:
+        """Close the underlying HTTP connections."""
+        self.github.close()
 
-    def _check_rate_limit(self) -> None:
-        """Check rate limit and sleep if necessary."""
+    def __enter__(self) -> "GitHubClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _check_rate_limit(self, resource: str = "core") -> None:
+        """Check the rate limit of a bucket and sleep if necessary.
+
+        Reads the rate-limit headers PyGitHub recorded from the last response,
+        so the check makes no request. Those headers are kept per bucket, so
+        a nearly spent search budget doesn't hold up core API calls. Nothing
+        is known about a bucket before its first response.
+        """
         try:
-            rate_limit = self.github.get_rate_limit()
-            remaining = rate_limit.rate.remaining
+            requester = self.github.requester
+            remaining, limit = requester.rate_limiting
+            if limit >= 0:
+                self._rate_limits[_rate_limit_resource(limit)] = (
+                    remaining,
+                    requester.rate_limiting_resettime,
+                )
+
+            budget = self._rate_limits.get(resource)
+            if budget is None:
+                return
+            remaining, reset_time = budget
             console.print(f"GitHub API rate limit: {remaining} requests remaining")
 
-            if remaining < 10:
-                reset_time = rate_limit.rate.reset.timestamp()
+            if remaining < _RATE_LIMIT_RESERVE:
+                # A reset time already passed means the bucket was refilled
                 sleep_time = reset_time - time.time() + 1
-                console.print(
-                    f"Rate limit low, sleeping for {sleep_time:.1f} seconds..."
-                )
-                time.sleep(sleep_time)
+                if sleep_time > 0:
+                    console.print(
+                        f"Rate limit low, sleeping for {sleep_time:.1f} seconds..."
+                    )
+                    time.sleep(sleep_time)
 
         except Exception:
             # Silently continue if rate limit check fails - it's not critical
             pass
 
+    def _build(self, model: type[_M], **fields: Any) -> _M:
+        """Create a model, without validation if GITHUB_SKIP_VALIDATION=1."""
+        if self._skip_validation:
+            return model.model_construct(**fields)
+        return model(**fields)
+
     def _convert_user(self, github_user: NamedUser | Organization) -> GitHubUser:
-        """Convert PyGitHub user to our model."""
-        return GitHubUser(login=github_user.login, id=github_user.id)
+        """Convert PyGitHub user to our model, reusing an earlier conversion."""
+        key = (github_user.login, github_user.id)
+        user = self._users.get(key)
+        if user is None:
+            user = self._users.setdefault(
+                key, self._build(GitHubUser, login=key[0], id=key[1])
+            )
+        return user
 
     def _convert_label(self, github_label: Label) -> GitHubLabel:
-        """Convert PyGitHub label to our model."""
-        return GitHubLabel(
-            name=github_label.name,
-            color=github_label.color,
-            description=github_label.description,
-        )
+        """Convert PyGitHub label to our model, reusing an earlier conversion."""
+        key = (github_label.name, github_label.color, github_label.description)
+        label = self._labels.get(key)
+        if label is None:
+            label = self._labels.setdefault(
+                key,
+                self._build(GitHubLabel, name=key[0], color=key[1], description=key[2]),
+            )
+        return label
 
     def _convert_comment(self, github_comment: IssueComment) -> GitHubComment:
         """Convert PyGitHub comment to our model."""
-        return GitHubComment(
+        return self._build(
+            GitHubComment,
             id=github_comment.id,
             user=self._convert_user(github_comment.user),
             body=github_comment.body,
@@ -79,27 +231,37 @@ class GitHubClient:
             updated_at=github_comment.updated_at,
         )
 
-    def _convert_issue(self, github_issue: Issue) -> GitHubIssue:
-        """Convert PyGitHub issue to our model."""
+    def _convert_issue(
+        self, github_issue: Issue, max_comments: int | None = None
+    ) -> GitHubIssue:
+        """Convert PyGitHub issue to our model.
+
+        Comment pages stop being fetched once max_comments comments are read.
+        """
         labels = [self._convert_label(label) for label in github_issue.labels]
 
-        # Extract repository name from the issue's repository
-        repository_name = None
-        if hasattr(github_issue, "repository") and github_issue.repository:
-            repository_name = github_issue.repository.name
+        # Extract repository name from the issue's repository URL, which is
+        # part of every issue payload. Reading github_issue.repository on a
+        # search result would fetch both the full issue and the repository.
+        repository_url = github_issue.repository_url
+        repository_name = repository_url.rsplit("/", 1)[-1] if repository_url else None
 
         # Fetch comments for the issue
         comments = []
         try:
-            for comment in github_issue.get_comments():
+            for comment in itertools.islice(github_issue.get_comments(), max_comments):
                 comments.append(self._convert_comment(comment))
+        except RateLimitExceededException:
+            # Let the caller wait and retry rather than keep partial comments
+            raise
         except Exception as e:
             console.print(
                 f"Warning: Could not fetch comments for issue "
                 f"#{github_issue.number}: {e}"
             )
 
-        return GitHubIssue(
+        return self._build(
+            GitHubIssue,
             number=github_issue.number,
             title=github_issue.title,
             body=github_issue.body,
@@ -112,6 +274,61 @@ class GitHubClient:
             repository_name=repository_name,
         )
 
+    def _convert_issues(
+        self,
+        github_issues: Iterable[Issue],
+        limit: int,
+        max_comments: int | None = None,
+        sink: IO[str] | None = None,
+    ) -> list[GitHubIssue]:
+        """Convert up to limit issues, fetching their comments concurrently.
+
+        Issues that fail to convert are reported and left out; the rest keep
+        their search order.
+        """
+        selected = list(itertools.islice(github_issues, limit))
+
+        def convert(github_issue: Issue) -> GitHubIssue | None:
+            try:
+                issue = _retry_on_rate_limit(
+                    lambda: self._convert_issue(github_issue, max_comments),
+                    "Rate limit exceeded",
+                )
+            except Exception as e:
+                console.print(f"Error processing issue #{github_issue.number}: {e}")
+                return None
+            console.print(
+                f"Processed issue #{github_issue.number}: {github_issue.title}"
+            )
+            return issue
+
+        return self._run_concurrently(convert, selected, sink)
+
+    def _run_concurrently(
+        self,
+        func: Callable[[_T], GitHubIssue | None],
+        items: list[_T],
+        sink: IO[str] | None = None,
+    ) -> list[GitHubIssue]:
+        """Apply func to items in worker threads, keeping order and dropping None.
+
+        With a sink, each issue is written to it as a JSON line as soon as it
+        is next in order, and an empty list is returned.
+        """
+        if not items:
+            return []
+
+        workers = min(_MAX_CONCURRENT_CONVERSIONS, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(func, items)
+            issues = (issue for issue in results if issue is not None)
+            if sink is None:
+                return list(issues)
+            # Writes stay on this thread, so lines are never interleaved
+            for issue in issues:
+                sink.write(issue.model_dump_json() + "\n")
+        return []
+
     def get_repository(self, org: str, repo: str) -> Repository:
         """Get repository object."""
         try:
@@ -120,13 +337,62 @@ class GitHubClient:
             raise ValueError(f"Repository {org}/{repo} not found")
 
     def get_issue(self, org: str, repo: str, issue_number: int) -> GitHubIssue:
-        """Get a specific issue with all its details."""
+        """Get a specific issue with all its details.
+
+        Each call returns a new GitHubIssue, so callers may modify it.
+        """
+        self._check_rate_limit()
+
+        key = (org, repo, issue_number)
+        cached = self._issue_cache.get(key)
+        if cached is not None:
+            self._issue_cache.move_to_end(key)
+            github_issue, issue = cached
+            # A 304 answer to the conditional GET costs no rate limit; new
+            # comments change the issue's ETag, so the comments are current too
+            if not github_issue.update():
+                return issue.model_copy(deep=True)
+        else:
+            # A lazy repository only routes the issue GET, saving the repo GET
+            repository = self.github.get_repo(f"{org}/{repo}", lazy=True)
+            github_issue = repository.get_issue(issue_number)
+
+        issue = self._convert_issue(github_issue)
+        self._issue_cache[key] = (github_issue, issue)
+        if len(self._issue_cache) > _ISSUE_CACHE_SIZE:
+            self._issue_cache.popitem(last=False)
+        return issue.model_copy(deep=True)
+
+    def get_issues_batch(
+        self, org: str, repo: str, numbers: list[int]
+    ) -> list[GitHubIssue]:
+        """Get several issues from one repository with all their details.
+
+        The repository is looked up once and the issues are fetched
+        concurrently. Duplicate numbers are fetched once; issues that cannot
+        be fetched are reported and left out.
+
+        Args:
+            org: Organization name
+            repo: Repository name
+            numbers: Issue numbers to fetch
+
+        Returns:
+            List of GitHubIssue objects in the order of numbers
+        """
         self._check_rate_limit()
 
-        repository = self.get_repository(org, repo)
-        github_issue = repository.get_issue(issue_number)
+        # A lazy repository only routes the issue GETs, saving the repo GET
+        repository = self.github.get_repo(f"{org}/{repo}", lazy=True)
+
+        def fetch(issue_number: int) -> GitHubIssue | None:
+            try:
+                return self._convert_issue(repository.get_issue(issue_number))
+            except Exception as e:
+                console.print(f"Error fetching issue #{issue_number}: {e}")
+                return None
 
-        return self._convert_issue(github_issue)
+        return self._run_concurrently(fetch, list(dict.fromkeys(numbers)))
 
     def search_issues(
         self,
@@ -139,6 +405,8 @@ class GitHubClient:
         created_before: str | None = None,
         updated_after: str | None = None,
         updated_before: str | None = None,
+        max_comments: int | None = None,
+        sink: IO[str] | None = None,
     ) -> list[GitHubIssue]:
         """Search for issues in a repository.
 
@@ -152,11 +420,14 @@ class GitHubClient:
             created_before: ISO date string to filter issues created before this date
             updated_after: ISO date string to filter issues updated after this date
             updated_before: ISO date string to filter issues updated before this date
+            max_comments: Maximum number of comments to fetch per issue (all if None)
+            sink: Text stream to write each issue to as a JSON line instead of
+                keeping the issues in memory
 
         Returns:
-            List of GitHubIssue objects
+            List of GitHubIssue objects, or an empty list if sink is given
         """
-        self._check_rate_limit()
+        self._check_rate_limit("search")
 
         # Build search query using the centralized function
         query = build_github_query(
@@ -171,41 +442,16 @@ class GitHubClient:
         )
         console.print(f"Searching with query: {query}")
 
-        try:
-            # Use GitHub search API
-            issues = self.github.search_issues(query)
-
-            # Convert to our models, limiting results
-            result_issues = []
-            for i, github_issue in enumerate(issues):
-                if i >= limit:
-                    break
-
-                try:
-                    result_issues.append(self._convert_issue(github_issue))
-                    console.print(
-                        f"Processed issue #{github_issue.number}: {github_issue.title}"
-                    )
-                except Exception as e:
-                    console.print(f"Error processing issue #{github_issue.number}: {e}")
-                    continue
+        # Use GitHub search API. The paginated list keeps the pages it has
+        # fetched, so a retry after a rate limit resumes where it stopped.
+        issues = self.github.search_issues(query)
 
-            return result_issues
+        def search() -> list[GitHubIssue]:
+            # Convert a limited number of results
+            return self._convert_issues(issues, limit, max_comments, sink)
 
-        except RateLimitExceededException:
-            console.print("Rate limit exceeded, waiting...")
-            time.sleep(60)
-            return self.search_issues(
-                org=org,
-                repo=repo,
-                labels=labels,
-                state=state,
-                limit=limit,
-                created_after=created_after,
-                created_before=created_before,
-                updated_after=updated_after,
-                updated_before=updated_before,
-            )
+        try:
+            return _retry_on_rate_limit(search, "Rate limit exceeded")
         except Exception as e:
             console.print(f"Error searching issues: {e}")
             raise
@@ -221,6 +467,8 @@ class GitHubClient:
         updated_after: str | None = None,
         updated_before: str | None = None,
         excluded_repos: list[str] | None = None,
+        max_comments: int | None = None,
+        sink: IO[str] | None = None,
     ) -> list[GitHubIssue]:
         """Search for issues across all repositories in an organization.
 
@@ -234,11 +482,14 @@ class GitHubClient:
             updated_after: ISO date string to filter issues updated after this date
             updated_before: ISO date string to filter issues updated before this date
             excluded_repos: List of repository names to exclude
+            max_comments: Maximum number of comments to fetch per issue (all if None)
+            sink: Text stream to write each issue to as a JSON line instead of
+                keeping the issues in memory
 
         Returns:
-            List of GitHubIssue objects
+            List of GitHubIssue objects, or an empty list if sink is given
         """
-        self._check_rate_limit()
+        self._check_rate_limit("search")
 
         # Import here to avoid circular import
         from .search import build_organization_query
@@ -256,41 +507,16 @@ class GitHubClient:
         )
         console.print(f"Searching with query: {query}")
 
-        try:
-            # Use GitHub search API
-            issues = self.github.search_issues(query)
+        # Use GitHub search API. The paginated list keeps the pages it has
+        # fetched, so a retry after a rate limit resumes where it stopped.
+        issues = self.github.search_issues(query)
 
-            # Convert to our models, limiting results
-            result_issues = []
-            for i, github_issue in enumerate(issues):
-                if i >= limit:
-                    break
+        def search() -> list[GitHubIssue]:
+            # Convert a limited number of results
+            return self._convert_issues(issues, limit, max_comments, sink)
 
-                try:
-                    result_issues.append(self._convert_issue(github_issue))
-                    console.print(
-                        f"Processed issue #{github_issue.number}: {github_issue.title}"
-                    )
-                except Exception as e:
-                    console.print(f"Error processing issue #{github_issue.number}: {e}")
-                    continue
-
-            return result_issues
-
-        except RateLimitExceededException:
-            console.print("Rate limit exceeded, waiting...")
-            time.sleep(60)
-            return self.search_organization_issues(
-                org=org,
-                labels=labels,
-                state=state,
-                limit=limit,
-                created_after=created_after,
-                created_before=created_before,
-                updated_after=updated_after,
-                updated_before=updated_before,
-                excluded_repos=excluded_repos,
-            )
+        try:
+            return _retry_on_rate_limit(search, "Rate limit exceeded")
         except Exception as e:
             console.print(f"Error searching organization issues: {e}")
             raise
@@ -329,7 +555,7 @@ class GitHubClient:
         """
         self._check_rate_limit()
 
-        try:
+        def update() -> bool:
             repository = self.get_repository(org, repo)
             github_issue = repository.get_issue(issue_number)
 
@@ -339,12 +565,12 @@ class GitHubClient:
             console.print(f"Updated labels for issue #{issue_number}: {labels}")
             return True
 
+        try:
+            return _retry_on_rate_limit(
+                update, "Rate limit exceeded during label update"
+            )
         except UnknownObjectException:
             raise ValueError(f"Issue #{issue_number} not found in {org}/{repo}")
-        except RateLimitExceededException:
-            console.print("Rate limit exceeded during label update, waiting...")
-            time.sleep(60)
-            return self.update_issue_labels(org, repo, issue_number, labels)
         except Exception as e:
             console.print(f"Error updating labels for issue #{issue_number}: {e}")
             raise
@@ -369,7 +595,7 @@ class GitHubClient:
         """
         self._check_rate_limit()
 
-        try:
+        def add_comment() -> bool:
             repository = self.get_repository(org, repo)
             github_issue = repository.get_issue(issue_number)
 
@@ -379,12 +605,12 @@ class GitHubClient:
             console.print(f"Added comment to issue #{issue_number}")
             return True
 
+        try:
+            return _retry_on_rate_limit(
+                add_comment, "Rate limit exceeded during comment creation"
+            )
         except UnknownObjectException:
             raise ValueError(f"Issue #{issue_number} not found in {org}/{repo}")
-        except RateLimitExceededException:
-            console.print("Rate limit exceeded during comment creation, waiting...")
-            time.sleep(60)
-            return self.add_issue_comment(org, repo, issue_number, comment)
         except Exception as e:
             console.print(f"Error adding comment to issue #{issue_number}: {e}")
             raise
@@ -406,18 +632,18 @@ class GitHubClient:
         """
         self._check_rate_limit()
 
-        try:
+        def fetch_labels() -> list[str]:
             repository = self.get_repository(org, repo)
             github_issue = repository.get_issue(issue_number)
 
             return [label.name for label in github_issue.labels]
 
+        try:
+            return _retry_on_rate_limit(
+                fetch_labels, "Rate limit exceeded during label fetch"
+            )
         except UnknownObjectException:
             raise ValueError(f"Issue #{issue_number} not found in {org}/{repo}")
-        except RateLimitExceededException:
-            console.print("Rate limit exceeded during label fetch, waiting...")
-            time.sleep(60)
-            return self.get_issue_labels(org, repo, issue_number)
         except Exception as e:
             console.print(f"Error fetching labels for issue #{issue_number}: {e}")
             raise
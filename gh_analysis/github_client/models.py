@@ -7,7 +7,7 @@ API Reference: https://docs.github.com/en/rest/issues
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class GitHubUser(BaseModel):
@@ -17,6 +17,9 @@ class GitHubUser(BaseModel):
     API Reference: https://docs.github.com/en/rest/users/users
     """
 
+    # Frozen because the client shares one instance per user across issues
+    model_config = ConfigDict(frozen=True)
+
     login: str = Field(..., description="GitHub username/login (string)")
     id: int = Field(..., description="Unique user identifier (integer)")
 
@@ -28,6 +31,9 @@ class GitHubLabel(BaseModel):
     API Reference: https://docs.github.com/en/rest/issues/labels
     """
 
+    # Frozen because the client shares one instance per label across issues
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Name of the label (string)")
     color: str = Field(
         ..., description="Hexadecimal color code without leading # (string)"
@@ -1,5 +1,7 @@
 """GitHub search functionality and query building."""
 
+import functools
+import itertools
 from typing import TYPE_CHECKING
 
 from .models import GitHubIssue
@@ -18,24 +20,60 @@ def build_exclusion_list(
         exclude_repos: Comma-separated string of repository names to exclude
 
     Returns:
-        List of unique repository names to exclude, with empty strings filtered out
+        List of unique repository names to exclude in first-seen order, with
+        empty strings filtered out
 
     Example:
         >>> build_exclusion_list(["repo1", "repo2"], "repo3,repo4")
         ["repo1", "repo2", "repo3", "repo4"]
     """
-    exclusions = []
+    exclusions = itertools.chain(
+        # Individual exclusions
+        exclude_repo or (),
+        # Comma-separated exclusions
+        (repo.strip() for repo in (exclude_repos or "").split(",")),
+    )
 
-    # Add individual exclusions
-    if exclude_repo:
-        exclusions.extend(exclude_repo)
+    # Remove duplicates and empty strings, keeping the order stable so the
+    # same arguments always build the same query
+    return list(dict.fromkeys(filter(None, exclusions)))
 
-    # Add comma-separated exclusions
-    if exclude_repos:
-        exclusions.extend([repo.strip() for repo in exclude_repos.split(",")])
 
-    # Remove duplicates and empty strings
-    return list(set(filter(None, exclusions)))
+@functools.lru_cache(maxsize=512)
+def _build_query(
+    scope: str,
+    org: str,
+    labels: tuple[str, ...],
+    state: str,
+    excluded_repos: tuple[str, ...],
+    created_after: str | None,
+    created_before: str | None,
+    updated_after: str | None,
+    updated_before: str | None,
+) -> str:
+    """Build and cache a search query; the public builders delegate here.
+
+    Takes tuples rather than lists so identical queries, which are commonly
+    requested again, hit the cache.
+    """
+    return " ".join(
+        filter(
+            None,
+            (
+                scope,
+                "is:issue",
+                f"state:{state}" if state != "all" else None,
+                *(f"label:{label}" for label in labels),
+                # Repository exclusions
+                *(f"-repo:{org}/{repo}" for repo in excluded_repos),
+                # Date filtering
+                f"created:>{created_after}" if created_after else None,
+                f"created:<{created_before}" if created_before else None,
+                f"updated:>{updated_after}" if updated_after else None,
+                f"updated:<{updated_before}" if updated_before else None,
+            ),
+        )
+    )
 
 
 def build_organization_query(
@@ -70,31 +108,17 @@ def build_organization_query(
         "org:myorg is:issue state:closed label:bug -repo:myorg/private-repo " \\
         "created:>2024-01-01"
     """
-    query_parts = [f"org:{org}", "is:issue"]
-
-    if state != "all":
-        query_parts.append(f"state:{state}")
-
-    if labels:
-        for label in labels:
-            query_parts.append(f"label:{label}")
-
-    # Add repository exclusions
-    if excluded_repos:
-        for repo in excluded_repos:
-            query_parts.append(f"-repo:{org}/{repo}")
-
-    # Date filtering
-    if created_after:
-        query_parts.append(f"created:>{created_after}")
-    if created_before:
-        query_parts.append(f"created:<{created_before}")
-    if updated_after:
-        query_parts.append(f"updated:>{updated_after}")
-    if updated_before:
-        query_parts.append(f"updated:<{updated_before}")
-
-    return " ".join(query_parts)
+    return _build_query(
+        f"org:{org}",
+        org,
+        tuple(labels or ()),
+        state,
+        tuple(excluded_repos or ()),
+        created_after,
+        created_before,
+        updated_after,
+        updated_before,
+    )
 
 
 class GitHubSearcher:
@@ -161,6 +185,21 @@ class GitHubSearcher:
         """
         return self.client.get_issue(org, repo, issue_number)
 
+    def get_issues_batch(
+        self, org: str, repo: str, numbers: list[int]
+    ) -> list[GitHubIssue]:
+        """Get several issues from one repository with all details.
+
+        Args:
+            org: Organization name
+            repo: Repository name
+            numbers: Issue numbers to fetch
+
+        Returns:
+            List of GitHubIssue objects in the order of numbers
+        """
+        return self.client.get_issues_batch(org, repo, numbers)
+
     def search_organization_issues(
         self,
         org: str,
@@ -234,26 +273,17 @@ def build_github_query(
         "repo:test-org/test-repo is:issue state:open label:bug " \\
         "created:>2024-01-01 created:<2024-12-31"
     """
-    query_parts = [f"repo:{org}/{repo}", "is:issue"]
-
-    if state != "all":
-        query_parts.append(f"state:{state}")
-
-    if labels:
-        for label in labels:
-            query_parts.append(f"label:{label}")
-
-    # Date filtering
-    if created_after:
-        query_parts.append(f"created:>{created_after}")
-    if created_before:
-        query_parts.append(f"created:<{created_before}")
-    if updated_after:
-        query_parts.append(f"updated:>{updated_after}")
-    if updated_before:
-        query_parts.append(f"updated:<{updated_before}")
-
-    return " ".join(query_parts)
+    return _build_query(
+        f"repo:{org}/{repo}",
+        org,
+        tuple(labels or ()),
+        state,
+        (),
+        created_after,
+        created_before,
+        updated_after,
+        updated_before,
+    )
 
 
 def build_github_organization_query(
@@ -283,23 +313,14 @@ def build_github_organization_query(
         >>> build_github_organization_query("test-org", ["bug"], "open", "2024-01-01")
         "org:test-org is:issue state:open label:bug created:>2024-01-01"
     """
-    query_parts = [f"org:{org}", "is:issue"]
-
-    if state != "all":
-        query_parts.append(f"state:{state}")
-
-    if labels:
-        for label in labels:
-            query_parts.append(f"label:{label}")
-
-    # Date filtering
-    if created_after:
-        query_parts.append(f"created:>{created_after}")
-    if created_before:
-        query_parts.append(f"created:<{created_before}")
-    if updated_after:
-        query_parts.append(f"updated:>{updated_after}")
-    if updated_before:
-        query_parts.append(f"updated:<{updated_before}")
-
-    return " ".join(query_parts)
+    return _build_query(
+        f"org:{org}",
+        org,
+        tuple(labels or ()),
+        state,
+        (),
+        created_after,
+        created_before,
+        updated_after,
+        updated_before,
+    )
@@ -5,6 +5,7 @@ from .models import (
     RecommendationFilter,
     RecommendationMetadata,
     RecommendationStatus,
+    RecommendationView,
     ReviewAction,
 )
 from .review_session import ReviewSession
@@ -14,6 +15,7 @@ __all__ = [
     "RecommendationManager",
     "RecommendationMetadata",
     "RecommendationStatus",
+    "RecommendationView",
     "RecommendationFilter",
     "ReviewAction",
     "StatusTracker",
@@ -1,13 +1,86 @@
 """Central coordinator for recommendation management operations."""
 
-import json
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, NotRequired, TypedDict
 
-from ..ai.models import ProductLabelingResponse
+from pydantic import TypeAdapter
+
+from ..ai.models import ProductLabel
 from .models import RecommendationFilter, RecommendationMetadata, RecommendationStatus
-from .status_tracker import StatusTracker
+from .status_tracker import StatusTracker, filename_prefix
+
+# Statuses for which an issue has already been analyzed and should be skipped
+REVIEWED_STATUSES = frozenset(
+    {
+        RecommendationStatus.PENDING,
+        RecommendationStatus.NO_CHANGE_NEEDED,
+        RecommendationStatus.APPROVED,
+        RecommendationStatus.REJECTED,
+    }
+)
+
+
+class _RecommendedLabel(TypedDict):
+    label: ProductLabel
+
+
+class _LabelAssessment(TypedDict):
+    label: str
+    correct: bool
+
+
+class _Analysis(TypedDict):
+    """The ProductLabelingResponse fields used to build recommendations."""
+
+    recommendation_confidence: float
+    reasoning: str
+    recommended_labels: list[_RecommendedLabel]
+    current_labels_assessment: list[_LabelAssessment]
+    root_cause_analysis: NotRequired[str]
+    root_cause_confidence: NotRequired[float | None]
+
+
+class _ResultFile(TypedDict):
+    """The part of an AI result file used to build recommendations."""
+
+    analysis: _Analysis
+
+
+# Validates result files straight from JSON bytes; other keys, including the
+# unused parts of the analysis such as summaries and image analyses, are
+# skipped rather than built into models
+_RESULT_FILE_ADAPTER = TypeAdapter(_ResultFile)
+
+
+class _IssueLabel(TypedDict):
+    name: str
+
+
+class _IssueLabels(TypedDict, total=False):
+    labels: list[_IssueLabel]
+
+
+class _IssueFileLabels(TypedDict, total=False):
+    """Label names of a stored issue, wrapped under 'issue' or at top level."""
+
+    issue: _IssueLabels
+    labels: list[_IssueLabel]
+
+
+# Reads only the labels out of an issue file; bodies and comments are never
+# turned into Python objects
+_ISSUE_LABELS_ADAPTER = TypeAdapter(_IssueFileLabels)
+
+# Result files processed at once by discover_recommendations
+_MAX_DISCOVERY_WORKERS = 16
+
+# {org}_{repo}_issue_{number}_product-labeling; GitHub org names cannot
+# contain underscores, but repository names can
+_RESULT_FILE_STEM_RE = re.compile(r"([^_]+)_(.+)_issue_(\d+)_product-labeling")
 
 
 class RecommendationManager:
@@ -22,133 +95,172 @@ class RecommendationManager:
     def discover_recommendations(
         self, force_refresh: bool = False
     ) -> list[RecommendationMetadata]:
-        """Scan for new AI results and create recommendation metadata."""
-        recommendations = []
+        """Scan for new AI results and create recommendation metadata.
 
+        Result files are read in a thread pool, since the work is mostly
+        file reads. New statuses are saved afterwards from this thread, as
+        the status tracker's cache is not shared across threads, with their
+        index rows written together.
+        """
         # Scan results directory for AI analysis files
-        for result_file in self.results_dir.glob("*_product-labeling.json"):
-            try:
-                # Parse filename to extract org, repo, issue_number
-                parts = result_file.stem.split("_")
-                if len(parts) >= 4:
-                    org = parts[0]
-                    repo = parts[1]
-                    issue_number = int(parts[3])
-
-                    # Check if we already have status for this recommendation
-                    existing = self.status_tracker.get_recommendation(
-                        org, repo, issue_number
-                    )
-                    if existing and not force_refresh:
-                        recommendations.append(existing)
-                        continue
-
-                    # Load AI result
-                    with open(result_file) as f:
-                        result_data = json.load(f)
-
-                    ai_analysis = ProductLabelingResponse.model_validate(
-                        result_data["analysis"]
-                    )
+        result_files = list(self.results_dir.glob("*_product-labeling.json"))
+        if not result_files:
+            return []
+
+        # Existing statuses, read in one directory pass
+        existing_index = self.status_tracker.index()
+
+        workers = min(_MAX_DISCOVERY_WORKERS, len(result_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    lambda result_file: self._process_result_file(
+                        result_file, force_refresh, existing_index
+                    ),
+                    result_files,
+                )
+            )
 
-                    # Find corresponding issue file
-                    issue_file = (
-                        self.issues_dir / f"{org}_{repo}_issue_{issue_number}.json"
-                    )
-                    if not issue_file.exists():
+        recommendations = []
+        with self.status_tracker.batched_saves():
+            for result_file, result in zip(result_files, results, strict=True):
+                if result is None:
+                    continue
+                recommendation, needs_save = result
+                if needs_save:
+                    try:
+                        self.status_tracker.save_recommendation(recommendation)
+                    except Exception as e:
+                        print(f"Error processing {result_file}: {e}")
                         continue
+                recommendations.append(recommendation)
+        return recommendations
 
-                    # Create recommendation metadata
-                    recommendation = self._create_recommendation_metadata(
-                        org,
-                        repo,
-                        issue_number,
-                        ai_analysis,
-                        str(result_file),
-                        str(issue_file),
-                    )
-
-                    # Check if this represents an actual change
-                    if not self.is_recommendation_change(recommendation):
-                        recommendation.status = RecommendationStatus.NO_CHANGE_NEEDED
-                        recommendation.status_updated_at = datetime.now()
-
-                    # Save status if new or force refresh
-                    if not existing:
-                        self.status_tracker.save_recommendation(recommendation)
-                    elif force_refresh:
-                        # Update existing recommendation with new data
-                        if self.is_recommendation_change(recommendation):
-                            recommendation.status = RecommendationStatus.PENDING
-                        else:
-                            recommendation.status = (
-                                RecommendationStatus.NO_CHANGE_NEEDED
-                            )
-                        recommendation.status_updated_at = datetime.now()
-                        recommendation.reviewed_at = None
-                        recommendation.review_notes = None
-                        self.status_tracker.save_recommendation(recommendation)
+    def _process_result_file(
+        self,
+        result_file: Path,
+        force_refresh: bool,
+        existing_index: dict[tuple[str, str, int], RecommendationMetadata],
+    ) -> tuple[RecommendationMetadata, bool] | None:
+        """Create or load the recommendation for one AI result file.
+
+        Returns the recommendation and whether its status needs saving, or
+        None if the file is skipped.
+        """
+        try:
+            # Parse filename to extract org, repo, issue_number
+            match = _RESULT_FILE_STEM_RE.fullmatch(result_file.stem)
+            if not match:
+                return None
+            org, repo = match[1], match[2]
+            issue_number = int(match[3])
+
+            # Check if we already have status for this recommendation
+            existing = existing_index.get((org, repo, issue_number))
+            if existing and not force_refresh:
+                return existing, False
+
+            # Load AI result
+            result_data = _RESULT_FILE_ADAPTER.validate_json(result_file.read_bytes())
+            ai_analysis = result_data["analysis"]
+
+            # Find corresponding issue file
+            issue_file = self.issues_dir / f"{org}_{repo}_issue_{issue_number}.json"
+            if not issue_file.exists():
+                return None
+
+            # Create recommendation metadata
+            recommendation = self._create_recommendation_metadata(
+                org,
+                repo,
+                issue_number,
+                ai_analysis,
+                str(result_file),
+                str(issue_file),
+            )
 
-                    recommendations.append(recommendation)
+            # Check if this represents an actual change; labels don't change
+            # below, so the answer is reused
+            changed = self.is_recommendation_change(recommendation)
+            if not changed:
+                recommendation.status = RecommendationStatus.NO_CHANGE_NEEDED
+                recommendation.status_updated_at = datetime.now()
+
+            # Existing recommendations only get here on force refresh
+            if existing:
+                # Update existing recommendation with new data
+                if changed:
+                    recommendation.status = RecommendationStatus.PENDING
+                else:
+                    recommendation.status = RecommendationStatus.NO_CHANGE_NEEDED
+                recommendation.status_updated_at = datetime.now()
+                recommendation.reviewed_at = None
+                recommendation.review_notes = None
 
-            except Exception as e:
-                print(f"Error processing {result_file}: {e}")
-                continue
+            # New or refreshed, so the status is saved
+            return recommendation, True
 
-        return recommendations
+        except Exception as e:
+            print(f"Error processing {result_file}: {e}")
+            return None
 
     def _create_recommendation_metadata(
         self,
         org: str,
         repo: str,
         issue_number: int,
-        ai_analysis: ProductLabelingResponse,
+        ai_analysis: _Analysis,
         result_file: str,
         issue_file: str,
     ) -> RecommendationMetadata:
         """Create recommendation metadata from AI analysis."""
 
         # Extract recommended labels
-        recommended_labels = [rec.label.value for rec in ai_analysis.recommended_labels]
+        recommended_labels = [
+            rec["label"].value for rec in ai_analysis["recommended_labels"]
+        ]
 
         # Extract labels to remove (incorrect current labels)
         labels_to_remove = [
-            assessment.label
-            for assessment in ai_analysis.current_labels_assessment
-            if not assessment.correct
+            assessment["label"]
+            for assessment in ai_analysis["current_labels_assessment"]
+            if not assessment["correct"]
         ]
 
         # Load issue data to get current labels
         current_labels = []
         try:
-            with open(issue_file) as f:
-                issue_data = json.load(f)
-                # Labels are nested under 'issue' key in the JSON structure
-                if "issue" in issue_data:
-                    current_labels = [
-                        label["name"] for label in issue_data["issue"].get("labels", [])
-                    ]
-                else:
-                    # Fallback to top-level labels if no 'issue' wrapper
-                    current_labels = [
-                        label["name"] for label in issue_data.get("labels", [])
-                    ]
+            with open(issue_file, "rb") as f:
+                issue_data = _ISSUE_LABELS_ADAPTER.validate_json(f.read())
+            # Labels are nested under 'issue' key in the JSON structure
+            if "issue" in issue_data:
+                current_labels = [
+                    label["name"] for label in issue_data["issue"].get("labels", [])
+                ]
+            else:
+                # Fallback to top-level labels if no 'issue' wrapper
+                current_labels = [
+                    label["name"] for label in issue_data.get("labels", [])
+                ]
         except Exception:
             pass  # If we can't load issue data, use empty list
 
+        # Missing in results that left it at ProductLabelingResponse's default
+        root_cause_analysis = ai_analysis.get("root_cause_analysis")
+
         return RecommendationMetadata(
             org=org,
             repo=repo,
             issue_number=issue_number,
             processor_name="product-labeling",
-            original_confidence=ai_analysis.recommendation_confidence,
-            ai_reasoning=ai_analysis.reasoning,
+            original_confidence=ai_analysis["recommendation_confidence"],
+            ai_reasoning=ai_analysis["reasoning"],
             root_cause_analysis=(
-                ai_analysis.root_cause_analysis
-                if ai_analysis.root_cause_analysis != "Root cause unclear"
+                root_cause_analysis
+                if root_cause_analysis != "Root cause unclear"
                 else None
             ),
-            root_cause_confidence=ai_analysis.root_cause_confidence,
+            root_cause_confidence=ai_analysis.get("root_cause_confidence"),
             recommended_labels=recommended_labels,
             labels_to_remove=labels_to_remove,
             current_labels=current_labels,
@@ -166,34 +278,28 @@ class RecommendationManager:
 
     def is_recommendation_change(self, recommendation: RecommendationMetadata) -> bool:
         """Check if recommendation represents a change from current labels."""
-        # Get current product labels (filter out non-product labels)
+        # Labels to remove indicates a change, without looking at any labels
+        if recommendation.labels_to_remove:
+            return True
+
+        # Get current and recommended product labels (filter out the rest)
         current_product_labels = [
             label
             for label in recommendation.current_labels
             if label.startswith("product::")
         ]
-
-        # Get recommended product labels
         recommended_product_labels = [
             label
             for label in recommendation.recommended_labels
             if label.startswith("product::")
         ]
 
-        # Check if there's any difference
-        # 1. Different number of product labels
+        # A different number of product labels is a change
         if len(current_product_labels) != len(recommended_product_labels):
             return True
 
-        # 2. Different labels (order doesn't matter)
-        if set(current_product_labels) != set(recommended_product_labels):
-            return True
-
-        # 3. Labels to remove indicates a change
-        if recommendation.labels_to_remove:
-            return True
-
-        return False
+        # Otherwise compare the labels (order doesn't matter)
+        return set(current_product_labels) != set(recommended_product_labels)
 
     def should_reprocess_issue(
         self, org: str, repo: str, issue_number: int, force_reprocess: bool = False
@@ -214,62 +320,49 @@ class RecommendationManager:
             return True
 
         # Skip if already analyzed and reviewed
-        if recommendation.status in [
-            RecommendationStatus.PENDING,
-            RecommendationStatus.NO_CHANGE_NEEDED,
-            RecommendationStatus.APPROVED,
-            RecommendationStatus.REJECTED,
-        ]:
+        if recommendation.status in REVIEWED_STATUSES:
             return False
 
         return True  # Default to processing
 
-    def get_recommendation_summary(self) -> dict[str, Any]:
-        """Get summary statistics for recommendations."""
-        all_recommendations = self.status_tracker.get_all_recommendations()
-
-        summary: dict[str, Any] = {
-            "total_recommendations": len(all_recommendations),
-            "by_status": {},
-            "by_product": {},
-            "by_confidence_tier": {},
-            "by_repository": {},
-            "pending_high_confidence": 0,
-            "no_change_needed": 0,
-            "recently_applied": 0,
-        }
-
-        # Calculate statistics
-        for rec in all_recommendations:
-            # Status distribution
-            status = rec.status.value
-            summary["by_status"][status] = summary["by_status"].get(status, 0) + 1
+    def load_reviewed_index(
+        self, org: str | None = None, repo: str | None = None
+    ) -> set[tuple[str, str, int]]:
+        """Load the (org, repo, issue_number) keys that should not be reprocessed.
 
-            # Product distribution
-            product = rec.primary_product or "unknown"
-            summary["by_product"][product] = summary["by_product"].get(product, 0) + 1
+        Scans the status directory once, limited to org (and repo) when given,
+        so callers processing many issues can make the same decision as
+        should_reprocess_issue with a set lookup.
+        """
+        statuses = self.status_tracker.load_statuses(filename_prefix(org, repo))
+        return {key for key, status in statuses.items() if status in REVIEWED_STATUSES}
 
-            # Confidence tier distribution
+    def get_recommendation_summary(self) -> dict[str, Any]:
+        """Get summary statistics for recommendations."""
+        total = 0
+        by_status: Counter[str] = Counter()
+        by_product: Counter[str] = Counter()
+        by_confidence_tier: Counter[str] = Counter()
+        by_repository: Counter[str] = Counter()
+        pending_high_confidence = 0
+        no_change_needed = 0
+
+        # Calculate statistics from views; order doesn't matter, so skip sorting
+        for rec in self.status_tracker.iter_views():
+            total += 1
             tier = rec.confidence_tier
-            summary["by_confidence_tier"][tier] = (
-                summary["by_confidence_tier"].get(tier, 0) + 1
-            )
 
-            # Repository distribution
-            repo_key = f"{rec.org}/{rec.repo}"
-            summary["by_repository"][repo_key] = (
-                summary["by_repository"].get(repo_key, 0) + 1
-            )
+            # Status, product, confidence tier and repository distributions
+            by_status[rec.status.value] += 1
+            by_product[rec.primary_product or "unknown"] += 1
+            by_confidence_tier[tier] += 1
+            by_repository[f"{rec.org}/{rec.repo}"] += 1
 
             # Special counts
-            if (
-                rec.status == RecommendationStatus.PENDING
-                and rec.confidence_tier == "high"
-            ):
-                summary["pending_high_confidence"] += 1
-
-            if rec.status == RecommendationStatus.NO_CHANGE_NEEDED:
-                summary["no_change_needed"] += 1
+            if rec.status == RecommendationStatus.PENDING and tier == "high":
+                pending_high_confidence += 1
+            elif rec.status == RecommendationStatus.NO_CHANGE_NEEDED:
+                no_change_needed += 1
 
             # Note: recently_applied will be implemented in Phase 2
             # if (rec.status == RecommendationStatus.APPLIED and
@@ -277,4 +370,13 @@ class RecommendationManager:
             #     (datetime.now() - rec.applied_at).days <= 7):
             #     summary["recently_applied"] += 1
 
-        return summary
+        return {
+            "total_recommendations": total,
+            "by_status": dict(by_status),
+            "by_product": dict(by_product),
+            "by_confidence_tier": dict(by_confidence_tier),
+            "by_repository": dict(by_repository),
+            "pending_high_confidence": pending_high_confidence,
+            "no_change_needed": no_change_needed,
+            "recently_applied": 0,
+        }
@@ -1,5 +1,6 @@
 """Data models for recommendation tracking and management."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
@@ -68,10 +69,14 @@ class RecommendationMetadata(BaseModel):
     @property
     def primary_product(self) -> str | None:
         """Extract primary product from recommended labels."""
-        product_labels = [
-            label for label in self.recommended_labels if label.startswith("product::")
-        ]
-        return product_labels[0] if product_labels else None
+        return next(
+            (
+                label
+                for label in self.recommended_labels
+                if label.startswith("product::")
+            ),
+            None,
+        )
 
     @property
     def confidence_tier(self) -> str:
@@ -85,6 +90,44 @@ class RecommendationMetadata(BaseModel):
             return "low"
 
 
+@dataclass(slots=True, frozen=True)
+class RecommendationView:
+    """Read-only projection of a recommendation for filtering and summaries.
+
+    Much smaller than the full model, and immutable, so one instance can be
+    shared by every query instead of copying the model for each caller.
+    """
+
+    org: str
+    repo: str
+    issue_number: int
+    status: RecommendationStatus
+    original_confidence: float
+    review_confidence: float | None
+    confidence_tier: str
+    primary_product: str | None
+    status_updated_at: datetime
+    reviewed_at: datetime | None
+    search_text: str  # Lowercased reasoning and review notes
+
+    @classmethod
+    def from_metadata(cls, rec: RecommendationMetadata) -> "RecommendationView":
+        """Build a view, computing derived fields once."""
+        return cls(
+            org=rec.org,
+            repo=rec.repo,
+            issue_number=rec.issue_number,
+            status=rec.status,
+            original_confidence=rec.original_confidence,
+            review_confidence=rec.review_confidence,
+            confidence_tier=rec.confidence_tier,
+            primary_product=rec.primary_product,
+            status_updated_at=rec.status_updated_at,
+            reviewed_at=rec.reviewed_at,
+            search_text=f"{rec.ai_reasoning} {rec.review_notes or ''}".lower(),
+        )
+
+
 class RecommendationFilter(BaseModel):
     """Filter criteria for recommendation queries."""
 
@@ -92,6 +135,7 @@ class RecommendationFilter(BaseModel):
     org: str | None = None
     repo: str | None = None
     status: list[RecommendationStatus] | None = None
+    exclude_status: list[RecommendationStatus] | None = None
 
     # Confidence filters
     min_confidence: float | None = None
@@ -1,9 +1,314 @@
 """Handles persistence and querying of recommendation status."""
 
+import itertools
 import json
+import os
+import sqlite3
+import threading
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import Any, NamedTuple
 
-from .models import RecommendationFilter, RecommendationMetadata
+from .models import (
+    RecommendationFilter,
+    RecommendationMetadata,
+    RecommendationStatus,
+    RecommendationView,
+)
+
+_Predicate = Callable[[RecommendationView], bool]
+_CacheEntry = tuple[tuple[int, int], RecommendationMetadata, RecommendationView]
+
+
+def _effective_confidence(rec: RecommendationView) -> float:
+    """Reviewer confidence if set, otherwise the AI's original confidence."""
+    return rec.review_confidence or rec.original_confidence
+
+
+def filename_prefix(org: str | None = None, repo: str | None = None) -> str:
+    """Status filename prefix shared by every file of org (and repo)."""
+    if org and repo:
+        return f"{org}_{repo}_issue_"
+    if org:
+        return f"{org}_"
+    return ""
+
+
+def _status_file_key(name: str) -> tuple[str, str, int] | None:
+    """Parse (org, repo, issue_number) from a status filename.
+
+    GitHub org names cannot contain underscores, so the first underscore
+    ends the org. Returns None for names not written by save_recommendation.
+    """
+    org_repo, sep, number = name.removesuffix("_status.json").rpartition("_issue_")
+    org, org_sep, repo = org_repo.partition("_")
+    if not (sep and org_sep and number.isdigit()):
+        return None
+    return org, repo, int(number)
+
+
+# SQLite index of the status files, kept alongside them. The JSON files stay
+# the source of truth; a row is rebuilt whenever its file's (mtime_ns, size)
+# no longer matches, so the index can always be deleted safely.
+_INDEX_FILE = ".status_index.sqlite"
+_INDEX_VERSION = 1
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recs (
+    name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    key_org TEXT,
+    key_repo TEXT,
+    key_number INTEGER,
+    org TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    issue_number INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    original_confidence REAL NOT NULL,
+    review_confidence REAL,
+    confidence REAL NOT NULL,
+    confidence_tier TEXT NOT NULL,
+    primary_product TEXT,
+    status_updated_at TEXT NOT NULL,
+    status_updated_us INTEGER NOT NULL,
+    reviewed_at TEXT,
+    reviewed_us INTEGER,
+    search_text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS recs_order
+    ON recs (key_number IS NULL, key_org, key_repo, key_number, name);
+CREATE INDEX IF NOT EXISTS recs_status ON recs (status);
+CREATE INDEX IF NOT EXISTS recs_updated ON recs (status_updated_us);
+CREATE INDEX IF NOT EXISTS recs_product ON recs (primary_product);
+"""
+_INDEX_UPSERT = f"INSERT OR REPLACE INTO recs VALUES ({', '.join('?' * 20)})"
+_VIEW_COLUMNS = (
+    "org, repo, issue_number, status, original_confidence, review_confidence, "
+    "confidence_tier, primary_product, status_updated_at, reviewed_at, search_text"
+)
+# Same order as _scan: parsed filename keys first, then other names
+_INDEX_ORDER = "ORDER BY key_number IS NULL, key_org, key_repo, key_number, name"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_us(value: datetime) -> int:
+    """Exact microseconds since the epoch, reading naive datetimes as UTC.
+
+    Naive values compare by wall clock in Python, which treating them all
+    as UTC preserves.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _index_row(
+    name: str, version: tuple[int, int], view: RecommendationView
+) -> tuple[Any, ...]:
+    """Index row for a status file, in _INDEX_SCHEMA column order."""
+    # Names not written by save_recommendation sort after the rest
+    key = _status_file_key(name) or (None, None, None)
+    reviewed_at = view.reviewed_at
+    return (
+        name,
+        *version,
+        *key,
+        view.org,
+        view.repo,
+        view.issue_number,
+        view.status.value,
+        view.original_confidence,
+        view.review_confidence,
+        _effective_confidence(view),
+        view.confidence_tier,
+        view.primary_product,
+        view.status_updated_at.isoformat(),
+        _epoch_us(view.status_updated_at),
+        reviewed_at.isoformat() if reviewed_at else None,
+        _epoch_us(reviewed_at) if reviewed_at else None,
+        view.search_text,
+    )
+
+
+def _view_from_row(row: tuple[Any, ...]) -> RecommendationView:
+    """Rebuild a view from a _VIEW_COLUMNS row."""
+    (
+        org,
+        repo,
+        issue_number,
+        status,
+        original_confidence,
+        review_confidence,
+        confidence_tier,
+        primary_product,
+        status_updated_at,
+        reviewed_at,
+        search_text,
+    ) = row
+    return RecommendationView(
+        org=org,
+        repo=repo,
+        issue_number=issue_number,
+        status=RecommendationStatus(status),
+        original_confidence=original_confidence,
+        review_confidence=review_confidence,
+        confidence_tier=confidence_tier,
+        primary_product=primary_product,
+        status_updated_at=datetime.fromisoformat(status_updated_at),
+        reviewed_at=datetime.fromisoformat(reviewed_at) if reviewed_at else None,
+        search_text=search_text,
+    )
+
+
+def _name_prefix_sql(prefix: str) -> tuple[str, list[Any]]:
+    """Clause matching index rows whose filename starts with prefix."""
+    return "substr(name, 1, ?) = ?", [len(prefix), prefix]
+
+
+def _status_values(statuses: Iterable[RecommendationStatus]) -> list[str]:
+    """Index column values of statuses."""
+    return [status.value for status in statuses]
+
+
+def _same(value: Any) -> Any:
+    """Filter value used as the index column value unchanged."""
+    return value
+
+
+class _Criterion(NamedTuple):
+    """How one RecommendationFilter field selects recommendations.
+
+    The filter value, converted by to_column, is compared with the named
+    index column; in SQL when the index is queried, otherwise against the
+    same column value computed from each view.
+    """
+
+    field: str
+    column: str
+    operator: str
+    to_column: Callable[[Any], Any] = _same
+
+
+# Every filter criterion, defined once for both query paths. Criteria whose
+# filter field is unset (or empty) are left out.
+_CRITERIA = (
+    # Excluded statuses are the cheapest and most common rejection
+    _Criterion("exclude_status", "status", "NOT IN", _status_values),
+    # Basic filters
+    _Criterion("org", "org", "="),
+    _Criterion("repo", "repo", "="),
+    _Criterion("status", "status", "IN", _status_values),
+    # Confidence filters
+    _Criterion("min_confidence", "confidence", ">="),
+    _Criterion("max_confidence", "confidence", "<="),
+    _Criterion("confidence_tier", "confidence_tier", "IN"),
+    # Product filters
+    _Criterion("product", "primary_product", "IN"),
+    # Date filters, compared as exact microseconds since the epoch
+    _Criterion("created_after", "status_updated_us", ">=", _epoch_us),
+    _Criterion("created_before", "status_updated_us", "<=", _epoch_us),
+    _Criterion("reviewed_after", "reviewed_us", ">=", _epoch_us),
+    _Criterion("reviewed_before", "reviewed_us", "<=", _epoch_us),
+    # Text search; search_text is stored lowercased
+    _Criterion("search_text", "search_text", "CONTAINS", str.lower),
+)
+
+# Index column values computed from a view, for filtering without the index
+_COLUMN_GETTERS: dict[str, Callable[[RecommendationView], Any]] = {
+    "org": lambda view: view.org,
+    "repo": lambda view: view.repo,
+    "status": lambda view: view.status.value,
+    "confidence": _effective_confidence,
+    "confidence_tier": lambda view: view.confidence_tier,
+    "primary_product": lambda view: view.primary_product,
+    "status_updated_us": lambda view: _epoch_us(view.status_updated_at),
+    "reviewed_us": lambda view: (
+        _epoch_us(view.reviewed_at) if view.reviewed_at else None
+    ),
+    "search_text": lambda view: view.search_text,
+}
+
+# SQL clause and the equivalent Python test for each operator. As in SQL, a
+# NULL (None) column value matches nothing.
+_OPERATORS: dict[str, tuple[str, Callable[[Any, Any], bool]]] = {
+    "=": ("{column} = ?", lambda value, wanted: value == wanted),
+    ">=": (
+        "{column} >= ?",
+        lambda value, wanted: value is not None and value >= wanted,
+    ),
+    "<=": (
+        "{column} <= ?",
+        lambda value, wanted: value is not None and value <= wanted,
+    ),
+    "IN": ("{column} IN ({placeholders})", lambda value, wanted: value in wanted),
+    "NOT IN": (
+        "{column} NOT IN ({placeholders})",
+        lambda value, wanted: value is not None and value not in wanted,
+    ),
+    # instr is case sensitive, like the substring test
+    "CONTAINS": (
+        "instr({column}, ?) > 0",
+        lambda value, wanted: value is not None and wanted in value,
+    ),
+}
+
+
+def _active_criteria(filter: RecommendationFilter) -> Iterator[tuple[_Criterion, Any]]:
+    """Yield the criteria the filter sets, with their index column values."""
+    for criterion in _CRITERIA:
+        value = getattr(filter, criterion.field)
+        if value:
+            yield criterion, criterion.to_column(value)
+
+
+def _predicate(
+    get: Callable[[RecommendationView], Any],
+    test: Callable[[Any, Any], bool],
+    wanted: Any,
+) -> _Predicate:
+    """Predicate testing the column value get reads from a view."""
+    return lambda view: test(get(view), wanted)
+
+
+def _compile_filter(filter: RecommendationFilter) -> list[_Predicate]:
+    """Build one predicate per active filter criterion.
+
+    Inactive criteria are left out, so matching a recommendation only runs
+    the checks the query actually asks for.
+    """
+    predicates: list[_Predicate] = []
+    for criterion, wanted in _active_criteria(filter):
+        if isinstance(wanted, list):
+            wanted = frozenset(wanted)
+        predicates.append(
+            _predicate(
+                _COLUMN_GETTERS[criterion.column],
+                _OPERATORS[criterion.operator][1],
+                wanted,
+            )
+        )
+    return predicates
+
+
+def _filter_sql(filter: RecommendationFilter, prefix: str) -> tuple[str, list[Any]]:
+    """Build a WHERE clause selecting the same rows as _compile_filter."""
+    clause, params = _name_prefix_sql(prefix)
+    clauses = [clause]
+    for criterion, wanted in _active_criteria(filter):
+        values = wanted if isinstance(wanted, list) else [wanted]
+        template = _OPERATORS[criterion.operator][0]
+        clauses.append(
+            template.format(
+                column=criterion.column, placeholders=", ".join("?" * len(values))
+            )
+        )
+        params.extend(values)
+    return " AND ".join(clauses), params
 
 
 class StatusTracker:
@@ -17,6 +322,120 @@ class StatusTracker:
         self.recommendations_dir = status_dir
         self.recommendations_dir.mkdir(exist_ok=True)
 
+        # Parsed status files and their views keyed by path, with the
+        # (mtime_ns, size) they were read at; a file is parsed again only
+        # after it changes
+        self._cache: dict[str, _CacheEntry] = {}
+
+        # Index for filtered queries and summaries, opened on first use; None
+        # means files are read directly. Saves can come from worker threads,
+        # hence the lock.
+        self._db_lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._db_opened = False
+        # Index rows from saves inside batched_saves(), written together
+        self._pending_rows: list[tuple[Any, ...]] | None = None
+
+    def _connection(self) -> sqlite3.Connection | None:
+        """Return the index connection; call with _db_lock held."""
+        if not self._db_opened:
+            self._db_opened = True
+            self._db = self._open_index()
+        return self._db
+
+    def _open_index(self) -> sqlite3.Connection | None:
+        """Open the status index, rebuilding it if its layout is outdated."""
+        db = None
+        try:
+            db = sqlite3.connect(self.status_dir / _INDEX_FILE, check_same_thread=False)
+            # The index is rebuilt from the status files, so a commit lost in
+            # a crash costs nothing; don't fsync every save
+            db.execute("PRAGMA journal_mode = WAL")
+            db.execute("PRAGMA synchronous = NORMAL")
+            if db.execute("PRAGMA user_version").fetchone()[0] != _INDEX_VERSION:
+                db.executescript(
+                    f"DROP TABLE IF EXISTS recs;{_INDEX_SCHEMA}"
+                    f"PRAGMA user_version = {_INDEX_VERSION};"
+                )
+        except sqlite3.Error as e:
+            print(f"Status index unavailable, reading files directly: {e}")
+            if db is not None:
+                db.close()
+            return None
+
+        weakref.finalize(self, db.close)
+        return db
+
+    def _update_index(
+        self, rows: Iterable[tuple[Any, ...]], removed: Iterable[str] = ()
+    ) -> None:
+        """Write index rows and delete rows for removed filenames."""
+        with self._db_lock:
+            db = self._connection()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.executemany(
+                        "DELETE FROM recs WHERE name = ?", ((name,) for name in removed)
+                    )
+                    db.executemany(_INDEX_UPSERT, rows)
+            except sqlite3.Error as e:
+                print(f"Status index unavailable, reading files directly: {e}")
+                self._db = None
+
+    def _query_index(self, sql: str, params: list[Any]) -> list[Any] | None:
+        """Run a query against the index, or return None if it is unavailable."""
+        with self._db_lock:
+            db = self._connection()
+            if db is None:
+                return None
+            try:
+                return db.execute(sql, params).fetchall()
+            except sqlite3.Error as e:
+                print(f"Status index unavailable, reading files directly: {e}")
+                self._db = None
+                return None
+
+    def _sync_index(self, prefix: str) -> bool:
+        """Bring index rows for status files under prefix up to date.
+
+        Only files whose (mtime_ns, size) changed since they were indexed are
+        parsed. Returns False if the index is unavailable.
+        """
+        entries = self._scan_entries(prefix)
+        # Don't create an index only to find nothing in it
+        if not entries and not self._db_opened:
+            return False
+
+        clause, params = _name_prefix_sql(prefix)
+        indexed_rows = self._query_index(
+            f"SELECT name, mtime_ns, size FROM recs WHERE {clause}", params
+        )
+        if indexed_rows is None:
+            return False
+        indexed = {name: (mtime_ns, size) for name, mtime_ns, size in indexed_rows}
+
+        rows: list[tuple[Any, ...]] = []
+        removed: list[str] = []
+        for entry in entries:
+            stat = entry.stat()
+            version = (stat.st_mtime_ns, stat.st_size)
+            if indexed.pop(entry.name, None) == version:
+                continue
+            try:
+                _, view = self._read(entry.path, stat)
+            except Exception as e:
+                print(f"Error loading {entry.path}: {e}")
+                removed.append(entry.name)
+                continue
+            rows.append(_index_row(entry.name, version, view))
+
+        # Whatever is left was indexed but no longer exists
+        removed.extend(indexed)
+        self._update_index(rows, removed)
+        return self._db is not None
+
     def save_recommendation(self, recommendation: RecommendationMetadata) -> None:
         """Save or update recommendation status."""
         file_path = self._get_status_file_path(recommendation)
@@ -24,6 +443,58 @@ class StatusTracker:
         with open(file_path, "w") as f:
             json.dump(recommendation.model_dump(), f, indent=2, default=str)
 
+        # Cache a copy so later changes by the caller don't leak into it
+        stat = file_path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        view = RecommendationView.from_metadata(recommendation)
+        self._cache[str(file_path)] = (version, recommendation.model_copy(), view)
+        row = _index_row(file_path.name, version, view)
+        with self._db_lock:
+            if self._pending_rows is not None:
+                self._pending_rows.append(row)
+                return
+        self._update_index([row])
+
+    @contextmanager
+    def batched_saves(self) -> Iterator[None]:
+        """Write the index rows of saves made in this block in one transaction.
+
+        Status files are still written as each save happens.
+        """
+        with self._db_lock:
+            self._pending_rows = []
+        try:
+            yield
+        finally:
+            with self._db_lock:
+                rows, self._pending_rows = self._pending_rows, None
+            if rows:
+                self._update_index(rows)
+
+    def _read(
+        self, path: str, stat: os.stat_result
+    ) -> tuple[RecommendationMetadata, RecommendationView]:
+        """Read a status file, reusing the cached parse if it is unchanged.
+
+        The cached objects themselves are returned; callers must copy the
+        model before handing it out.
+        """
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+
+        # Parse and validate in one pass, without building an interim dict
+        with open(path, "rb") as f:
+            recommendation = RecommendationMetadata.model_validate_json(f.read())
+        view = RecommendationView.from_metadata(recommendation)
+        self._cache[path] = (version, recommendation, view)
+        return recommendation, view
+
+    def _load(self, path: str, stat: os.stat_result) -> RecommendationMetadata:
+        """Load a status file as a model the caller is free to modify."""
+        return self._read(path, stat)[0].model_copy()
+
     def get_recommendation(
         self, org: str, repo: str, issue_number: int
     ) -> RecommendationMetadata | None:
@@ -32,13 +503,14 @@ class StatusTracker:
             self.recommendations_dir / f"{org}_{repo}_issue_{issue_number}_status.json"
         )
 
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            self._cache.pop(str(file_path), None)
             return None
 
         try:
-            with open(file_path) as f:
-                data = json.load(f)
-            return RecommendationMetadata.model_validate(data)
+            return self._load(str(file_path), stat)
         except Exception as e:
             print(f"Error loading recommendation {file_path}: {e}")
             return None
@@ -46,89 +518,170 @@ class StatusTracker:
     def query_recommendations(
         self, filter: RecommendationFilter
     ) -> list[RecommendationMetadata]:
-        """Query recommendations with filtering."""
-        recommendations = self.get_all_recommendations()
-        filtered = []
+        """Query recommendations with filtering.
 
-        for rec in recommendations:
-            if self._matches_filter(rec, filter):
-                filtered.append(rec)
+        Filtering and pagination run in the status index, so only files in
+        the returned page are loaded. Without the index, files are read
+        lazily and reading stops once the requested page is complete.
+        """
+        # Files for other orgs or repos are not considered at all
+        prefix = filename_prefix(filter.org, filter.repo)
 
-        # Apply pagination
-        if filter.offset:
-            filtered = filtered[filter.offset :]
-        if filter.limit:
-            filtered = filtered[: filter.limit]
+        if self._sync_index(prefix):
+            where, params = _filter_sql(filter, prefix)
+            params.extend((filter.limit or -1, filter.offset))
+            names = self._query_index(
+                f"SELECT name FROM recs WHERE {where} {_INDEX_ORDER} LIMIT ? OFFSET ?",
+                params,
+            )
+            if names is not None:
+                return self._load_names(name for (name,) in names)
 
-        return filtered
+        predicates = _compile_filter(filter)
+        filtered = (
+            rec
+            for rec, view in self._scan(prefix)
+            if all(pred(view) for pred in predicates)
+        )
 
-    def _matches_filter(
-        self, rec: RecommendationMetadata, filter: RecommendationFilter
-    ) -> bool:
-        """Check if recommendation matches filter criteria."""
+        # Apply pagination
+        stop = filter.offset + filter.limit if filter.limit else None
+        page = itertools.islice(filtered, filter.offset, stop)
+        return [rec.model_copy() for rec in page]
 
-        # Basic filters
-        if filter.org and rec.org != filter.org:
-            return False
-        if filter.repo and rec.repo != filter.repo:
-            return False
-        if filter.status and rec.status not in filter.status:
-            return False
+    def iter_all_recommendations(
+        self, prefix: str = ""
+    ) -> Iterator[RecommendationMetadata]:
+        """Yield recommendations whose status filenames start with prefix.
 
-        # Confidence filters
-        effective_confidence = rec.review_confidence or rec.original_confidence
-        if filter.min_confidence and effective_confidence < filter.min_confidence:
-            return False
-        if filter.max_confidence and effective_confidence > filter.max_confidence:
-            return False
-        if filter.confidence_tier and rec.confidence_tier not in filter.confidence_tier:
-            return False
+        Recommendations come in (org, repo, issue_number) order, taken from
+        the filenames so each file is only read when it is reached. Files
+        with other names follow in name order.
+        """
+        for recommendation, _ in self._scan(prefix):
+            yield recommendation.model_copy()
 
-        # Product filters
-        if filter.product:
-            rec_product = rec.primary_product
-            if not rec_product or rec_product not in filter.product:
-                return False
+    def iter_views(self, prefix: str = "") -> Iterator[RecommendationView]:
+        """Yield read-only views in iter_all_recommendations order.
 
-        # Date filters
-        if filter.created_after and rec.status_updated_at < filter.created_after:
-            return False
-        if filter.created_before and rec.status_updated_at > filter.created_before:
-            return False
-        if filter.reviewed_after and (
-            not rec.reviewed_at or rec.reviewed_at < filter.reviewed_after
-        ):
-            return False
-        if filter.reviewed_before and (
-            not rec.reviewed_at or rec.reviewed_at > filter.reviewed_before
-        ):
-            return False
+        Views come from the status index, so unchanged files are not parsed
+        at all; this is the cheaper choice when only filtering or summary
+        fields are needed.
+        """
+        rows = None
+        if self._sync_index(prefix):
+            clause, params = _name_prefix_sql(prefix)
+            rows = self._query_index(
+                f"SELECT {_VIEW_COLUMNS} FROM recs WHERE {clause} {_INDEX_ORDER}",
+                params,
+            )
 
-        # Text search
-        if filter.search_text:
-            search_lower = filter.search_text.lower()
-            searchable_text = f"{rec.ai_reasoning} {rec.review_notes or ''}".lower()
-            if search_lower not in searchable_text:
-                return False
+        if rows is None:
+            for _, view in self._scan(prefix):
+                yield view
+            return
 
-        return True
+        for row in rows:
+            yield _view_from_row(row)
 
-    def get_all_recommendations(self) -> list[RecommendationMetadata]:
-        """Get all recommendations."""
+    def _load_names(self, names: Iterable[str]) -> list[RecommendationMetadata]:
+        """Load the named status files, skipping any that cannot be read."""
         recommendations = []
+        for name in names:
+            path = os.path.join(self.recommendations_dir, name)
+            try:
+                recommendations.append(self._load(path, os.stat(path)))
+            except Exception as e:
+                print(f"Error loading {path}: {e}")
+        return recommendations
+
+    def _scan_entries(self, prefix: str) -> list[os.DirEntry[str]]:
+        """List status files under prefix, forgetting cached ones now gone."""
+        with os.scandir(self.recommendations_dir) as entries:
+            found = [
+                entry
+                for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith("_status.json")
+            ]
 
-        for status_file in self.recommendations_dir.glob("*_status.json"):
+        # Forget files that have been removed
+        seen = {entry.path for entry in found}
+        scanned = os.path.join(self.recommendations_dir, prefix)
+        for path in self._cache.keys() - seen:
+            if path.startswith(scanned):
+                del self._cache[path]
+
+        return found
+
+    def _scan(
+        self, prefix: str
+    ) -> Iterator[tuple[RecommendationMetadata, RecommendationView]]:
+        """Yield cached (model, view) pairs for status files under prefix."""
+        named: list[tuple[tuple[str, str, int], os.DirEntry[str]]] = []
+        others: list[os.DirEntry[str]] = []
+
+        for entry in self._scan_entries(prefix):
+            key = _status_file_key(entry.name)
+            if key is None:
+                others.append(entry)
+            else:
+                named.append((key, entry))
+
+        named.sort(key=lambda item: item[0])
+        others.sort(key=lambda entry: entry.name)
+        ordered = itertools.chain((entry for _, entry in named), others)
+
+        for entry in ordered:
             try:
-                with open(status_file) as f:
-                    data = json.load(f)
-                recommendations.append(RecommendationMetadata.model_validate(data))
+                loaded = self._read(entry.path, entry.stat())
             except Exception as e:
-                print(f"Error loading {status_file}: {e}")
+                print(f"Error loading {entry.path}: {e}")
+                continue
+            yield loaded
+
+    def index(
+        self, prefix: str = ""
+    ) -> dict[tuple[str, str, int], RecommendationMetadata]:
+        """Map (org, repo, issue_number) to recommendations under prefix.
+
+        Built from one directory pass; unchanged files come from the cache.
+        """
+        return {
+            (rec.org, rec.repo, rec.issue_number): rec
+            for rec in self.iter_all_recommendations(prefix)
+        }
+
+    def get_all_recommendations(self, prefix: str = "") -> list[RecommendationMetadata]:
+        """Get all recommendations whose status filenames start with prefix."""
+        recommendations = list(self.iter_all_recommendations(prefix))
 
         # Sort by org, repo, issue_number for consistent ordering
         recommendations.sort(key=lambda r: (r.org, r.repo, r.issue_number))
         return recommendations
 
+    def load_statuses(self, prefix: str = "") -> dict[tuple[str, str, int], str]:
+        """Map (org, repo, issue_number) to status for status files under prefix.
+
+        Reads the directory in one pass and only the identifying fields of
+        each file, skipping full model validation.
+        """
+        statuses: dict[tuple[str, str, int], str] = {}
+
+        with os.scandir(self.recommendations_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith("_status.json")):
+                    continue
+                try:
+                    with open(entry.path, "rb") as f:
+                        data = json.load(f)
+                    key = (data["org"], data["repo"], int(data["issue_number"]))
+                    statuses[key] = data["status"]
+                except Exception as e:
+                    print(f"Error loading {entry.path}: {e}")
+
+        return statuses
+
     def _get_status_file_path(self, recommendation: RecommendationMetadata) -> Path:
         """Get file path for recommendation status."""
         return self.recommendations_dir / (
@@ -1,7 +1,8 @@
 """Storage package for managing GitHub issue data."""
 
-from .manager import StorageManager
+from .manager import ISSUE_FILENAME_RE, StorageManager
 
 __all__ = [
+    "ISSUE_FILENAME_RE",
     "StorageManager",
 ]
@@ -1,6 +1,7 @@
 """Storage manager for GitHub issues."""
 
 import json
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -11,6 +12,11 @@ from ..github_client.models import AttachmentMetadata, GitHubIssue, StoredIssue
 
 console = Console()
 
+# Issue files are stored as {org}_{repo}_issue_{number}.json
+ISSUE_FILENAME_RE = re.compile(
+    r"^(?P<org>[^_]+)_(?P<repo>.+)_issue_(?P<number>\d+)\.json$"
+)
+
 
 class StorageManager:
     """Manages storage of GitHub issues as JSON files."""
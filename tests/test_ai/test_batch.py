@@ -742,6 +742,23 @@ class TestOpenAIBatchProvider:
         assert parsed_results[1]["custom_id"] == "test2"
         assert "error" in parsed_results[1]
 
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test_key"})
+    def test_parse_batch_results_skips_malformed_lines(
+        self, ai_model_config: AIModelConfig, tmp_path: Path
+    ) -> None:
+        """Test that unparseable lines are skipped rather than aborting."""
+        provider = OpenAIBatchProvider(ai_model_config)
+
+        results_file = tmp_path / "results.jsonl"
+        results_file.write_text(
+            '{"custom_id": "test1"}\nnot json\n\n{"custom_id": "test2"}\n',
+            encoding="utf-8",
+        )
+
+        parsed_results = provider.parse_batch_results(results_file)
+
+        assert [r["custom_id"] for r in parsed_results] == ["test1", "test2"]
+
 
 class TestBatchModels:
     """Test batch model validation and serialization."""
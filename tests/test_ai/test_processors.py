@@ -164,6 +164,19 @@ def test_prepare_issue_for_analysis(sample_issue_data: dict[str, Any]) -> None:
         assert message_parts[1].media_type == "image/png"
 
 
+def test_prepare_issue_for_analysis_skips_image_loading_when_disabled(
+    sample_issue_data: dict[str, Any],
+) -> None:
+    """Test that attachments are not inspected when images are disabled."""
+    with patch("gh_analysis.ai.analysis.load_downloaded_images") as mock_load_images:
+        message_parts = prepare_issue_for_analysis(
+            sample_issue_data, include_images=False
+        )
+
+    mock_load_images.assert_not_called()
+    assert len(message_parts) == 1
+
+
 def test_format_issue_prompt(sample_issue_data: dict[str, Any]) -> None:
     """Test issue prompt formatting."""
     prompt = format_issue_prompt(sample_issue_data)
@@ -269,5 +282,7 @@ async def test_analyze_issue_fallback_on_multimodal_failure() -> None:
 
         # Verify fallback happened
         assert mock_agent.run.call_count == 2
+        # Fallback prompt is the text-only rendering of the same issue
+        assert mock_agent.run.call_args.args[0] == format_issue_prompt(sample_data, 0)
         assert isinstance(result, ProductLabelingResponse)
         assert result.recommendation_confidence == 0.9
@@ -248,6 +248,21 @@ class TestValidateSettings:
         assert len(errors) == 1
         assert "Unknown setting" in errors[0]
 
+    def test_repeated_validation_returns_independent_lists(self) -> None:
+        """Test that cached results are not shared between callers."""
+        settings = {"temperature": 5.0}
+        first = validate_settings("openai:gpt-4o", settings)
+        first.append("mutated")
+        second = validate_settings("openai:gpt-4o", settings)
+        assert second == ["Temperature 5.0 out of range for OpenAI (0-2)"]
+
+    def test_unhashable_setting_value(self) -> None:
+        """Test that unhashable values are still validated."""
+        errors = validate_settings(
+            "google:gemini-pro", {"google_thinking_config": {"budget": 1}}
+        )
+        assert errors == []
+
 
 class TestGetValidSettingsHelp:
     """Test help text generation."""
@@ -2,6 +2,7 @@
 
 import re
 import uuid
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -76,7 +77,8 @@ class TestBatchSubmitCommand:
             # Mock the BatchManager instance and its methods
             mock_manager = MagicMock()
             mock_manager_class.return_value = mock_manager
-            mock_manager.find_issues.return_value = [
+            mock_manager.find_issue_files.return_value = [Path("issue.json")]
+            mock_manager.load_issues.return_value = [
                 {
                     "org": "test-org",
                     "repo": "test-repo",
@@ -126,7 +128,8 @@ class TestBatchSubmitCommand:
         with patch("gh_analysis.cli.batch.BatchManager") as mock_manager_class:
             mock_manager = MagicMock()
             mock_manager_class.return_value = mock_manager
-            mock_manager.find_issues.return_value = [
+            mock_manager.find_issue_files.return_value = [Path("issue.json")]
+            mock_manager.load_issues.return_value = [
                 {
                     "org": "test-org",
                     "repo": "test-repo",
@@ -160,7 +163,8 @@ class TestBatchSubmitCommand:
         with patch("gh_analysis.cli.batch.BatchManager") as mock_manager_class:
             mock_manager = MagicMock()
             mock_manager_class.return_value = mock_manager
-            mock_manager.find_issues.return_value = [
+            mock_manager.find_issue_files.return_value = [Path("issue.json")]
+            mock_manager.load_issues.return_value = [
                 {
                     "org": "test-org",
                     "repo": "test-repo",
@@ -213,7 +217,8 @@ class TestBatchSubmitCommand:
             mock_manager = MagicMock()
             mock_manager_class.return_value = mock_manager
             # Return more issues than max_items limit
-            mock_manager.find_issues.return_value = [
+            mock_manager.find_issue_files.return_value = [Path("issue.json")]
+            mock_manager.load_issues.return_value = [
                 {
                     "org": "test-org",
                     "repo": "test-repo",
@@ -239,6 +244,50 @@ class TestBatchSubmitCommand:
         assert "Limited to 5 items (from 15 total)" in result.stdout
         assert "Found 5 issue(s) to process" in result.stdout
 
+    def test_submit_skips_reviewed_issues_before_loading(
+        self, runner: CliRunner
+    ) -> None:
+        """Test that reviewed issues are filtered by filename, before loading."""
+        with (
+            patch("gh_analysis.cli.batch.BatchManager") as mock_manager_class,
+            patch("gh_analysis.cli.batch.RecommendationManager") as mock_rec_class,
+        ):
+            mock_manager = MagicMock()
+            mock_manager_class.return_value = mock_manager
+            mock_manager.find_issue_files.return_value = [
+                Path("data/issues/test-org_test-repo_issue_1.json"),
+                Path("data/issues/test-org_test-repo_issue_2.json"),
+            ]
+            mock_manager.load_issues.return_value = [
+                {
+                    "org": "test-org",
+                    "repo": "test-repo",
+                    "issue": {"number": 2, "title": "Issue 2"},
+                }
+            ]
+            mock_rec_class.return_value.load_reviewed_index.return_value = {
+                ("test-org", "test-repo", 1)
+            }
+
+            result = runner.invoke(
+                app,
+                [
+                    "submit",
+                    "product-labeling",
+                    "--org",
+                    "test-org",
+                    "--repo",
+                    "test-repo",
+                    "--dry-run",
+                ],
+            )
+
+        assert result.exit_code == 0
+        assert "Filtered out 1 already-reviewed issues" in result.stdout
+        mock_manager.load_issues.assert_called_once_with(
+            [Path("data/issues/test-org_test-repo_issue_2.json")]
+        )
+
     def test_submit_invalid_processor_type(self, runner: CliRunner) -> None:
         """Test error handling for invalid processor type."""
         result = runner.invoke(
@@ -268,7 +317,8 @@ class TestBatchCliBackwardCompatibility:
         with patch("gh_analysis.cli.batch.BatchManager") as mock_manager_class:
             mock_manager = MagicMock()
             mock_manager_class.return_value = mock_manager
-            mock_manager.find_issues.return_value = [
+            mock_manager.find_issue_files.return_value = [Path("issue.json")]
+            mock_manager.load_issues.return_value = [
                 {
                     "org": "test-org",
                     "repo": "test-repo",
@@ -362,7 +412,7 @@ class TestBatchErrorHandling:
         with patch("gh_analysis.cli.batch.BatchManager") as mock_manager_class:
             mock_manager = MagicMock()
             mock_manager_class.return_value = mock_manager
-            mock_manager.find_issues.side_effect = Exception(
+            mock_manager.find_issue_files.side_effect = Exception(
                 "Database connection failed"
             )
 
@@ -2,15 +2,78 @@
 
 import asyncio
 import json
+import logging
 import re
+import time
 from pathlib import Path
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import httpx
+import openai
 import pytest
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.usage import UsageLimits
 from typer.testing import CliRunner
 
-from gh_analysis.cli.process import _process_single_issue, app
+from gh_analysis.cli.process import (
+    AdmissionController,
+    IssueOutcome,
+    ResultWriter,
+    _count_image_attachments,
+    _iter_issue_files,
+    _parse_setting_value,
+    _plan_work,
+    _is_rate_limit_error,
+    _process_single_issue,
+    _retry_delay,
+    _run_product_labeling,
+    _run_troubleshoot,
+    app,
+)
+from gh_analysis.runners.utils.base_runner import BaseAgentRunner
+
+
+class _RateLimitedRunner(BaseAgentRunner):
+    """Runner whose agent is rate limited by the provider on its first runs.
+
+    Failures go through the real BaseAgentRunner.analyze wrapping, so they
+    arrive as RuntimeError from ModelHTTPError from openai.RateLimitError.
+    """
+
+    def __init__(self, failures: int = 1, retry_after: str = "0"):
+        super().__init__("test-runner", MagicMock())
+        self.failures = failures
+        self.retry_after = retry_after
+        self.calls: dict[int, int] = {}
+
+    def _build_context(self, input_data: dict[str, Any]) -> str:
+        return str(input_data["issue"]["number"])
+
+    def _get_logging_id(self, input_data: dict[str, Any]) -> str:
+        return str(input_data["issue"]["number"])
+
+    def _setup_logging(self, run_id: str) -> logging.Logger:
+        return logging.getLogger(run_id)
+
+    async def _run_agent_with_custom_span(
+        self, user_message: str, usage_limits: UsageLimits
+    ) -> Any:
+        number = int(user_message)
+        self.calls[number] = self.calls.get(number, 0) + 1
+        if number == 1 and self.calls[number] <= self.failures:
+            request = httpx.Request("POST", "https://api.openai.com/v1/responses")
+            response = httpx.Response(
+                429, headers={"retry-after": self.retry_after}, request=request
+            )
+            try:
+                raise openai.RateLimitError(
+                    "rate limited", response=response, body=None
+                )
+            except openai.RateLimitError as e:
+                raise ModelHTTPError(429, "test-model") from e
+        output = type("MockOutput", (), {"model_dump": lambda self: {"test": "ok"}})()
+        return type("MockResult", (), {"output": output})()
 
 
 def strip_ansi(text: str) -> str:
@@ -50,6 +113,14 @@ class TestProductLabelingBasic:
         assert "--concurrency" in clean_output
         assert "concurrent" in clean_output.lower()
 
+    def test_concurrency_must_be_positive(self, runner: CliRunner) -> None:
+        """Test that a concurrency below one is rejected."""
+        result = runner.invoke(
+            app, ["product-labeling", "--org", "test-org", "--concurrency", "0"]
+        )
+        assert result.exit_code == 2  # Typer validation error
+        assert "--concurrency" in strip_ansi(result.stderr)
+
     def test_concurrency_default_value(self, runner: CliRunner) -> None:
         """Test that concurrency has correct default value."""
         result = runner.invoke(app, ["product-labeling", "--help"])
@@ -76,19 +147,10 @@ class TestConcurrentProcessing:
             },
         }
 
-    @pytest.fixture
-    def mock_recommendation_manager(self) -> Any:
-        """Create mock recommendation manager."""
-        with patch("gh_analysis.cli.process.RecommendationManager") as mock:
-            mock_instance = mock.return_value
-            mock_instance.should_reprocess_issue.return_value = True
-            yield mock_instance
-
     @pytest.mark.asyncio
     async def test_process_single_issue_success(
         self,
         mock_issue_data: dict[str, Any],
-        mock_recommendation_manager: Any,
         tmp_path: Path,
     ) -> None:
         """Test processing a single issue successfully."""
@@ -110,34 +172,31 @@ class TestConcurrentProcessing:
             mock_runner = type("MockRunner", (), {"analyze": mock_analyze})()
             mock_get_runner.return_value = mock_runner
 
-            semaphore = asyncio.Semaphore(1)
             result = await _process_single_issue(
                 issue_file,
-                mock_recommendation_manager,
+                set(),
                 results_dir,
                 "test-model",
                 {},
                 True,
                 False,
-                semaphore,
             )
 
-            assert result == "processed"
+            assert result == IssueOutcome.PROCESSED
             # Check that result file was created
             result_files = list(results_dir.glob("*.json"))
             assert len(result_files) == 1
+            saved = json.loads(result_files[0].read_text())
+            assert saved["analysis"] == {"test": "result"}
+            assert saved["processor"]["timestamp"].endswith("Z")
 
     @pytest.mark.asyncio
     async def test_process_single_issue_skipped(
         self,
         mock_issue_data: dict[str, Any],
-        mock_recommendation_manager: Any,
         tmp_path: Path,
     ) -> None:
         """Test skipping an issue that shouldn't be reprocessed."""
-        # Configure mock to skip processing
-        mock_recommendation_manager.should_reprocess_issue.return_value = False
-
         issue_file = tmp_path / "test_issue.json"
         with open(issue_file, "w") as f:
             json.dump(mock_issue_data, f)
@@ -145,86 +204,450 @@ class TestConcurrentProcessing:
         results_dir = tmp_path / "results"
         results_dir.mkdir()
 
-        semaphore = asyncio.Semaphore(1)
         result = await _process_single_issue(
             issue_file,
-            mock_recommendation_manager,
+            {("test-org", "test-repo", 123)},
             results_dir,
             "test-model",
             {},
             True,
             False,
-            semaphore,
         )
 
-        assert result == "skipped"
+        assert result == IssueOutcome.SKIPPED
+
+    def test_plan_work_marks_reviewed_issues(self, tmp_path: Path) -> None:
+        """Test that reviewed issues are identified from filenames alone."""
+        files = [
+            tmp_path / "test-org_test-repo_issue_123.json",
+            tmp_path / "test-org_test-repo_issue_124.json",
+            tmp_path / "unexpected_name.json",
+        ]
+
+        plan = list(_plan_work(iter(files), {("test-org", "test-repo", 123)}))
+
+        assert plan == [(files[0], False), (files[1], True), (files[2], True)]
+
+
+class TestRunProductLabeling:
+    """Test the product labeling pipeline across multiple issue files."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Create a data directory with several issue files."""
+        issues_dir = tmp_path / "issues"
+        issues_dir.mkdir()
+        for number in range(1, 8):
+            issue_data = {
+                "org": "test-org",
+                "repo": "test-repo",
+                "issue": {
+                    "number": number,
+                    "title": f"Issue {number}",
+                    "body": "Test body",
+                    "labels": [],
+                    "attachments": [],
+                },
+            }
+            issue_file = issues_dir / f"test-org_test-repo_issue_{number}.json"
+            issue_file.write_text(json.dumps(issue_data))
+        monkeypatch.setenv("GITHUB_ANALYSIS_DATA_DIR", str(tmp_path))
+        return tmp_path
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_processes_all_files(self, data_dir: Path) -> None:
+        """Test that every file is processed without exceeding concurrency."""
+        active = 0
+        max_active = 0
+
+        async def mock_analyze(self, data):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return type(
+                "MockResult", (), {"model_dump": lambda self: {"test": "result"}}
+            )()
+
+        with patch("gh_analysis.runners.get_runner") as mock_get_runner:
+            mock_get_runner.return_value = type(
+                "MockRunner", (), {"analyze": mock_analyze}
+            )()
+            await _run_product_labeling(
+                "test-org", "test-repo", None, "test-model", {}, True, False, False, 3
+            )
+
+        # A single runner is shared by all workers
+        mock_get_runner.assert_called_once()
+
+        result_files = list((data_dir / "results").glob("*_product-labeling.json"))
+        assert len(result_files) == 7
+        assert max_active <= 3
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_issue_is_retried(self, data_dir: Path) -> None:
+        """Test that a 429 from the provider is retried rather than failed."""
+        calls: dict[int, int] = {}
+
+        class RateLimitError(Exception):
+            status_code = 429
+            response = type("Response", (), {"headers": {"retry-after": "0"}})()
+
+        async def mock_analyze(self, data):
+            number = data["issue"]["number"]
+            calls[number] = calls.get(number, 0) + 1
+            if number == 1 and calls[number] == 1:
+                raise RateLimitError("rate limited")
+            return type(
+                "MockResult", (), {"model_dump": lambda self: {"test": "result"}}
+            )()
+
+        with patch("gh_analysis.runners.get_runner") as mock_get_runner:
+            mock_get_runner.return_value = type(
+                "MockRunner", (), {"analyze": mock_analyze}
+            )()
+            await _run_product_labeling(
+                "test-org", "test-repo", None, "test-model", {}, True, False, False, 3
+            )
+
+        assert calls[1] == 2
+        result_files = list((data_dir / "results").glob("*_product-labeling.json"))
+        assert len(result_files) == 7
+
+    @pytest.mark.asyncio
+    async def test_wrapped_provider_rate_limit_is_retried(self, data_dir: Path) -> None:
+        """Test a 429 wrapped by the runner is retried using its Retry-After."""
+        runner = _RateLimitedRunner()
+
+        with patch("gh_analysis.runners.get_runner", return_value=runner):
+            await _run_product_labeling(
+                "test-org", "test-repo", None, "test-model", {}, True, False, False, 3
+            )
+
+        assert runner.calls[1] == 2
+        result_files = list((data_dir / "results").glob("*_product-labeling.json"))
+        assert len(result_files) == 7
 
     @pytest.mark.asyncio
-    async def test_concurrent_processing_with_semaphore(
-        self, mock_issue_data: dict[str, Any], tmp_path: Path
+    async def test_planned_total_is_reported(
+        self, data_dir: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
-        """Test that concurrent processing respects semaphore limits."""
-        # Create multiple issue files
-        issue_files = []
-        for i in range(5):
-            issue_file = tmp_path / f"test_issue_{i}.json"
-            issue_data = mock_issue_data.copy()
-            issue_data["issue"]["number"] = i + 1
-            with open(issue_file, "w") as f:
-                json.dump(issue_data, f)
-            issue_files.append(issue_file)
+        """Test the number of issues found is printed once discovery ends."""
+        runner = _RateLimitedRunner(failures=0)
+        with patch("gh_analysis.runners.get_runner", return_value=runner):
+            await _run_product_labeling(
+                "test-org", "test-repo", None, "test-model", {}, True, False, False, 3
+            )
 
-        results_dir = tmp_path / "results"
-        results_dir.mkdir()
+        assert "Found 7 issue(s) to process" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_workers_are_cancelled_when_discovery_fails(
+        self, data_dir: Path
+    ) -> None:
+        """Test no worker task outlives a failed directory scan."""
+
+        def failing_plan(*args: Any) -> Any:
+            yield data_dir / "test-org_test-repo_issue_1.json", True
+            raise OSError("directory vanished")
+
+        with (
+            patch("gh_analysis.runners.get_runner", return_value=_RateLimitedRunner()),
+            patch("gh_analysis.cli.process._plan_work", side_effect=failing_plan),
+            pytest.raises(OSError, match="directory vanished"),
+        ):
+            await _run_product_labeling(
+                "test-org", "test-repo", None, "test-model", {}, True, False, False, 3
+            )
 
-        # Track concurrency
-        active_tasks = []
-        max_concurrent = 0
+        assert asyncio.all_tasks() == {asyncio.current_task()}
 
-        async def mock_analyze_with_tracking(self, *args, **kwargs):
-            """Mock runner analyze that tracks concurrency."""
-            nonlocal max_concurrent
-            active_tasks.append(asyncio.current_task())
-            max_concurrent = max(max_concurrent, len(active_tasks))
+    @pytest.mark.asyncio
+    async def test_retried_rate_limit_is_not_reported_as_failure(
+        self, data_dir: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test only a rate limit that exhausts its retries is reported."""
+        runner = _RateLimitedRunner()
+        with patch("gh_analysis.runners.get_runner", return_value=runner):
+            await _run_product_labeling(
+                "test-org", "test-repo", None, "test-model", {}, True, False, False, 3
+            )
+        assert "Failed to process" not in capsys.readouterr().out
 
-            # Simulate some work
-            await asyncio.sleep(0.1)
+        runner = _RateLimitedRunner(failures=10)
+        with patch("gh_analysis.runners.get_runner", return_value=runner):
+            await _run_product_labeling(
+                "test-org", "test-repo", None, "test-model", {}, True, False, True, 3
+            )
+        assert capsys.readouterr().out.count("Failed to process") == 1
 
-            active_tasks.remove(asyncio.current_task())
-            mock_result = type(
+    @pytest.mark.asyncio
+    async def test_wrapped_provider_rate_limit_backs_off(self, data_dir: Path) -> None:
+        """Test a 429 wrapped by the runner shrinks admitted concurrency."""
+        runner = _RateLimitedRunner()
+
+        with (
+            patch("gh_analysis.runners.get_runner", return_value=runner),
+            patch.object(
+                AdmissionController,
+                "back_off",
+                autospec=True,
+                side_effect=AdmissionController.back_off,
+            ) as mock_back_off,
+        ):
+            await _run_product_labeling(
+                "test-org", "test-repo", None, "test-model", {}, True, False, False, 4
+            )
+
+        mock_back_off.assert_called_once()
+        controller = mock_back_off.call_args.args[0]
+        assert controller.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_wrapped_provider_error_details_are_found(self) -> None:
+        """Test the status code and Retry-After are read through the chain."""
+        runner = _RateLimitedRunner(retry_after="7")
+        with pytest.raises(RuntimeError) as exc_info:
+            await runner.analyze({"issue": {"number": 1}})
+
+        assert getattr(exc_info.value, "status_code", None) is None
+        assert _is_rate_limit_error(exc_info.value)
+        assert _retry_delay(exc_info.value, 0) == 7.0
+        assert not _is_rate_limit_error(RuntimeError("failed"))
+
+    @pytest.mark.asyncio
+    async def test_dry_run_writes_nothing(
+        self, data_dir: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that dry run lists files without processing them."""
+        with patch("gh_analysis.runners.get_runner") as mock_get_runner:
+            await _run_product_labeling(
+                "test-org", "test-repo", None, "test-model", {}, True, True, False, 3
+            )
+            mock_get_runner.assert_not_called()
+
+        assert not (data_dir / "results").exists()
+        output = capsys.readouterr().out
+        assert output.count("Would process: test-org_test-repo_issue_") == 7
+        assert "Found 7 issue(s) to process" in output
+
+    @pytest.mark.asyncio
+    async def test_reviewed_issues_are_skipped(self, data_dir: Path) -> None:
+        """Test that issues with a reviewed status are not reanalyzed."""
+        from datetime import datetime
+
+        from gh_analysis.recommendation.manager import RecommendationManager
+        from gh_analysis.recommendation.models import (
+            RecommendationMetadata,
+            RecommendationStatus,
+        )
+
+        manager = RecommendationManager(data_dir)
+        for number, status in [
+            (1, RecommendationStatus.APPROVED),
+            (2, RecommendationStatus.NEEDS_MODIFICATION),
+        ]:
+            manager.status_tracker.save_recommendation(
+                RecommendationMetadata(
+                    org="test-org",
+                    repo="test-repo",
+                    issue_number=number,
+                    original_confidence=0.8,
+                    ai_reasoning="Test",
+                    recommended_labels=["product::kots"],
+                    labels_to_remove=[],
+                    status=status,
+                    status_updated_at=datetime.now(),
+                    ai_result_file="test.json",
+                    issue_file="test.json",
+                )
+            )
+
+        async def mock_analyze(self, data):
+            return type(
                 "MockResult", (), {"model_dump": lambda self: {"test": "result"}}
             )()
-            return mock_result
-
-        with patch("gh_analysis.cli.process.RecommendationManager") as mock_mgr:
-            mock_mgr.return_value.should_reprocess_issue.return_value = True
-
-            with patch("gh_analysis.runners.get_runner") as mock_get_runner:
-                mock_runner = type(
-                    "MockRunner", (), {"analyze": mock_analyze_with_tracking}
-                )()
-                mock_get_runner.return_value = mock_runner
-                # Test with concurrency limit of 2
-                semaphore = asyncio.Semaphore(2)
-                tasks = []
-                for issue_file in issue_files:
-                    task = asyncio.create_task(
-                        _process_single_issue(
-                            issue_file,
-                            mock_mgr.return_value,
-                            results_dir,
-                            "test-model",
-                            {},
-                            True,
-                            False,
-                            semaphore,
-                        )
-                    )
-                    tasks.append(task)
-
-                results = await asyncio.gather(*tasks)
-
-                # All should be processed
-                assert all(result == "processed" for result in results)
-                # Max concurrency should not exceed semaphore limit
-                assert max_concurrent <= 2
+
+        with patch("gh_analysis.runners.get_runner") as mock_get_runner:
+            mock_get_runner.return_value = type(
+                "MockRunner", (), {"analyze": mock_analyze}
+            )()
+            await _run_product_labeling(
+                "test-org", "test-repo", None, "test-model", {}, True, False, False, 3
+            )
+
+        result_names = {
+            p.name for p in (data_dir / "results").glob("*_product-labeling.json")
+        }
+        assert len(result_names) == 6
+        assert "test-org_test-repo_issue_1_product-labeling.json" not in result_names
+        assert "test-org_test-repo_issue_2_product-labeling.json" in result_names
+
+
+@pytest.mark.asyncio
+async def test_result_writer_writes_all_queued_results(tmp_path: Path) -> None:
+    """Test that every submitted result is on disk once the writer exits."""
+    async with ResultWriter(maxsize=2) as writer:
+        for number in range(5):
+            await writer.submit(tmp_path / f"result_{number}.json", {"n": number})
+        await writer.submit(tmp_path / "missing" / "result.json", {"n": -1})
+
+    saved = sorted(json.loads(p.read_text())["n"] for p in tmp_path.glob("*.json"))
+    assert saved == [0, 1, 2, 3, 4]
+    assert writer.failed == 1
+
+
+def test_iter_issue_files_filters_by_prefix(tmp_path: Path) -> None:
+    """Test that issue discovery only yields matching issue JSON files."""
+    for name in [
+        "org_repo_issue_1.json",
+        "org_other_issue_2.json",
+        "otherorg_repo_issue_3.json",
+        "org_repo_issue_4.txt",
+        "org_notes.json",
+    ]:
+        (tmp_path / name).write_text("{}")
+
+    assert {p.name for p in _iter_issue_files(tmp_path, "org_repo_issue_")} == {
+        "org_repo_issue_1.json"
+    }
+    assert {p.name for p in _iter_issue_files(tmp_path, "org_")} == {
+        "org_repo_issue_1.json",
+        "org_other_issue_2.json",
+    }
+    assert len(list(_iter_issue_files(tmp_path))) == 3
+
+
+class TestAdmissionController:
+    """Test the resizable concurrency limiter."""
+
+    @pytest.mark.asyncio
+    async def test_limit_is_enforced(self) -> None:
+        """Test that no more than the limit are admitted at once."""
+        controller = AdmissionController(2)
+        active = 0
+        max_active = 0
+
+        async def task() -> None:
+            nonlocal active, max_active
+            await controller.acquire()
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            await controller.release()
+
+        await asyncio.gather(*(task() for _ in range(6)))
+        assert max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_back_off_halves_limit(self) -> None:
+        """Test that a rate-limit back-off halves the limit, never below one."""
+        controller = AdmissionController(8, back_off_window=0)
+        await controller.back_off()
+        assert controller.limit == 4
+        for _ in range(5):
+            await controller.back_off()
+        assert controller.limit == 1
+
+    @pytest.mark.asyncio
+    async def test_burst_of_rate_limits_backs_off_once(self) -> None:
+        """Test rate limits hit together by many workers halve the limit once."""
+        controller = AdmissionController(8)
+        await asyncio.gather(*(controller.back_off() for _ in range(8)))
+        assert controller.limit == 4
+
+        with patch("time.monotonic", return_value=time.monotonic() + 10):
+            await controller.back_off()
+        assert controller.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_raising_limit_admits_waiter(self) -> None:
+        """Test that raising the limit wakes a blocked acquirer."""
+        controller = AdmissionController(2)
+        await controller.set_limit(1)
+        await controller.acquire()
+
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await controller.set_limit(2)
+        await asyncio.wait_for(waiter, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_limit_recovers_after_back_off(self) -> None:
+        """Test that releases restore capacity once the recovery period passes."""
+        controller = AdmissionController(4, recovery_seconds=0)
+        await controller.back_off()
+        assert controller.limit == 2
+
+        for _ in range(2):
+            await controller.acquire()
+            await controller.release()
+        assert controller.limit == 4
+
+
+class TestTroubleshootUrlParsing:
+    """Test GitHub issue URL handling in troubleshoot."""
+
+    @pytest.mark.asyncio
+    async def test_invalid_url_rejected(self) -> None:
+        """Test that a non-issue URL raises a clear error."""
+        with pytest.raises(ValueError, match="Invalid GitHub issue URL"):
+            await _run_troubleshoot(
+                None,
+                None,
+                None,
+                "https://example.com/org/repo/issues/1",
+                "gpt5_mini_medium",
+                True,
+                None,
+                True,
+                False,
+            )
+
+    @pytest.mark.asyncio
+    async def test_comment_fragment_accepted(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that URLs pointing at a comment still parse."""
+        monkeypatch.delenv("SBCTL_TOKEN", raising=False)
+        await _run_troubleshoot(
+            None,
+            None,
+            None,
+            "https://github.com/org/repo/issues/42#issuecomment-1",
+            "gpt5_mini_medium",
+            True,
+            None,
+            True,
+            False,
+        )
+        assert "org/repo#42" in capsys.readouterr().out
+
+
+def test_count_image_attachments() -> None:
+    """Test that only downloaded image attachments are counted."""
+    issue = {
+        "attachments": [
+            {"downloaded": True, "content_type": "image/png"},
+            {"downloaded": False, "content_type": "image/png"},
+            {"downloaded": True, "content_type": "text/plain"},
+            {"downloaded": True, "content_type": None},
+            {"downloaded": True, "content_type": "image/jpeg"},
+        ]
+    }
+    assert _count_image_attachments(issue) == 2
+    assert _count_image_attachments({}) == 0
+
+
+def test_parse_setting_value() -> None:
+    """Test numeric parsing of --setting values."""
+    assert _parse_setting_value("1024") == 1024
+    assert isinstance(_parse_setting_value("1024"), int)
+    assert _parse_setting_value("0.7") == 0.7
+    assert _parse_setting_value("2.0") == 2
+    assert isinstance(_parse_setting_value("1e3"), int)
+    assert _parse_setting_value("high") == "high"
@@ -396,6 +396,54 @@ class TestRecommendationsCLI:
             assert len(output_data) == 1
             assert output_data[0]["org"] == "test"
             assert output_data[0]["repo"] == "repo"
+            assert output_data[0]["status"] == "pending"
+
+    def test_list_summary_format(self):
+        """Test list command with summary output format."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            status_dir = Path(temp_dir) / "recommendation_status"
+            status_dir.mkdir(parents=True)
+
+            for i, (label, confidence) in enumerate(
+                [("product::kots", 0.95), ("product::kots", 0.8), ("", 0.5)]
+            ):
+                rec = RecommendationMetadata(
+                    org="test",
+                    repo="repo",
+                    issue_number=i + 1,
+                    original_confidence=confidence,
+                    ai_reasoning="Test",
+                    recommended_labels=[label] if label else [],
+                    labels_to_remove=[],
+                    status=RecommendationStatus.PENDING,
+                    status_updated_at=datetime.now(),
+                    ai_result_file="test.json",
+                    issue_file="test.json",
+                )
+                status_file = status_dir / f"test_repo_issue_{i + 1}_status.json"
+                with open(status_file, "w") as f:
+                    json.dump(rec.model_dump(), f, default=str)
+
+            result = runner.invoke(
+                app,
+                [
+                    "recommendations",
+                    "list",
+                    "--format",
+                    "summary",
+                    "--data-dir",
+                    temp_dir,
+                ],
+            )
+
+            assert result.exit_code == 0
+            assert "Summary of 3 recommendations" in result.output
+            assert "pending: 3" in result.output
+            assert "product::kots: 2" in result.output
+            assert "unknown: 1" in result.output
+            assert "high: 1" in result.output
+            assert "medium: 1" in result.output
+            assert "low: 1" in result.output
 
     def test_invalid_status_filter(self):
         """Test handling of invalid status values."""
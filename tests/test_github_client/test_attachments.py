@@ -1,8 +1,10 @@
 """Tests for GitHub attachment functionality."""
 
+import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import httpx
 import pytest
@@ -16,6 +18,19 @@ from gh_analysis.github_client.models import (
 )
 
 
+def _stream_response(response: Mock, content: bytes) -> MagicMock:
+    """Wrap a mock response as the context manager returned by client.stream."""
+
+    async def aiter_bytes(chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        yield content
+
+    response.is_error = False
+    response.aiter_bytes = aiter_bytes
+    stream = MagicMock()
+    stream.__aenter__.return_value = response
+    return stream
+
+
 class TestAttachmentDownloader:
     """Test attachment downloader functionality."""
 
@@ -119,6 +134,23 @@ class TestAttachmentDownloader:
         assert "https://user-images.githubusercontent.com/456/screen.png" in urls
         assert "https://github.com/user-attachments/assets/abc123-def456" in urls
 
+    def test_detect_attachments_in_text_order(
+        self, downloader: AttachmentDownloader
+    ) -> None:
+        """Test that attachments of different kinds are returned in text order."""
+        text = (
+            "https://github.com/user-attachments/assets/abc123 then "
+            "https://user-images.githubusercontent.com/456/screen.png then "
+            "https://github.com/org/repo/files/123/app.log"
+        )
+        attachments = downloader.detect_attachments(text, "issue_body")
+
+        assert [att.filename for att in attachments] == [
+            "abc123",
+            "screen.png",
+            "app.log",
+        ]
+
     def test_detect_attachments_empty_text(
         self, downloader: AttachmentDownloader
     ) -> None:
@@ -161,11 +193,52 @@ class TestAttachmentDownloader:
         safe = downloader._generate_safe_filename("file with spaces!@#.txt", tmp_path)
         assert safe == "file_with_spaces___.txt"
 
+        # Non-ASCII characters are replaced too
+        safe = downloader._generate_safe_filename("résumé.pdf", tmp_path)
+        assert safe == "r_sum_.pdf"
+
         # Duplicate filename handling
         (tmp_path / "test.log").touch()
         safe = downloader._generate_safe_filename("test.log", tmp_path)
         assert safe == "test_1.log"
 
+    def test_generate_safe_filename_reserves_names(
+        self, downloader: AttachmentDownloader, tmp_path: Path
+    ) -> None:
+        """Test that names reserved in the shared set are not handed out twice."""
+        taken: set[str] = {"test.log"}
+
+        first = downloader._generate_safe_filename("test.log", tmp_path, taken)
+        second = downloader._generate_safe_filename("test.log", tmp_path, taken)
+
+        assert first == "test_1.log"
+        assert second == "test_2.log"
+        assert taken == {"test.log", "test_1.log", "test_2.log"}
+
+    @pytest.mark.asyncio
+    async def test_get_working_asset_urls(
+        self, downloader: AttachmentDownloader
+    ) -> None:
+        """Test that signed asset URLs are mapped by asset UUID."""
+        asset_id = "5559e3a4-ea5f-4cd7-a0a0-a302b0b62612"
+        jwt_url = (
+            "https://private-user-images.githubusercontent.com/1/"
+            f"456579721-{asset_id}.png?jwt=token"
+        )
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.json.return_value = {
+            "body_html": f'<img src="{jwt_url}"><a href="https://example.com">x</a>'
+        }
+        client = AsyncMock()
+        client.get.return_value = mock_response
+
+        mapping = await downloader._get_working_asset_urls(
+            "org", "repo", 1, client=client
+        )
+
+        assert mapping == {asset_id: jwt_url}
+
     @pytest.mark.asyncio
     async def test_download_attachment_success(
         self, downloader: AttachmentDownloader, tmp_path: Path
@@ -185,8 +258,9 @@ class TestAttachmentDownloader:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_instance.head.return_value = mock_response
-            mock_instance.get.return_value = mock_response
+            mock_instance.stream = Mock(
+                return_value=_stream_response(mock_response, mock_response.content)
+            )
 
             result = await downloader.download_attachment(attachment, tmp_path)
 
@@ -199,6 +273,9 @@ class TestAttachmentDownloader:
             assert (tmp_path / "file.txt").exists()
             assert (tmp_path / "file.txt").read_bytes() == b"test file content"
 
+            # Size and type come from the GET itself
+            mock_instance.head.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_download_attachment_too_large(
         self, downloader: AttachmentDownloader, tmp_path: Path
@@ -218,12 +295,42 @@ class TestAttachmentDownloader:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_instance.head.return_value = mock_response
+            mock_instance.stream = Mock(
+                return_value=_stream_response(mock_response, b"")
+            )
+
+            result = await downloader.download_attachment(attachment, tmp_path)
+
+            assert not result.downloaded
+            assert result.local_path is None
+            assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_download_attachment_too_large_without_content_length(
+        self, downloader: AttachmentDownloader, tmp_path: Path
+    ) -> None:
+        """Test that the size limit is enforced while streaming the body."""
+        attachment = GitHubAttachment(
+            original_url="https://example.com/large.zip",
+            filename="large.zip",
+            source="issue_body",
+        )
+
+        mock_response = Mock()
+        mock_response.headers = {}
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_instance.stream = Mock(
+                return_value=_stream_response(mock_response, b"x" * 6 * 1024 * 1024)
+            )
 
             result = await downloader.download_attachment(attachment, tmp_path)
 
             assert not result.downloaded
             assert result.local_path is None
+            assert list(tmp_path.iterdir()) == []
 
     @pytest.mark.asyncio
     async def test_download_attachment_http_error(
@@ -239,8 +346,10 @@ class TestAttachmentDownloader:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_instance.head.side_effect = httpx.HTTPStatusError(
-                "Not Found", request=Mock(), response=Mock(status_code=404)
+            mock_instance.stream = Mock(
+                side_effect=httpx.HTTPStatusError(
+                    "Not Found", request=Mock(), response=Mock(status_code=404)
+                )
             )
 
             result = await downloader.download_attachment(attachment, tmp_path)
@@ -271,11 +380,15 @@ class TestAttachmentDownloader:
         mock_response.headers = {"content-length": "12", "content-type": "text/plain"}
         mock_response.raise_for_status = Mock()
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with (
+            patch("httpx.AsyncClient") as mock_client,
+            patch("gh_analysis.github_client.attachments.console") as mock_console,
+        ):
             mock_instance = AsyncMock()
             mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_instance.head.return_value = mock_response
-            mock_instance.get.return_value = mock_response
+            mock_instance.stream = Mock(
+                return_value=_stream_response(mock_response, mock_response.content)
+            )
 
             results = await downloader.download_attachments(attachments, tmp_path)
 
@@ -284,6 +397,288 @@ class TestAttachmentDownloader:
             assert (tmp_path / "file1.txt").exists()
             assert (tmp_path / "file2.txt").exists()
 
+            # Messages for the whole batch are printed in one call
+            mock_console.print.assert_called_once()
+            assert set(mock_console.print.call_args.args[0].split("\n")) == {
+                "✅ Downloaded: file1.txt",
+                "✅ Downloaded: file2.txt",
+            }
+
+    @pytest.mark.asyncio
+    async def test_download_attachments_reuses_existing_files(
+        self, downloader: AttachmentDownloader, tmp_path: Path
+    ) -> None:
+        """Test that files saved by a previous run are not fetched again."""
+
+        def make_attachments() -> list[GitHubAttachment]:
+            return [
+                GitHubAttachment(
+                    original_url=f"https://example.com/file{i}.txt",
+                    filename=f"file{i}.txt",
+                    source="issue_body",
+                )
+                for i in (1, 2)
+            ]
+
+        mock_response = Mock()
+        mock_response.headers = {"content-type": "text/plain"}
+        client = AsyncMock()
+        client.stream = Mock(
+            return_value=_stream_response(mock_response, b"previous run")
+        )
+        with patch("gh_analysis.github_client.attachments.console"):
+            await downloader.download_attachments(
+                make_attachments()[:1], tmp_path, client=client
+            )
+
+            client.stream = Mock(
+                return_value=_stream_response(mock_response, b"new content")
+            )
+            results = await downloader.download_attachments(
+                make_attachments(), tmp_path, client=client
+            )
+
+        client.stream.assert_called_once()
+        assert all(result.downloaded for result in results)
+        assert results[0].local_path == str(tmp_path / "file1.txt")
+        assert results[0].size == len(b"previous run")
+        assert results[0].content_type == "text/plain"
+        assert (tmp_path / "file2.txt").read_bytes() == b"new content"
+
+    @pytest.mark.asyncio
+    async def test_unrecorded_file_with_same_name_is_not_reused(
+        self, downloader: AttachmentDownloader, tmp_path: Path
+    ) -> None:
+        """Test a file is only reused for the URL it was downloaded from."""
+        (tmp_path / "file.txt").write_bytes(b"someone else's")
+        attachment = GitHubAttachment(
+            original_url="https://example.com/file.txt",
+            filename="file.txt",
+            source="issue_body",
+        )
+
+        mock_response = Mock()
+        mock_response.headers = {"content-type": "text/plain"}
+        client = AsyncMock()
+        client.stream = Mock(return_value=_stream_response(mock_response, b"mine"))
+        with patch("gh_analysis.github_client.attachments.console"):
+            [result] = await downloader.download_attachments(
+                [attachment], tmp_path, client=client
+            )
+
+        client.stream.assert_called_once()
+        assert result.local_path == str(tmp_path / "file_1.txt")
+        assert (tmp_path / "file.txt").read_bytes() == b"someone else's"
+
+    @pytest.mark.asyncio
+    async def test_same_named_attachments_keep_their_files_across_runs(
+        self, downloader: AttachmentDownloader, tmp_path: Path
+    ) -> None:
+        """Test reruns map same-named attachments back to their own files."""
+
+        def make_attachments() -> list[GitHubAttachment]:
+            return [
+                GitHubAttachment(
+                    original_url=f"https://github.com/org/repo/files/{i}/bundle.tar.gz",
+                    filename="bundle.tar.gz",
+                    source="issue_body",
+                )
+                for i in (1, 2)
+            ]
+
+        def stream(method: str, url: str, **kwargs: object) -> MagicMock:
+            # files/2 arrives first and takes the unsuffixed name
+            return _stream_response(
+                Mock(headers={"content-type": "application/gzip"}),
+                url.split("/")[-2].encode(),
+            )
+
+        client = AsyncMock()
+        client.stream = Mock(side_effect=stream)
+        with patch("gh_analysis.github_client.attachments.console"):
+            await downloader.download_attachments(
+                make_attachments()[::-1], tmp_path, client=client
+            )
+            client.stream.reset_mock()
+            for _ in range(2):
+                results = await downloader.download_attachments(
+                    make_attachments(), tmp_path, client=client
+                )
+
+        client.stream.assert_not_called()
+        assert [Path(result.local_path or "").read_bytes() for result in results] == [
+            b"1",
+            b"2",
+        ]
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            ".attachments.json",
+            "bundle.tar.gz",
+            "bundle.tar_1.gz",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reused_asset_keeps_its_content_type(
+        self, downloader: AttachmentDownloader, tmp_path: Path
+    ) -> None:
+        """Test an extension-less asset reused from disk is still an image."""
+
+        def make_attachment() -> GitHubAttachment:
+            return GitHubAttachment(
+                original_url=(
+                    "https://private-user-images.githubusercontent.com/1/"
+                    "2-5559e3a4-ea5f-4cd7-a0a0-a302b0b62612.png?jwt=token"
+                ),
+                filename="5559e3a4-ea5f-4cd7-a0a0-a302b0b62612",
+                source="issue_body",
+            )
+
+        client = AsyncMock()
+        client.stream = Mock(
+            return_value=_stream_response(
+                Mock(headers={"content-type": "image/png"}), b"png"
+            )
+        )
+        with patch("gh_analysis.github_client.attachments.console"):
+            await downloader.download_attachments(
+                [make_attachment()], tmp_path, client=client
+            )
+            rerun = make_attachment()
+            # The next lookup signs the URL differently
+            rerun.original_url = rerun.original_url.replace("token", "other")
+            [result] = await downloader.download_attachments(
+                [rerun], tmp_path, client=client
+            )
+
+        client.stream.assert_called_once()
+        assert result.downloaded
+        assert result.content_type == "image/png"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_download_leaves_no_file(
+        self, downloader: AttachmentDownloader, tmp_path: Path
+    ) -> None:
+        """Test a download cancelled mid-stream is fetched again next run."""
+        attachment = GitHubAttachment(
+            original_url="https://example.com/log.txt",
+            filename="log.txt",
+            source="issue_body",
+        )
+        streaming = asyncio.Event()
+
+        async def stalled_body(chunk_size: int | None = None) -> AsyncIterator[bytes]:
+            for _ in range(3):
+                yield b"x" * 65536
+            streaming.set()
+            await asyncio.Event().wait()
+            yield b""
+
+        mock_response = Mock()
+        mock_response.headers = {"content-type": "text/plain"}
+        stalled = _stream_response(mock_response, b"")
+        mock_response.aiter_bytes = stalled_body
+
+        client = AsyncMock()
+        client.stream = Mock(return_value=stalled)
+        task = asyncio.create_task(
+            downloader.download_attachments([attachment], tmp_path, client=client)
+        )
+        await asyncio.wait_for(streaming.wait(), timeout=1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert list(tmp_path.iterdir()) == []
+
+        # The next run downloads the file rather than trusting a partial one
+        fresh = GitHubAttachment(
+            original_url="https://example.com/log.txt",
+            filename="log.txt",
+            source="issue_body",
+        )
+        client.stream = Mock(
+            return_value=_stream_response(
+                Mock(headers={"content-type": "text/plain"}), b"complete log"
+            )
+        )
+        with patch("gh_analysis.github_client.attachments.console"):
+            [result] = await downloader.download_attachments(
+                [fresh], tmp_path, client=client
+            )
+
+        client.stream.assert_called_once()
+        assert result.downloaded
+        assert (tmp_path / "log.txt").read_bytes() == b"complete log"
+
+    @pytest.mark.asyncio
+    async def test_existing_file_with_wrong_size_is_fetched_again(
+        self, downloader: AttachmentDownloader, tmp_path: Path
+    ) -> None:
+        """Test an existing file is only reused if it matches a known size."""
+        (tmp_path / "file.txt").write_bytes(b"truncated")
+        attachment = GitHubAttachment(
+            original_url="https://example.com/file.txt",
+            filename="file.txt",
+            source="issue_body",
+            size=len(b"complete content"),
+        )
+
+        mock_response = Mock()
+        mock_response.headers = {"content-type": "text/plain"}
+        client = AsyncMock()
+        client.stream = Mock(
+            return_value=_stream_response(mock_response, b"complete content")
+        )
+        with patch("gh_analysis.github_client.attachments.console"):
+            [result] = await downloader.download_attachments(
+                [attachment], tmp_path, client=client
+            )
+
+        client.stream.assert_called_once()
+        assert result.downloaded
+        assert Path(result.local_path or "").read_bytes() == b"complete content"
+
+    @pytest.mark.asyncio
+    async def test_download_attachments_bounded_concurrency(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that no more than max_concurrent_downloads run at once."""
+        downloader = AttachmentDownloader("test_token", max_concurrent_downloads=2)
+        attachments = [
+            GitHubAttachment(
+                original_url=f"https://example.com/file{i}.txt",
+                filename=f"file{i}.txt",
+                source="issue_body",
+            )
+            for i in range(6)
+        ]
+        active = 0
+        max_active = 0
+
+        async def mock_download(
+            attachment: GitHubAttachment,
+            download_dir: Path,
+            client: object,
+            taken_names: set[str],
+            log: list[str],
+        ) -> GitHubAttachment:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return attachment
+
+        with (
+            patch("httpx.AsyncClient"),
+            patch.object(
+                AttachmentDownloader, "download_attachment", side_effect=mock_download
+            ),
+        ):
+            results = await downloader.download_attachments(attachments, tmp_path)
+
+        assert len(results) == 6
+        assert max_active == 2
+
     def test_process_issue_attachments(
         self, downloader: AttachmentDownloader, sample_issue: GitHubIssue
     ) -> None:
@@ -325,8 +720,10 @@ class TestAttachmentDownloader:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_instance.head.return_value = mock_response
             mock_instance.get.return_value = mock_response
+            mock_instance.stream = Mock(
+                return_value=_stream_response(mock_response, mock_response.content)
+            )
 
             result = await downloader.download_issue_attachments(
                 issue_with_attachments, tmp_path, "testorg", "testrepo"
@@ -340,6 +737,138 @@ class TestAttachmentDownloader:
             downloaded_count = sum(1 for att in result.attachments if att.downloaded)
             assert downloaded_count > 0
 
+            # Lookups and downloads for the issue share one client
+            mock_client.assert_called_once()
+
+            # Asset URLs are looked up for the issue body and the comment
+            lookup_urls = {c.args[0] for c in mock_instance.get.call_args_list}
+            assert lookup_urls == {
+                "https://api.github.com/repos/testorg/testrepo/issues/1",
+                "https://api.github.com/repos/testorg/testrepo/issues/comments/456",
+            }
+
+    @pytest.mark.asyncio
+    async def test_download_many_issues_shares_client(
+        self,
+        downloader: AttachmentDownloader,
+        sample_issue: GitHubIssue,
+        tmp_path: Path,
+    ) -> None:
+        """Test that attachments for several issues download over one client."""
+        first = downloader.process_issue_attachments(sample_issue)
+        second = downloader.process_issue_attachments(
+            sample_issue.model_copy(update={"number": 2}, deep=True)
+        )
+
+        mock_response = Mock()
+        mock_response.headers = {"content-type": "image/png"}
+        mock_response.raise_for_status = Mock()
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_instance.get.return_value = mock_response
+            mock_instance.stream = Mock(
+                return_value=_stream_response(mock_response, b"data")
+            )
+
+            results = await downloader.download_many_issues(
+                [(first, "testorg", "testrepo"), (second, "testorg", "testrepo")],
+                tmp_path,
+            )
+
+        mock_client.assert_called_once()
+        assert [issue.number for issue in results] == [1, 2]
+        assert all(att.downloaded for issue in results for att in issue.attachments)
+        assert (tmp_path / "testorg_testrepo_issue_1").exists()
+        assert (tmp_path / "testorg_testrepo_issue_2").exists()
+
+    @pytest.mark.asyncio
+    async def test_download_many_issues_shares_lookup_limit(
+        self,
+        downloader: AttachmentDownloader,
+        sample_issue: GitHubIssue,
+        tmp_path: Path,
+    ) -> None:
+        """Test that asset-URL lookups are capped across all issues together."""
+        issues = [
+            (
+                downloader.process_issue_attachments(
+                    sample_issue.model_copy(update={"number": number}, deep=True)
+                ),
+                "testorg",
+                "testrepo",
+            )
+            for number in range(1, 11)
+        ]
+
+        mock_response = Mock()
+        mock_response.headers = {"content-type": "image/png"}
+        mock_response.raise_for_status = Mock()
+        active = 0
+        max_active = 0
+
+        async def slow_get(*args: object, **kwargs: object) -> Mock:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return mock_response
+
+        with (
+            patch("httpx.AsyncClient") as mock_client,
+            patch("gh_analysis.github_client.attachments.console"),
+        ):
+            mock_instance = AsyncMock()
+            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_instance.get.side_effect = slow_get
+            mock_instance.stream = Mock(
+                return_value=_stream_response(mock_response, b"data")
+            )
+
+            await downloader.download_many_issues(issues, tmp_path)
+
+        # Two lookups per issue, but never more than the shared limit at once
+        assert mock_instance.get.call_count == 20
+        assert max_active == 8
+
+    @pytest.mark.asyncio
+    async def test_download_issue_attachments_deduplicates_urls(
+        self,
+        downloader: AttachmentDownloader,
+        sample_issue: GitHubIssue,
+        tmp_path: Path,
+    ) -> None:
+        """Test that a URL quoted in several places is downloaded once."""
+        url = "https://user-images.githubusercontent.com/123/screenshot.png"
+        sample_issue.comments[0].body = f"Same here: {url}"
+        issue_with_attachments = downloader.process_issue_attachments(sample_issue)
+
+        mock_response = Mock()
+        mock_response.headers = {"content-type": "image/png"}
+        mock_response.raise_for_status = Mock()
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_instance.get.return_value = mock_response
+            mock_instance.stream = Mock(
+                return_value=_stream_response(mock_response, b"png")
+            )
+
+            result = await downloader.download_issue_attachments(
+                issue_with_attachments, tmp_path, "testorg", "testrepo"
+            )
+
+        mock_instance.stream.assert_called_once()
+        assert [att.source for att in result.attachments] == [
+            "issue_body",
+            "comment_456",
+        ]
+        assert all(att.downloaded for att in result.attachments)
+        assert result.attachments[0].local_path == result.attachments[1].local_path
+
 
 class TestAttachmentRegexPatterns:
     """Test attachment detection regex patterns."""
@@ -1,14 +1,60 @@
 """Tests for GitHub client."""
 
+import io
 import os
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
-from github.GithubException import UnknownObjectException
+from github.GithubException import RateLimitExceededException, UnknownObjectException
 
 from gh_analysis.github_client.client import GitHubClient
-from gh_analysis.github_client.models import GitHubIssue
+from gh_analysis.github_client.models import GitHubIssue, GitHubUser
+
+_REPOSITORY_URL = "https://api.github.com/repos/testorg/testrepo"
+
+
+def _mock_user() -> Mock:
+    """Build a mock PyGitHub user."""
+    mock_user = Mock()
+    mock_user.login = "issueuser"
+    mock_user.id = 11111
+    return mock_user
+
+
+def _mock_comment(
+    comment_id: int, user: Mock, body: str | None = "Test comment"
+) -> Mock:
+    """Build a mock PyGitHub comment by ``user``."""
+    mock_comment = Mock()
+    mock_comment.id = comment_id
+    mock_comment.user = user
+    mock_comment.body = body
+    mock_comment.created_at = datetime(2024, 1, 1)
+    mock_comment.updated_at = datetime(2024, 1, 1)
+    return mock_comment
+
+
+def _mock_issue(
+    number: int, comments: Iterable[Mock] | None = None, **overrides: Any
+) -> Mock:
+    """Build a mock PyGitHub issue; keyword overrides replace its attributes."""
+    mock_issue = Mock()
+    mock_issue.number = number
+    mock_issue.title = f"Issue {number}"
+    mock_issue.body = "Test body"
+    mock_issue.state = "open"
+    mock_issue.labels = []
+    mock_issue.user = _mock_user()
+    mock_issue.created_at = datetime(2024, 1, 1)
+    mock_issue.updated_at = datetime(2024, 1, 1)
+    mock_issue.get_comments.return_value = [] if comments is None else comments
+    mock_issue.repository_url = None
+    for name, value in overrides.items():
+        setattr(mock_issue, name, value)
+    return mock_issue
 
 
 class TestGitHubClient:
@@ -19,13 +65,25 @@ class TestGitHubClient:
         """Test initialization with environment token."""
         with patch("gh_analysis.github_client.client.Github") as mock_github:
             GitHubClient()
-            mock_github.assert_called_once_with("test_token")
+            mock_github.assert_called_once_with(
+                "test_token", per_page=100, pool_size=16
+            )
 
     def test_init_with_explicit_token(self) -> None:
         """Test initialization with explicit token."""
         with patch("gh_analysis.github_client.client.Github") as mock_github:
             GitHubClient(token="explicit_token")
-            mock_github.assert_called_once_with("explicit_token")
+            mock_github.assert_called_once_with(
+                "explicit_token", per_page=100, pool_size=16
+            )
+
+    def test_context_manager_closes_connections(self) -> None:
+        """Test leaving the context closes the PyGitHub connections."""
+        with patch("gh_analysis.github_client.client.Github") as mock_github:
+            with GitHubClient(token="test_token") as client:
+                assert isinstance(client, GitHubClient)
+                mock_github.return_value.close.assert_not_called()
+            mock_github.return_value.close.assert_called_once()
 
     @patch.dict(os.environ, {}, clear=True)
     def test_init_without_token(self) -> None:
@@ -35,21 +93,63 @@ class TestGitHubClient:
 
     @patch("gh_analysis.github_client.client.Github")
     def test_check_rate_limit(self, mock_github_class: Mock) -> None:
-        """Test rate limit checking."""
-        # Mock rate limit response
-        mock_rate_limit = Mock()
-        mock_rate_limit.core.remaining = 50
-        mock_rate_limit.core.reset.timestamp.return_value = 1234567890
+        """Test rate limit checking uses recorded headers, not a request."""
+        mock_github = Mock()
+        mock_github.requester.rate_limiting = (50, 5000)
+        mock_github_class.return_value = mock_github
+
+        client = GitHubClient(token="test_token")
+
+        with patch("time.sleep") as mock_sleep:
+            client._check_rate_limit()
 
+        mock_sleep.assert_not_called()
+        mock_github.get_rate_limit.assert_not_called()
+
+    @patch("gh_analysis.github_client.client.Github")
+    def test_check_rate_limit_sleeps_until_reset(self, mock_github_class: Mock) -> None:
+        """Test a nearly exhausted rate limit waits for the reset time."""
         mock_github = Mock()
-        mock_github.get_rate_limit.return_value = mock_rate_limit
+        mock_github.requester.rate_limiting = (5, 5000)
+        mock_github.requester.rate_limiting_resettime = 1_000_100
         mock_github_class.return_value = mock_github
 
         client = GitHubClient(token="test_token")
 
-        # Should not raise any exceptions
-        client._check_rate_limit()
-        mock_github.get_rate_limit.assert_called()
+        with (
+            patch("time.time", return_value=1_000_000),
+            patch("time.sleep") as mock_sleep,
+        ):
+            client._check_rate_limit()
+
+        mock_sleep.assert_called_once_with(101)
+
+    @patch("gh_analysis.github_client.client.Github")
+    def test_check_rate_limit_tracks_search_separately(
+        self, mock_github_class: Mock
+    ) -> None:
+        """Test a spent search budget only holds up searches."""
+        mock_github = Mock()
+        mock_github_class.return_value = mock_github
+        requester = mock_github.requester
+
+        client = GitHubClient(token="test_token")
+
+        with (
+            patch("time.time", return_value=1_000_000),
+            patch("time.sleep") as mock_sleep,
+        ):
+            requester.rate_limiting = (4000, 5000)
+            requester.rate_limiting_resettime = 1_003_600
+            client._check_rate_limit()
+            # The last response came from the search API
+            requester.rate_limiting = (2, 30)
+            requester.rate_limiting_resettime = 1_000_040
+            client._check_rate_limit()
+            mock_sleep.assert_not_called()
+
+            client._check_rate_limit("search")
+            mock_sleep.assert_called_once_with(41)
 
     @patch("gh_analysis.github_client.client.Github")
     def test_get_repository_success(self, mock_github_class: Mock) -> None:
@@ -160,9 +260,6 @@ class TestGitHubClient:
         mock_comment.created_at = datetime(2024, 1, 1)
         mock_comment.updated_at = datetime(2024, 1, 1)
 
-        mock_repository = Mock()
-        mock_repository.name = "testrepo"
-
         mock_issue = Mock()
         mock_issue.number = 42
         mock_issue.title = "Test Issue"
@@ -173,7 +270,7 @@ class TestGitHubClient:
         mock_issue.created_at = datetime(2024, 1, 1)
         mock_issue.updated_at = datetime(2024, 1, 1)
         mock_issue.get_comments.return_value = [mock_comment]
-        mock_issue.repository = mock_repository
+        mock_issue.repository_url = "https://api.github.com/repos/testorg/testrepo"
 
         mock_repo = Mock()
         mock_repo.get_issue.return_value = mock_issue
@@ -192,6 +289,8 @@ class TestGitHubClient:
         assert result.title == "Test Issue"
         assert len(result.labels) == 1
         assert len(result.comments) == 1
+        assert result.repository_name == "testrepo"
+        mock_github.get_repo.assert_called_once_with("testorg/testrepo", lazy=True)
 
     @patch("gh_analysis.github_client.client.Github")
     def test_search_issues(self, mock_github_class: Mock) -> None:
@@ -201,9 +300,6 @@ class TestGitHubClient:
         mock_user.login = "issueuser"
         mock_user.id = 11111
 
-        mock_repository = Mock()
-        mock_repository.name = "testrepo"
-
         mock_issue = Mock()
         mock_issue.number = 42
         mock_issue.title = "Test Issue"
@@ -214,7 +310,7 @@ class TestGitHubClient:
         mock_issue.created_at = datetime(2024, 1, 1)
         mock_issue.updated_at = datetime(2024, 1, 1)
         mock_issue.get_comments.return_value = []
-        mock_issue.repository = mock_repository
+        mock_issue.repository_url = "https://api.github.com/repos/testorg/testrepo"
 
         mock_github = Mock()
         mock_github.search_issues.return_value = [mock_issue]
@@ -234,3 +330,256 @@ class TestGitHubClient:
         # Verify search query was built correctly
         expected_query = "repo:testorg/testrepo is:issue state:open label:bug"
         mock_github.search_issues.assert_called_once_with(expected_query)
+
+    @patch("gh_analysis.github_client.client.Github")
+    def test_search_issues_converts_concurrently_in_order(
+        self, mock_github_class: Mock
+    ) -> None:
+        """Test that search results keep their order and failures are skipped."""
+        issues = [_mock_issue(number) for number in range(1, 6)]
+        # A user that can't be converted makes the whole issue fail
+        issues[1].user = None
+
+        mock_github = Mock()
+        mock_github.search_issues.return_value = issues
+        mock_github_class.return_value = mock_github
+
+        client = GitHubClient(token="test_token")
+
+        with patch.object(client, "_check_rate_limit"):
+            results = client.search_issues(org="testorg", repo="testrepo", limit=4)
+
+        assert [issue.number for issue in results] == [1, 3, 4]
+        issues[4].get_comments.assert_not_called()
+
+    @patch("gh_analysis.github_client.client.Github")
+    def test_search_issues_resumes_after_rate_limit(
+        self, mock_github_class: Mock
+    ) -> None:
+        """Test a rate-limited search resumes without refetching pages."""
+        pages = [[_mock_issue(1), _mock_issue(2)], [_mock_issue(3), _mock_issue(4)]]
+        fetched_pages: list[int] = []
+
+        class FakePaginatedList:
+            """Caches fetched pages like PyGitHub's PaginatedList."""
+
+            def __init__(self) -> None:
+                self.elements: list[Mock] = []
+                self.limited = True
+
+            def __iter__(self) -> Iterator[Mock]:
+                yield from self.elements
+                while len(fetched_pages) < len(pages):
+                    index = len(fetched_pages)
+                    if index == 1 and self.limited:
+                        self.limited = False
+                        raise RateLimitExceededException(
+                            403, "Rate limit exceeded", {"retry-after": "2"}
+                        )
+                    fetched_pages.append(index)
+                    self.elements.extend(pages[index])
+                    yield from pages[index]
+
+        mock_github = Mock()
+        mock_github.search_issues.return_value = FakePaginatedList()
+        mock_github_class.return_value = mock_github
+
+        client = GitHubClient(token="test_token")
+
+        with (
+            patch.object(client, "_check_rate_limit"),
+            patch("time.sleep") as mock_sleep,
+        ):
+            results = client.search_issues(org="testorg", repo="testrepo", limit=4)
+
+        assert [issue.number for issue in results] == [1, 2, 3, 4]
+        assert fetched_pages == [0, 1]
+        mock_github.search_issues.assert_called_once()
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("gh_analysis.github_client.client.Github")
+    def test_rate_limited_comments_are_retried(self, mock_github_class: Mock) -> None:
+        """Test a rate limit while fetching comments retries that issue."""
+        mock_issue = _mock_issue(1)
+        mock_issue.get_comments.side_effect = [
+            RateLimitExceededException(403, "Rate limit exceeded", {}),
+            [_mock_comment(33333, mock_issue.user)],
+        ]
+
+        mock_github = Mock()
+        mock_github.search_issues.return_value = [mock_issue]
+        mock_github_class.return_value = mock_github
+
+        client = GitHubClient(token="test_token")
+
+        with patch.object(client, "_check_rate_limit"), patch("time.sleep"):
+            results = client.search_issues(org="testorg", repo="testrepo")
+
+        assert [comment.id for comment in results[0].comments] == [33333]
+
+    @patch("gh_analysis.github_client.client.Github")
+    def test_search_issues_streams_to_sink(self, mock_github_class: Mock) -> None:
+        """Test that issues are written to the sink as JSON lines."""
+        mock_github = Mock()
+        mock_github.search_issues.return_value = [_mock_issue(n) for n in (3, 1, 2)]
+        mock_github_class.return_value = mock_github
+
+        client = GitHubClient(token="test_token")
+        sink = io.StringIO()
+
+        with patch.object(client, "_check_rate_limit"):
+            results = client.search_issues(org="testorg", repo="testrepo", sink=sink)
+
+        assert results == []
+        lines = sink.getvalue().splitlines()
+        issues = [GitHubIssue.model_validate_json(line) for line in lines]
+        assert [issue.number for issue in issues] == [3, 1, 2]
+
+    @patch("gh_analysis.github_client.client.Github")
+    def test_get_issue_revalidates_cached_issue(self, mock_github_class: Mock) -> None:
+        """Test a repeated get_issue reuses the cached issue when unchanged."""
+        mock_issue = _mock_issue(42, title="Test Issue", repository_url=_REPOSITORY_URL)
+        # First revalidation is a 304, the second finds a change
+        mock_issue.update.side_effect = [False, True]
+
+        mock_repo = Mock()
+        mock_repo.get_issue.return_value = mock_issue
+
+        mock_github = Mock()
+        mock_github.get_repo.return_value = mock_repo
+        mock_github_class.return_value = mock_github
+
+        client = GitHubClient(token="test_token")
+
+        with patch.object(client, "_check_rate_limit"):
+            first = client.get_issue("testorg", "testrepo", 42)
+            # Changes by the caller don't reach the cached issue
+            first.title = "Edited locally"
+            second = client.get_issue("testorg", "testrepo", 42)
+            mock_issue.title = "Renamed"
+            third = client.get_issue("testorg", "testrepo", 42)
+
+        assert second.title == "Test Issue"
+        assert third.title == "Renamed"
+        mock_repo.get_issue.assert_called_once_with(42)
+        assert mock_issue.get_comments.call_count == 2
+
+    @patch("gh_analysis.github_client.client.Github")
+    def test_get_issue_cache_evicts_least_recently_used(
+        self, mock_github_class: Mock
+    ) -> None:
+        """Test the issue cache keeps only the most recently used issues."""
+        mock_repo = Mock()
+        mock_repo.get_issue.side_effect = lambda number: _mock_issue(
+            number, update=Mock(return_value=False)
+        )
+        mock_github = Mock()
+        mock_github.get_repo.return_value = mock_repo
+        mock_github_class.return_value = mock_github
+
+        client = GitHubClient(token="test_token")
+
+        with (
+            patch.object(client, "_check_rate_limit"),
+            patch("gh_analysis.github_client.client._ISSUE_CACHE_SIZE", 2),
+        ):
+            for number in (1, 2, 1, 3, 1, 2):
+                client.get_issue("testorg", "testrepo", number)
+
+        # 2 was dropped when 3 arrived; 1 stayed in use throughout
+        fetched = [call.args[0] for call in mock_repo.get_issue.call_args_list]
+        assert fetched == [1, 2, 3, 2]
+
+    @patch("gh_analysis.github_client.client.Github")
+    def test_search_issues_caps_comments(self, mock_github_class: Mock) -> None:
+        """Test that comment pagination stops at max_comments."""
+        mock_user = _mock_user()
+        fetched = []
+
+        def comment_pages() -> Iterator[Mock]:
+            for comment_id in range(1, 101):
+                fetched.append(comment_id)
+                yield _mock_comment(comment_id, mock_user, f"Comment {comment_id}")
+
+        mock_issue = _mock_issue(1, user=mock_user, comments=comment_pages())
+
+        mock_github = Mock()
+        mock_github.search_issues.return_value = [mock_issue]
+        mock_github_class.return_value = mock_github
+
+        client = GitHubClient(token="test_token")
+
+        with patch.object(client, "_check_rate_limit"):
+            results = client.search_issues(
+                org="testorg", repo="testrepo", max_comments=3
+            )
+
+        assert [comment.id for comment in results[0].comments] == [1, 2, 3]
+        assert fetched == [1, 2, 3]
+
+    @patch.dict(os.environ, {"GITHUB_SKIP_VALIDATION": "1"})
+    @patch("gh_analysis.github_client.client.Github")
+    def test_convert_issue_without_validation(self, mock_github_class: Mock) -> None:
+        """Test models are constructed unvalidated when opted in."""
+        mock_user = _mock_user()
+        # Validation would reject a missing comment body
+        mock_comment = _mock_comment(33333, mock_user, body=None)
+        mock_issue = _mock_issue(42, user=mock_user, comments=[mock_comment])
+
+        client = GitHubClient(token="test_token")
+        result = client._convert_issue(mock_issue)
+
+        assert isinstance(result, GitHubIssue)
+        assert result.comments[0].body is None
+        assert result.attachments == []
+
+    @patch("gh_analysis.github_client.client.Github")
+    def test_users_and_labels_are_shared(self, mock_github_class: Mock) -> None:
+        """Test repeated users and labels convert to the same model objects."""
+        mock_user = _mock_user()
+
+        mock_label = Mock()
+        mock_label.name = "bug"
+        mock_label.color = "ff0000"
+        mock_label.description = "Bug reports"
+
+        def make_issue(number: int) -> Mock:
+            return _mock_issue(
+                number,
+                labels=[mock_label],
+                user=mock_user,
+                comments=[_mock_comment(number, mock_user)],
+            )
+
+        client = GitHubClient(token="test_token")
+        first = client._convert_issue(make_issue(1))
+        second = client._convert_issue(make_issue(2))
+
+        assert first.user is second.user is second.comments[0].user
+        assert first.labels[0] is second.labels[0]
+        assert first.user == GitHubUser(login="issueuser", id=11111)
+
+    @patch("gh_analysis.github_client.client.Github")
+    def test_get_issues_batch(self, mock_github_class: Mock) -> None:
+        """Test batch retrieval looks up the repository once and keeps order."""
+
+        def get_issue(number: int) -> Mock:
+            if number == 2:
+                raise UnknownObjectException(404, "Not Found", None)
+            return _mock_issue(number, repository_url=_REPOSITORY_URL)
+
+        mock_repo = Mock()
+        mock_repo.get_issue.side_effect = get_issue
+
+        mock_github = Mock()
+        mock_github.get_repo.return_value = mock_repo
+        mock_github_class.return_value = mock_github
+
+        client = GitHubClient(token="test_token")
+
+        with patch.object(client, "_check_rate_limit"):
+            results = client.get_issues_batch("testorg", "testrepo", [3, 1, 3, 2])
+
+        assert [issue.number for issue in results] == [3, 1]
+        mock_github.get_repo.assert_called_once_with("testorg/testrepo", lazy=True)
+        assert mock_repo.get_issue.call_count == 3
@@ -16,10 +16,8 @@ def mock_github() -> Generator[MagicMock]:
         mock_github = MagicMock()
         mock_github_class.return_value = mock_github
 
-        # Mock rate limit
-        mock_rate_limit = MagicMock()
-        mock_rate_limit.core.remaining = 1000
-        mock_github.get_rate_limit.return_value = mock_rate_limit
+        # Rate limit recorded from the last response
+        mock_github.requester.rate_limiting = (1000, 5000)
 
         yield mock_github
 
@@ -85,9 +83,44 @@ class TestGitHubClientLabelUpdates:
             )
 
         assert result is True
-        mock_sleep.assert_called_with(60)
+        mock_sleep.assert_called_once()
         assert mock_repo.get_issue.call_count == 2
 
+    def test_update_issue_labels_honors_retry_after(
+        self, github_client: GitHubClient, mock_github: MagicMock
+    ) -> None:
+        """Test the Retry-After header sets the wait before retrying."""
+        mock_repo = MagicMock()
+        mock_github.get_repo.return_value = mock_repo
+        mock_repo.get_issue.side_effect = [
+            RateLimitExceededException(
+                403, "Secondary rate limit", {"retry-after": "7"}
+            ),
+            MagicMock(),
+        ]
+
+        with patch("time.sleep") as mock_sleep:
+            github_client.update_issue_labels("test-org", "test-repo", 123, ["bug"])
+
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_update_issue_labels_rate_limit_retries_exhausted(
+        self, github_client: GitHubClient, mock_github: MagicMock
+    ) -> None:
+        """Test a persistent rate limit is raised after bounded retries."""
+        mock_repo = MagicMock()
+        mock_github.get_repo.return_value = mock_repo
+        mock_repo.get_issue.side_effect = RateLimitExceededException(
+            403, "Rate limit exceeded", {}
+        )
+
+        with patch("time.sleep") as mock_sleep:
+            with pytest.raises(RateLimitExceededException):
+                github_client.update_issue_labels("test-org", "test-repo", 123, ["bug"])
+
+        assert mock_sleep.call_count == 5
+        assert mock_repo.get_issue.call_count == 6
+
     def test_add_issue_comment_success(
         self, github_client: GitHubClient, mock_github: MagicMock
     ) -> None:
@@ -137,7 +170,7 @@ class TestGitHubClientLabelUpdates:
             )
 
         assert result is True
-        mock_sleep.assert_called_with(60)
+        mock_sleep.assert_called_once()
 
     def test_get_issue_labels_success(
         self, github_client: GitHubClient, mock_github: MagicMock
@@ -190,7 +223,7 @@ class TestGitHubClientLabelUpdates:
             labels = github_client.get_issue_labels("test-org", "test-repo", 123)
 
         assert labels == []
-        mock_sleep.assert_called_with(60)
+        mock_sleep.assert_called_once()
 
     def test_repository_not_found(
         self, github_client: GitHubClient, mock_github: MagicMock
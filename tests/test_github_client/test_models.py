@@ -32,6 +32,12 @@ class TestGitHubUser:
         with pytest.raises(ValidationError):
             GitHubUser(id=12345)  # type: ignore[call-arg]
 
+    def test_user_is_frozen(self) -> None:
+        """Test that shared user instances cannot be modified."""
+        user = GitHubUser(login="testuser", id=12345)
+        with pytest.raises(ValidationError):
+            user.login = "other"  # type: ignore[misc]
+
 
 class TestGitHubLabel:
     """Test GitHubLabel model."""
@@ -55,6 +61,12 @@ class TestGitHubLabel:
         with pytest.raises(ValidationError):
             GitHubLabel(name="bug")  # type: ignore[call-arg]
 
+    def test_label_is_frozen(self) -> None:
+        """Test that shared label instances cannot be modified."""
+        label = GitHubLabel(name="bug", color="ff0000")
+        with pytest.raises(ValidationError):
+            label.name = "feature"  # type: ignore[misc]
+
 
 class TestGitHubComment:
     """Test GitHubComment model."""
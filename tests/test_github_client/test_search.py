@@ -6,6 +6,7 @@ from gh_analysis.github_client.client import GitHubClient
 from gh_analysis.github_client.models import GitHubIssue
 from gh_analysis.github_client.search import (
     GitHubSearcher,
+    _build_query,
     build_exclusion_list,
     build_github_query,
     build_organization_query,
@@ -86,6 +87,21 @@ class TestGitHubSearcher:
         assert result == mock_issue
         mock_client.get_issue.assert_called_once_with("testorg", "testrepo", 42)
 
+    def test_get_issues_batch(self) -> None:
+        """Test getting several issues from one repository."""
+        mock_client = Mock(spec=GitHubClient)
+        mock_issues = [Mock(spec=GitHubIssue), Mock(spec=GitHubIssue)]
+        mock_client.get_issues_batch.return_value = mock_issues
+
+        searcher = GitHubSearcher(mock_client)
+
+        result = searcher.get_issues_batch("testorg", "testrepo", [1, 2])
+
+        assert result == mock_issues
+        mock_client.get_issues_batch.assert_called_once_with(
+            "testorg", "testrepo", [1, 2]
+        )
+
 
 class TestBuildGitHubQuery:
     """Test build_github_query function."""
@@ -151,6 +167,16 @@ class TestBuildGitHubQuery:
         expected = "repo:test-org/test-repo is:issue state:open label:bug"
         assert query == expected
 
+    def test_repeated_query_is_cached(self) -> None:
+        """Test identical queries built from fresh lists reuse the cached result."""
+        _build_query.cache_clear()
+
+        first = build_github_query("test-org", "test-repo", labels=["bug", "ui"])
+        second = build_github_query("test-org", "test-repo", labels=["bug", "ui"])
+
+        assert first == second
+        assert _build_query.cache_info().hits == 1
+
     def test_search_organization_issues_with_exclusions(self) -> None:
         """Test searching organization issues with exclusions."""
         mock_client = Mock(spec=GitHubClient)
@@ -247,6 +273,11 @@ class TestBuildExclusionList:
         result = build_exclusion_list(None, " repo1 , repo2 , repo3 ")
         assert sorted(result) == ["repo1", "repo2", "repo3"]
 
+    def test_order_preserved(self) -> None:
+        """Test that repositories keep their first-seen order."""
+        result = build_exclusion_list(["zeta", "alpha"], "mid,zeta,beta")
+        assert result == ["zeta", "alpha", "mid", "beta"]
+
     def test_empty_lists(self) -> None:
         """Test with empty lists."""
         result = build_exclusion_list([], "")
@@ -2,9 +2,11 @@
 
 import json
 import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 from gh_analysis.ai.models import (
     LabelAssessment,
@@ -12,7 +14,10 @@ from gh_analysis.ai.models import (
     ProductLabelingResponse,
     RecommendedLabel,
 )
-from gh_analysis.recommendation.manager import RecommendationManager
+from gh_analysis.recommendation.manager import (
+    _RESULT_FILE_ADAPTER,
+    RecommendationManager,
+)
 from gh_analysis.recommendation.models import RecommendationStatus
 
 
@@ -236,6 +241,19 @@ class TestRecommendationManager:
                 is True
             )
 
+            # Bulk index agrees with the per-issue decision
+            assert manager.load_reviewed_index() == {
+                ("org", "repo", 2),
+                ("org", "repo", 3),
+                ("org", "repo", 4),
+            }
+            assert manager.load_reviewed_index("org", "repo") == {
+                ("org", "repo", 2),
+                ("org", "repo", 3),
+                ("org", "repo", 4),
+            }
+            assert manager.load_reviewed_index("other") == set()
+
     def test_recommendation_summary_statistics(self):
         """Test summary statistics generation."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -343,8 +361,15 @@ class TestRecommendationManager:
             assert len(recs2) == 1
             assert recs2[0].status == RecommendationStatus.APPROVED
 
-            # Third discovery with force_refresh - should recreate
-            recs3 = manager.discover_recommendations(force_refresh=True)
+            # Third discovery with force_refresh - should recreate, checking
+            # for a label change only once
+            with patch.object(
+                manager,
+                "is_recommendation_change",
+                wraps=manager.is_recommendation_change,
+            ) as mock_change:
+                recs3 = manager.discover_recommendations(force_refresh=True)
+            assert mock_change.call_count == 1
             assert len(recs3) == 1
             # Status should be reset to PENDING since it's recreated from AI result
             assert recs3[0].status == RecommendationStatus.PENDING
@@ -596,3 +621,114 @@ class TestRecommendationManager:
                 "type::bug",
             ]
             assert rec.recommended_labels == ["product::kots", "product::troubleshoot"]
+
+    def test_current_labels_from_unwrapped_issue_file(self):
+        """Test labels are read from issue files without an 'issue' wrapper."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = RecommendationManager(Path(temp_dir))
+
+            issue_file = Path(temp_dir) / "org_repo_issue_7.json"
+            with open(issue_file, "w") as f:
+                json.dump(
+                    {
+                        "number": 7,
+                        "body": "Long body " * 100,
+                        "comments": [{"body": "A comment"}],
+                        "labels": [{"name": "product::kots"}, {"name": "type::bug"}],
+                    },
+                    f,
+                )
+
+            ai_analysis = _RESULT_FILE_ADAPTER.validate_python(
+                self.create_mock_ai_result("org", "repo", 7)
+            )["analysis"]
+            rec = manager._create_recommendation_metadata(
+                "org", "repo", 7, ai_analysis, "result.json", str(issue_file)
+            )
+
+            assert rec.current_labels == ["product::kots", "type::bug"]
+
+    def test_analysis_defaults_and_unused_fields(self):
+        """Test results missing defaulted fields build the same metadata."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = RecommendationManager(Path(temp_dir))
+
+            result = self.create_mock_ai_result("org", "repo", 7)
+            analysis = result["analysis"]
+            del analysis["root_cause_analysis"], analysis["root_cause_confidence"]
+            analysis["images_analyzed"] = [{"unexpected": "shape"}]
+
+            ai_analysis = _RESULT_FILE_ADAPTER.validate_json(json.dumps(result))[
+                "analysis"
+            ]
+            rec = manager._create_recommendation_metadata(
+                "org", "repo", 7, ai_analysis, "result.json", "missing.json"
+            )
+
+            assert rec.root_cause_analysis is None
+            assert rec.root_cause_confidence is None
+            assert rec.recommended_labels == ["product::kots", "product::troubleshoot"]
+            assert rec.labels_to_remove == ["product::vendor"]
+
+    def test_discover_repository_with_underscores(self):
+        """Test result filenames for repositories with underscores."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = Path(temp_dir)
+            results_dir = data_dir / "results"
+            issues_dir = data_dir / "issues"
+            results_dir.mkdir(parents=True)
+            issues_dir.mkdir(parents=True)
+
+            manager = RecommendationManager(data_dir)
+
+            result_file = results_dir / "org_my_repo_issue_5_product-labeling.json"
+            with open(result_file, "w") as f:
+                json.dump(self.create_mock_ai_result("org", "my_repo", 5), f)
+            issue_file = issues_dir / "org_my_repo_issue_5.json"
+            with open(issue_file, "w") as f:
+                json.dump(self.create_mock_issue("org", "my_repo", 5), f)
+
+            first = manager.discover_recommendations()
+            assert [(rec.org, rec.repo, rec.issue_number) for rec in first] == [
+                ("org", "my_repo", 5)
+            ]
+
+            # The saved status is found on the next discovery
+            assert manager.status_tracker.index() == {("org", "my_repo", 5): first[0]}
+            assert manager.discover_recommendations() == first
+
+    def test_discover_saves_from_calling_thread(self):
+        """Test status saves, and the tracker's cache, stay off the pool."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = Path(temp_dir)
+            results_dir = data_dir / "results"
+            issues_dir = data_dir / "issues"
+            results_dir.mkdir(parents=True)
+            issues_dir.mkdir(parents=True)
+
+            manager = RecommendationManager(data_dir)
+
+            for issue_num in range(8):
+                result_file = results_dir / (
+                    f"org_repo_issue_{issue_num}_product-labeling.json"
+                )
+                with open(result_file, "w") as f:
+                    json.dump(self.create_mock_ai_result("org", "repo", issue_num), f)
+                issue_file = issues_dir / f"org_repo_issue_{issue_num}.json"
+                with open(issue_file, "w") as f:
+                    json.dump(self.create_mock_issue("org", "repo", issue_num), f)
+
+            tracker = manager.status_tracker
+            saving_threads = []
+
+            def save(recommendation: Any) -> None:
+                saving_threads.append(threading.current_thread())
+                original_save(recommendation)
+
+            original_save = tracker.save_recommendation
+            with patch.object(tracker, "save_recommendation", side_effect=save):
+                recommendations = manager.discover_recommendations()
+
+            assert len(recommendations) == 8
+            assert saving_threads == [threading.current_thread()] * 8
+            assert len(tracker.index()) == 8
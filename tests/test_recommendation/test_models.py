@@ -6,6 +6,7 @@ from gh_analysis.recommendation.models import (
     RecommendationFilter,
     RecommendationMetadata,
     RecommendationStatus,
+    RecommendationView,
     ReviewAction,
 )
 
@@ -47,6 +48,36 @@ class TestRecommendationModels:
         assert metadata.review_notes is None
         assert metadata.modified_labels is None
 
+    def test_recommendation_view_from_metadata(self):
+        """Test RecommendationView copies filter fields and derived values."""
+        metadata = RecommendationMetadata(
+            org="test-org",
+            repo="test-repo",
+            issue_number=123,
+            original_confidence=0.75,
+            ai_reasoning="About KOTS Installation",
+            recommended_labels=["type::bug", "product::kots"],
+            labels_to_remove=[],
+            status_updated_at=datetime.now(),
+            review_confidence=0.95,
+            review_notes="Confirmed BY reviewer",
+            ai_result_file="/path/to/result.json",
+            issue_file="/path/to/issue.json",
+        )
+
+        view = RecommendationView.from_metadata(metadata)
+
+        assert (view.org, view.repo, view.issue_number) == (
+            "test-org",
+            "test-repo",
+            123,
+        )
+        assert view.status == RecommendationStatus.PENDING
+        assert view.confidence_tier == "high"
+        assert view.primary_product == "product::kots"
+        assert view.search_text == "about kots installation confirmed by reviewer"
+        assert not hasattr(view, "__dict__")
+
     def test_recommendation_filter_validation(self):
         """Test RecommendationFilter model with various filter combinations."""
         # Test valid filter combinations
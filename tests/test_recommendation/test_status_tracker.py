@@ -1,15 +1,20 @@
 """Test recommendation status tracking and persistence."""
 
+import json
+import os
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
 from gh_analysis.recommendation.models import (
     RecommendationFilter,
     RecommendationMetadata,
     RecommendationStatus,
+    RecommendationView,
 )
-from gh_analysis.recommendation.status_tracker import StatusTracker
+from gh_analysis.recommendation.status_tracker import _CRITERIA, StatusTracker
 
 
 class TestStatusTracker:
@@ -127,6 +132,16 @@ class TestStatusTracker:
                 rec.status == RecommendationStatus.PENDING for rec in status_results
             )
 
+            # Test excluded statuses are dropped
+            exclude_filter = RecommendationFilter(
+                exclude_status=[RecommendationStatus.PENDING]
+            )
+            exclude_results = tracker.query_recommendations(exclude_filter)
+            assert len(exclude_results) == 2
+            assert all(
+                rec.status != RecommendationStatus.PENDING for rec in exclude_results
+            )
+
             # Test confidence range filter
             conf_filter = RecommendationFilter(min_confidence=0.8, max_confidence=0.9)
             conf_results = tracker.query_recommendations(conf_filter)
@@ -320,3 +335,374 @@ class TestStatusTracker:
             reviewed_results = tracker.query_recommendations(reviewed_filter)
             assert len(reviewed_results) == 1
             assert reviewed_results[0].issue_number == 2
+
+    def test_unchanged_files_are_not_reparsed(self):
+        """Test cached recommendations are reused until their file changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = StatusTracker(Path(temp_dir))
+
+            metadata = RecommendationMetadata(
+                org="test-org",
+                repo="test-repo",
+                issue_number=1,
+                original_confidence=0.8,
+                ai_reasoning="Cached",
+                recommended_labels=["product::kots"],
+                labels_to_remove=[],
+                status=RecommendationStatus.PENDING,
+                status_updated_at=datetime.now(),
+                ai_result_file="result.json",
+                issue_file="issue.json",
+            )
+            tracker.save_recommendation(metadata)
+
+            with patch.object(
+                RecommendationMetadata,
+                "model_validate_json",
+                wraps=RecommendationMetadata.model_validate_json,
+            ) as mock_validate:
+                first = tracker.get_all_recommendations()
+                # Changes to a returned copy don't reach the cache
+                first[0].status = RecommendationStatus.APPROVED
+                second = tracker.get_all_recommendations()
+                assert mock_validate.call_count == 0
+
+                # Another writer changes the file on disk
+                status_file = Path(temp_dir) / "test-org_test-repo_issue_1_status.json"
+                data = json.loads(status_file.read_text())
+                data["ai_reasoning"] = "Edited elsewhere"
+                status_file.write_text(json.dumps(data))
+                stat = status_file.stat()
+                os.utime(status_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+                third = tracker.get_all_recommendations()
+                assert mock_validate.call_count == 1
+
+            assert second[0].status == RecommendationStatus.PENDING
+            assert third[0].ai_reasoning == "Edited elsewhere"
+
+            # Removed files disappear from results
+            status_file.unlink()
+            assert tracker.get_all_recommendations() == []
+            assert tracker.get_recommendation("test-org", "test-repo", 1) is None
+
+    def test_org_filter_skips_other_files(self):
+        """Test that org and repo filters only load matching status files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = StatusTracker(Path(temp_dir))
+
+            for org, repo in [("org1", "repo1"), ("org1", "repo2"), ("org2", "repo1")]:
+                tracker.save_recommendation(
+                    RecommendationMetadata(
+                        org=org,
+                        repo=repo,
+                        issue_number=1,
+                        original_confidence=0.8,
+                        ai_reasoning="Reasoning",
+                        recommended_labels=["product::kots"],
+                        labels_to_remove=[],
+                        status=RecommendationStatus.PENDING,
+                        status_updated_at=datetime.now(),
+                        ai_result_file="result.json",
+                        issue_file="issue.json",
+                    )
+                )
+
+            # A status file for another org that is not even valid JSON
+            (Path(temp_dir) / "org3_repo1_issue_1_status.json").write_text("{")
+
+            with patch("builtins.print") as mock_print:
+                org_results = tracker.query_recommendations(
+                    RecommendationFilter(org="org1")
+                )
+                repo_results = tracker.query_recommendations(
+                    RecommendationFilter(org="org1", repo="repo2")
+                )
+
+            mock_print.assert_not_called()
+            assert {rec.repo for rec in org_results} == {"repo1", "repo2"}
+            assert [(rec.org, rec.repo) for rec in repo_results] == [("org1", "repo2")]
+
+    def test_paged_query_only_parses_returned_page(self):
+        """Test that a small page only parses the files it returns."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            writer = StatusTracker(Path(temp_dir))
+            for issue_number in (10, 2, 1, 3):
+                writer.save_recommendation(
+                    RecommendationMetadata(
+                        org="test-org",
+                        repo="test-repo",
+                        issue_number=issue_number,
+                        original_confidence=0.8,
+                        ai_reasoning="Reasoning",
+                        recommended_labels=["product::kots"],
+                        labels_to_remove=[],
+                        status=RecommendationStatus.PENDING,
+                        status_updated_at=datetime.now(),
+                        ai_result_file="result.json",
+                        issue_file="issue.json",
+                    )
+                )
+
+            # A fresh tracker has nothing cached in memory, but shares the
+            # writer's index
+            tracker = StatusTracker(Path(temp_dir))
+            with patch.object(
+                RecommendationMetadata,
+                "model_validate_json",
+                wraps=RecommendationMetadata.model_validate_json,
+            ) as mock_validate:
+                page = tracker.query_recommendations(
+                    RecommendationFilter(offset=1, limit=2)
+                )
+
+            assert [rec.issue_number for rec in page] == [2, 3]
+            assert mock_validate.call_count == 2
+
+            # Without the index, reading still stops once the page is full
+            tracker = StatusTracker(Path(temp_dir))
+            with (
+                patch.object(tracker, "_open_index", return_value=None),
+                patch.object(
+                    RecommendationMetadata,
+                    "model_validate_json",
+                    wraps=RecommendationMetadata.model_validate_json,
+                ) as mock_validate,
+            ):
+                page = tracker.query_recommendations(
+                    RecommendationFilter(offset=1, limit=2)
+                )
+
+            assert [rec.issue_number for rec in page] == [2, 3]
+            assert mock_validate.call_count == 3
+
+    def test_views_come_from_index_and_follow_file_changes(self):
+        """Test views are read from the index and rebuilt when files change."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = StatusTracker(Path(temp_dir))
+            metadata = RecommendationMetadata(
+                org="test-org",
+                repo="test-repo",
+                issue_number=1,
+                original_confidence=0.8,
+                ai_reasoning="Reasoning",
+                recommended_labels=["product::kots"],
+                labels_to_remove=[],
+                status=RecommendationStatus.PENDING,
+                status_updated_at=datetime.now(),
+                ai_result_file="result.json",
+                issue_file="issue.json",
+            )
+            tracker.save_recommendation(metadata)
+
+            # A fresh tracker builds views without parsing any status file
+            reader = StatusTracker(Path(temp_dir))
+            with patch.object(
+                RecommendationMetadata, "model_validate_json"
+            ) as mock_validate:
+                [view] = reader.iter_views()
+            mock_validate.assert_not_called()
+            assert view == RecommendationView.from_metadata(metadata)
+            assert view.confidence_tier == "medium"
+
+            # Another writer changes the file on disk
+            status_file = Path(temp_dir) / "test-org_test-repo_issue_1_status.json"
+            data = json.loads(status_file.read_text())
+            data["status"] = "approved"
+            status_file.write_text(json.dumps(data))
+            stat = status_file.stat()
+            os.utime(status_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+            [updated] = reader.iter_views()
+            assert updated.status == RecommendationStatus.APPROVED
+
+            status_file.unlink()
+            assert list(reader.iter_views()) == []
+
+    def test_index_is_created_when_needed(self):
+        """Test the index file is only created once there is something in it."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = StatusTracker(Path(temp_dir))
+            index_file = Path(temp_dir) / ".status_index.sqlite"
+
+            assert tracker.query_recommendations(RecommendationFilter()) == []
+            assert list(tracker.iter_views()) == []
+            assert not index_file.exists()
+
+            tracker.save_recommendation(
+                RecommendationMetadata(
+                    org="test-org",
+                    repo="test-repo",
+                    issue_number=1,
+                    original_confidence=0.8,
+                    ai_reasoning="Reasoning",
+                    recommended_labels=["product::kots"],
+                    labels_to_remove=[],
+                    status_updated_at=datetime.now(),
+                    ai_result_file="result.json",
+                    issue_file="issue.json",
+                )
+            )
+            assert index_file.exists()
+
+    def test_batched_saves_write_the_index_once(self):
+        """Test saves inside batched_saves reach the index in one write."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = StatusTracker(Path(temp_dir))
+
+            with patch.object(
+                tracker, "_update_index", wraps=tracker._update_index
+            ) as mock_update:
+                with tracker.batched_saves():
+                    for i in range(5):
+                        tracker.save_recommendation(
+                            RecommendationMetadata(
+                                org="test-org",
+                                repo="test-repo",
+                                issue_number=i,
+                                original_confidence=0.8,
+                                ai_reasoning="Reasoning",
+                                recommended_labels=["product::kots"],
+                                labels_to_remove=[],
+                                status_updated_at=datetime.now(),
+                                ai_result_file="result.json",
+                                issue_file="issue.json",
+                            )
+                        )
+                    mock_update.assert_not_called()
+
+            mock_update.assert_called_once()
+            assert len(mock_update.call_args.args[0]) == 5
+
+            # A fresh tracker finds every save in the index
+            reader = StatusTracker(Path(temp_dir))
+            with patch.object(
+                RecommendationMetadata, "model_validate_json"
+            ) as mock_validate:
+                views = list(reader.iter_views())
+            mock_validate.assert_not_called()
+            assert sorted(view.issue_number for view in views) == [0, 1, 2, 3, 4]
+
+    def test_index_queries_match_file_scan(self):
+        """Test filters pushed into the index select the same recommendations."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = StatusTracker(Path(temp_dir))
+            base_time = datetime(2024, 1, 1, 12, 0, 0)
+
+            for i in range(12):
+                tracker.save_recommendation(
+                    RecommendationMetadata(
+                        org=f"org{i % 2}",
+                        repo=f"repo{i % 3}",
+                        issue_number=i,
+                        original_confidence=0.6 + 0.03 * i,
+                        review_confidence=0.95 if i % 4 == 0 else None,
+                        ai_reasoning=f"Reasoning about KOTS {i}",
+                        review_notes="Checked by Reviewer" if i % 5 == 0 else None,
+                        recommended_labels=[f"product::p{i % 3}"] if i % 6 else [],
+                        labels_to_remove=[],
+                        status=list(RecommendationStatus)[i % 4],
+                        status_updated_at=base_time + timedelta(hours=i),
+                        reviewed_at=base_time + timedelta(days=i) if i % 2 else None,
+                        ai_result_file="result.json",
+                        issue_file="issue.json",
+                    )
+                )
+
+            # A status file with an unexpected name still takes part
+            (Path(temp_dir) / "legacy_status.json").write_text(
+                (Path(temp_dir) / "org0_repo0_issue_0_status.json").read_text()
+            )
+
+            filters = [
+                RecommendationFilter(),
+                RecommendationFilter(org="org1"),
+                RecommendationFilter(org="org0", repo="repo2"),
+                RecommendationFilter(
+                    status=[RecommendationStatus.PENDING, RecommendationStatus.APPROVED]
+                ),
+                RecommendationFilter(exclude_status=[RecommendationStatus.PENDING]),
+                RecommendationFilter(min_confidence=0.8, max_confidence=0.9),
+                RecommendationFilter(confidence_tier=["high"]),
+                RecommendationFilter(product=["product::p1", "product::p2"]),
+                RecommendationFilter(
+                    created_after=base_time + timedelta(hours=3),
+                    created_before=base_time + timedelta(hours=9),
+                ),
+                RecommendationFilter(reviewed_after=base_time + timedelta(days=4)),
+                RecommendationFilter(reviewed_before=base_time + timedelta(days=4)),
+                RecommendationFilter(search_text="kots 1"),
+                RecommendationFilter(search_text="BY REVIEWER"),
+                RecommendationFilter(offset=3, limit=4),
+                RecommendationFilter(org="org1", offset=2),
+            ]
+
+            scanner = StatusTracker(Path(temp_dir))
+            with patch.object(scanner, "_open_index", return_value=None):
+                for filter in filters:
+                    indexed = tracker.query_recommendations(filter)
+                    scanned = scanner.query_recommendations(filter)
+                    assert indexed == scanned, filter
+
+                assert list(tracker.iter_views()) == list(scanner.iter_views())
+
+    def test_every_filter_field_matches_in_index_and_file_scan(self):
+        """Test each filter field selects the same recommendations either way."""
+        base_time = datetime(2024, 1, 1, 12, 0, 0)
+        samples: dict[str, list[Any]] = {
+            "org": ["org1"],
+            "repo": ["repo2"],
+            "status": [[RecommendationStatus.APPROVED]],
+            "exclude_status": [[RecommendationStatus.PENDING]],
+            "min_confidence": [0.75],
+            "max_confidence": [0.75],
+            "confidence_tier": [["high", "low"]],
+            "product": [["product::p1"]],
+            "created_after": [base_time + timedelta(hours=4)],
+            "created_before": [base_time + timedelta(hours=4)],
+            "reviewed_after": [base_time + timedelta(days=3)],
+            "reviewed_before": [base_time + timedelta(days=3)],
+            "search_text": ["KOTS 3", "reviewer"],
+            "limit": [2],
+            "offset": [5],
+        }
+        # A new filter field needs a criterion and a sample here
+        assert samples.keys() == RecommendationFilter.model_fields.keys()
+        assert {criterion.field for criterion in _CRITERIA} == samples.keys() - {
+            "limit",
+            "offset",
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = StatusTracker(Path(temp_dir))
+            for i in range(10):
+                tracker.save_recommendation(
+                    RecommendationMetadata(
+                        org=f"org{i % 2}",
+                        repo=f"repo{i % 3}",
+                        issue_number=i,
+                        original_confidence=0.55 + 0.05 * i,
+                        review_confidence=0.95 if i % 4 == 0 else None,
+                        ai_reasoning=f"Reasoning about KOTS {i}",
+                        review_notes="Checked by Reviewer" if i % 3 == 0 else None,
+                        recommended_labels=[f"product::p{i % 3}"] if i % 5 else [],
+                        labels_to_remove=[],
+                        status=list(RecommendationStatus)[i % 4],
+                        status_updated_at=base_time + timedelta(hours=i),
+                        reviewed_at=base_time + timedelta(days=i) if i % 2 else None,
+                        ai_result_file="result.json",
+                        issue_file="issue.json",
+                    )
+                )
+
+            scanner = StatusTracker(Path(temp_dir))
+            with patch.object(scanner, "_open_index", return_value=None):
+                for field, values in samples.items():
+                    for value in values:
+                        filter = RecommendationFilter.model_validate({field: value})
+                        indexed = tracker.query_recommendations(filter)
+                        scanned = scanner.query_recommendations(filter)
+                        assert indexed == scanned, filter
+                        if field not in ("limit", "offset"):
+                            # Each sample keeps some recommendations, not all
+                            assert 0 < len(indexed) < 10, filter